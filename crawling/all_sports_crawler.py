@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+날짜별 전 종목 한 번에 크롤링
+- KBO / 배구 / EPL 일정 페이지를 크롬 드라이버 하나로 차례로 열어 종목별 추출기로 파싱
+- 결과는 종목 태그가 붙은 하나의 JSONL 배치로 저장
+- --import 지정 시 종목별로 DB와 대조해 추가는 테이블당 한 번, 수정은 같은 변경끼리 묶어 반영
+
+사용법:
+    python all_sports_crawler.py 2025-09-23 [--sports kbo volleyball epl] [--output batch.jsonl]
+    python all_sports_crawler.py 2025-09-23 --import [--dry-run] [--settle]
+"""
+
+from datetime import datetime
+from typing import List, Dict, Any, Optional
+
+from instrumentation import span
+from jsonl_report import JsonlReportWriter, read_jsonl
+from profiling import profiled
+from sport_registry import NATURAL_KEY, COMPARE_FIELDS, get_sport, load_crawler
+
+DEFAULT_SPORTS = ('kbo', 'volleyball', 'epl')
+
+def crawl_all_sports(date: str, sports: List[str] = DEFAULT_SPORTS, session=None) -> Dict[str, Optional[List[Dict[str, Any]]]]:
+    """
+    한 날짜의 여러 종목을 드라이버 하나로 크롤링
+
+    Returns:
+        종목별 경기 목록 (크롤링 실패한 종목은 None)
+    """
+    from browser_session import BrowserSession
+    
+    own_session = session is None
+    session = session or BrowserSession()
+    results: Dict[str, Optional[List[Dict[str, Any]]]] = {}
+    
+    print(f"🏟️ {date} 전 종목 크롤링: {', '.join(sports)}")
+    print("=" * 60)
+    
+    try:
+        for sport in sports:
+            try:
+                games = load_crawler(sport)(date, driver=session.acquire(sport))
+                # 크롤러는 오류 시 None을 반환, 빈 목록이면 드라이버 상태로 실패 여부 판단
+                if games is None:
+                    raise RuntimeError('크롤링 실패')
+                if not games and not session.is_alive():
+                    session.reset()
+                    raise RuntimeError('드라이버 응답 없음')
+                results[sport] = games
+            except Exception as e:
+                print(f"❌ {get_sport(sport)['name']} {date} 크롤링 실패: {e}")
+                session.reset()
+                results[sport] = None
+    finally:
+        if own_session:
+            session.close()
+    
+    summary = ', '.join(f"{sport} {len(games) if games is not None else '실패'}" for sport, games in results.items())
+    print(f"\n📊 {date} 크롤링 결과: {summary}")
+    return results
+
+def write_combined_batch(date: str, results: Dict[str, Optional[List[Dict[str, Any]]]], path: str) -> str:
+    """종목별 결과를 하나의 JSONL 배치로 저장 (game 레코드마다 sport 태그)"""
+    with JsonlReportWriter(path, 'all_sports_batch', flush_every=100, date=date, sports=list(results)) as report:
+        for sport, games in results.items():
+            if games is None:
+                report.issue('크롤링 실패', sport=sport)
+                continue
+            for game in games:
+                report.game(game, sport=sport)
+        report.close({
+            'game_counts': {sport: len(games) for sport, games in results.items() if games is not None},
+            'failed_sports': [sport for sport, games in results.items() if games is None]
+        })
+    
+    print(f"💾 통합 배치 저장: {path}")
+    return path
+
+def read_combined_batch(path: str) -> Dict[str, Any]:
+    """통합 배치 파일 읽기 → (날짜, 종목별 경기 목록)"""
+    date = None
+    results: Dict[str, Optional[List[Dict[str, Any]]]] = {}
+    for record in read_jsonl(path):
+        if record['type'] == 'header':
+            date = record['date']
+            results = {sport: [] for sport in record['sports']}
+        elif record['type'] == 'game':
+            results[record['sport']].append(record['game'])
+        elif record['type'] == 'issue':
+            results[record['sport']] = None
+    return {'date': date, 'results': results}
+
+def import_combined_batch(client, date: str, results: Dict[str, Optional[List[Dict[str, Any]]]],
+                          dry_run: bool = False, settle: bool = False) -> Dict[str, Dict[str, int]]:
+    """
+    종목별로 DB와 대조해 반영
+
+    추가는 종목(테이블)당 insert 한 번, 수정은 같은 변경 내용끼리 묶어 반영.
+    크롤링에서 빠진 DB 행은 삭제하지 않고(하루치 크롤링 누락일 수 있음) 충돌과 함께 건너뜀.
+    """
+    from auto_settlement import settle_closed_games
+    from live_scores import push_changes
+    from reconcile import diff_rows, iter_db_rows, prepare_crawl_rows
+    
+    summary = {}
+    
+    for sport, games in results.items():
+        if games is None:
+            print(f"⏭️ {sport}: 크롤링 실패로 반영하지 않음")
+            continue
+        
+        spec = get_sport(sport)
+        counts = {'insert': 0, 'update': 0, 'skipped': 0, 'rejected': 0, 'failed': 0}
+        rows, counts['rejected'] = prepare_crawl_rows(sport, games, date, date)
+        inserts = []
+        updates = {}
+        
+        stats: Dict[str, int] = {}
+        for operation in diff_rows(iter(rows), iter_db_rows(client, sport, date, date, stats)):
+            if operation['op'] == 'insert':
+                row = {field: operation['row'][field] for field in NATURAL_KEY + COMPARE_FIELDS}
+                row.update(spec['insert_defaults'])
+                inserts.append(row)
+            elif operation['op'] == 'update':
+                updates[operation['id']] = operation['changes']
+            else:
+                counts['skipped'] += 1
+        
+        if dry_run:
+            counts['insert'] = len(inserts)
+            counts['update'] = len(updates)
+        else:
+            if inserts:
+                try:
+                    with span('supabase_insert', sport=sport, date=date, table=spec['table']):
+                        client.table(spec['table']).insert(inserts).execute()
+                    counts['insert'] = len(inserts)
+                except Exception as e:
+                    print(f"❌ {sport} 추가 배치 실패 ({len(inserts)}개): {e}")
+                    counts['failed'] += len(inserts)
+            
+            updated = push_changes(client, spec['table'], updates)
+            counts['update'] = len(updated)
+            counts['failed'] += len(updates) - len(updated)
+            
+            closed_ids = [game_id for game_id in updated if updates[game_id].get('is_closed') is True]
+            if settle and closed_ids:
+                settle_closed_games(client, sport, closed_ids)
+        
+        summary[sport] = counts
+        print(f"📥 {spec['name']} ({spec['table']}){' (dry-run)' if dry_run else ''}: "
+              f"추가 {counts['insert']}개, 수정 {counts['update']}개, 건너뜀 {counts['skipped']}개, "
+              f"검증 제외 {counts['rejected']}개, 실패 {counts['failed']}개")
+    
+    return summary
+
+@profiled
+def main():
+    """메인 실행 함수"""
+    import argparse
+    
+    parser = argparse.ArgumentParser(description='날짜별 전 종목 크롤링')
+    parser.add_argument('date', nargs='?', default=datetime.now().strftime('%Y-%m-%d'), help='경기 날짜 (YYYY-MM-DD)')
+    parser.add_argument('--sports', nargs='+', default=list(DEFAULT_SPORTS), choices=list(DEFAULT_SPORTS))
+    parser.add_argument('--output', help='통합 배치 JSONL 파일 (.gz면 압축)')
+    parser.add_argument('--from-batch', help='크롤링하지 않고 저장된 통합 배치 파일을 반영')
+    parser.add_argument('--import', dest='do_import', action='store_true', help='DB에 반영')
+    parser.add_argument('--dry-run', action='store_true', help='DB에 쓰지 않고 반영 대상만 집계')
+    parser.add_argument('--settle', action='store_true', help='종료된 경기의 스포츠 마켓 자동 정산')
+    args = parser.parse_args()
+    
+    if args.from_batch:
+        batch = read_combined_batch(args.from_batch)
+        date, results = batch['date'], batch['results']
+    else:
+        date = args.date
+        results = crawl_all_sports(date, args.sports)
+        write_combined_batch(date, results, args.output or f"all_sports_{date}.jsonl")
+    
+    if args.do_import or args.from_batch:
+        from reconcile import create_supabase_client
+        import_combined_batch(create_supabase_client(), date, results, args.dry_run, args.settle)
+
+if __name__ == "__main__":
+    main()
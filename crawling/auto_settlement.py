@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+스포츠 마켓 자동 정산
+- 가져오기(import) 과정에서 is_closed가 true로 바뀐 경기 ID를 모아
+  연결된 스포츠 마켓(markets.game_id)을 한 번에 정산
+- 정산은 settle_market_simple RPC 사용 (관리자 페이지와 동일)
+- 동시 실행 수 제한, 이미 정산된 마켓은 건너뜀 (여러 번 실행해도 안전)
+
+사용법:
+    python auto_settlement.py kbo <game_id> [<game_id> ...] [--workers 4] [--dry-run]
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Iterable, Optional
+
+from instrumentation import span
+from profiling import profiled
+from sport_registry import get_sport
+from validation_rules import RULE_SETS
+
+# in_ 필터 한 번에 넣을 ID 수 (URL 길이 제한)
+ID_CHUNK_SIZE = 100
+
+ALREADY_SETTLED_MESSAGE = '이미 정산된 마켓'
+
+def chunked(values: List[Any], size: int) -> Iterable[List[Any]]:
+    """리스트를 size 단위로 나눔"""
+    for start in range(0, len(values), size):
+        yield values[start:start + size]
+
+def market_result(sport: str, game: Dict[str, Any], market: Dict[str, Any]) -> Optional[str]:
+    """
+    경기 결과 → 마켓 결과 ('yes' / 'no' / 'cancelled')
+
+    스포츠 마켓은 option_yes = 홈팀, option_no = 원정팀.
+    무승부는 선택지가 없으므로 취소(환불) 처리.
+    """
+    labels = RULE_SETS[sport]['result_labels']
+    result = game.get('result')
+    
+    if result == labels['draw']:
+        return 'cancelled'
+    if result not in (labels['home'], labels['away']):
+        return None
+    
+    winner = game['home_team'] if result == labels['home'] else game['away_team']
+    if market.get('option_yes') == winner:
+        return 'yes'
+    if market.get('option_no') == winner:
+        return 'no'
+    
+    # 옵션 이름이 팀명과 다르면 홈=yes 규칙을 따름
+    return 'yes' if result == labels['home'] else 'no'
+
+def fetch_closed_games(client, sport: str, game_ids: List[Any]) -> Dict[Any, Dict[str, Any]]:
+    """종료된 경기 결과 조회"""
+    table = get_sport(sport)['table']
+    games = {}
+    for ids in chunked(game_ids, ID_CHUNK_SIZE):
+        response = (client.table(table).select('id,home_team,away_team,result,is_closed')
+                    .in_('id', ids).eq('is_closed', True).execute())
+        for game in response.data or []:
+            games[game['id']] = game
+    return games
+
+def fetch_open_markets(client, sport: str, game_ids: List[Any]) -> List[Dict[str, Any]]:
+    """아직 정산되지 않은 연결 마켓 조회"""
+    sport_type = get_sport(sport)['market_sport_type']
+    markets = []
+    for ids in chunked(game_ids, ID_CHUNK_SIZE):
+        response = (client.table('markets').select('id,game_id,option_yes,option_no,status,result')
+                    .eq('market_type', 'sports').eq('sport_type', sport_type)
+                    .in_('game_id', ids).is_('result', 'null').execute())
+        markets.extend(response.data or [])
+    return markets
+
+def settle_market(client, market_id: Any, result: str) -> Dict[str, Any]:
+    """마켓 하나 정산 (이미 정산된 경우 skipped)"""
+    try:
+        with span('supabase_rpc', rpc='settle_market_simple'):
+            response = client.rpc('settle_market_simple', {'p_market_id': market_id, 'p_result': result}).execute()
+        return {'market_id': market_id, 'result': result, 'status': 'settled', 'settlement': response.data}
+    except Exception as e:
+        if ALREADY_SETTLED_MESSAGE in str(e):
+            return {'market_id': market_id, 'result': result, 'status': 'skipped'}
+        return {'market_id': market_id, 'result': result, 'status': 'failed', 'error': str(e)}
+
+def settle_closed_games(client, sport: str, game_ids: Iterable[Any], max_workers: int = 4,
+                        dry_run: bool = False) -> Dict[str, Any]:
+    """종료된 경기들에 연결된 스포츠 마켓 일괄 정산"""
+    game_ids = list(dict.fromkeys(game_id for game_id in game_ids if game_id is not None))
+    summary = {'games': len(game_ids), 'markets': 0, 'settled': 0, 'skipped': 0, 'failed': 0, 'results': []}
+    
+    if not game_ids:
+        return summary
+    
+    print(f"💰 {get_sport(sport)['name']} 경기 {len(game_ids)}개 연결 마켓 정산 확인")
+    
+    games = fetch_closed_games(client, sport, game_ids)
+    markets = fetch_open_markets(client, sport, list(games))
+    summary['markets'] = len(markets)
+    
+    tasks = []
+    for market in markets:
+        result = market_result(sport, games[market['game_id']], market)
+        if result is None:
+            print(f"⚠️ 마켓 {market['id']}: 경기 결과 없음, 정산 보류")
+            summary['skipped'] += 1
+            continue
+        tasks.append((market['id'], result))
+    
+    if dry_run:
+        for market_id, result in tasks:
+            print(f"🔍 (dry-run) 마켓 {market_id} → {result}")
+        summary['skipped'] += len(tasks)
+        return summary
+    
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        outcomes = list(executor.map(lambda task: settle_market(client, *task), tasks))
+    
+    for outcome in outcomes:
+        summary[outcome['status']] += 1
+        summary['results'].append(outcome)
+        if outcome['status'] == 'settled':
+            print(f"✅ 마켓 {outcome['market_id']} 정산 완료: {outcome['result']}")
+        elif outcome['status'] == 'failed':
+            print(f"❌ 마켓 {outcome['market_id']} 정산 실패: {outcome['error']}")
+    
+    print(f"📊 정산 결과: 성공 {summary['settled']}개, 건너뜀 {summary['skipped']}개, 실패 {summary['failed']}개")
+    return summary
+
+@profiled
+def main():
+    """메인 실행 함수"""
+    import argparse
+    
+    from reconcile import create_supabase_client
+    
+    parser = argparse.ArgumentParser(description='스포츠 마켓 자동 정산')
+    parser.add_argument('sport', choices=['kbo', 'volleyball', 'epl'])
+    parser.add_argument('game_ids', nargs='+', help='종료된 경기 ID')
+    parser.add_argument('--workers', type=int, default=4, help='동시 정산 수')
+    parser.add_argument('--dry-run', action='store_true', help='정산하지 않고 대상만 출력')
+    args = parser.parse_args()
+    
+    client = create_supabase_client()
+    settle_closed_games(client, args.sport, args.game_ids, args.workers, args.dry_run)
+
+if __name__ == "__main__":
+    main()
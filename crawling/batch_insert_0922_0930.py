@@ -1,22 +1,16 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
-import os
 import csv
 import glob
 from datetime import datetime, timedelta
-from supabase import create_client, Client
-from dotenv import load_dotenv
 
-load_dotenv('../.env.local')
-
-url: str = os.environ.get("NEXT_PUBLIC_SUPABASE_URL")
-key: str = os.environ.get("NEXT_PUBLIC_SUPABASE_ANON_KEY")
-supabase: Client = create_client(url, key)
+from supabase_client import require_supabase, traced_supabase
+from validation_rules import get_rule_set
 
 def get_sport_id(sport_name):
     try:
-        response = supabase.table('sports').select('id').eq('name', sport_name).single().execute()
+        response = traced_supabase('kbo').table('sports').select('id').eq('name', sport_name).single().execute()
         if response.data:
             return response.data['id']
     except Exception as e:
@@ -28,13 +22,13 @@ def insert_game_data(game_data):
     if not sport_id:
         print(f"❌ 스포츠 ID를 찾을 수 없습니다: {game_data['sport']}")
         return False
-
+    
     # start_time을 ISO 8601 형식으로 변환
     kst_time_str = f"{game_data['date']} {game_data['time']}"
     kst_datetime = datetime.strptime(kst_time_str, '%Y-%m-%d %H:%M')
     utc_datetime = kst_datetime - timedelta(hours=9) # KST to UTC
     start_time_iso = utc_datetime.isoformat() + "+00:00"
-
+    
     data_to_insert = {
         "sport_id": sport_id,
         "home_team": game_data['homeTeam'],
@@ -43,13 +37,13 @@ def insert_game_data(game_data):
         "end_time": None,
         "result": game_data['result'],
         "is_closed": game_data['status'] == '종료',
-        "home_score": int(game_data['homeScore']) if game_data['homeScore'] and game_data['homeScore'].isdigit() else None,
-        "away_score": int(game_data['awayScore']) if game_data['awayScore'] and game_data['awayScore'].isdigit() else None,
+        "home_score": int(game_data['homeScore']) if game_data['homeScore'] is not None and str(game_data['homeScore']).isdigit() else None,
+        "away_score": int(game_data['awayScore']) if game_data['awayScore'] is not None and str(game_data['awayScore']).isdigit() else None,
         "stadium": game_data['stadium'] if game_data['stadium'] else None,
     }
-
+    
     try:
-        response = supabase.table('games').insert([data_to_insert]).execute()
+        response = traced_supabase('kbo').table('games').insert([data_to_insert]).execute()
         if response.data:
             return True
         else:
@@ -84,6 +78,7 @@ def process_csv_files():
     
     total_games = 0
     total_success = 0
+    rules = get_rule_set('kbo')
     
     for csv_file in csv_files:
         print(f"📄 처리 중: {csv_file}")
@@ -109,6 +104,13 @@ def process_csv_files():
                         'sport': '야구'  # KBO 크롤러이므로 고정
                     }
                     
+                    # 삽입 전 검증 (빈 값은 None으로 변환)
+                    validation = rules.validate({key: value if value != '' else None for key, value in game_data.items()})
+                    if not validation['valid']:
+                        print(f"  ⚠️ 검증 실패로 제외: {game_data['awayTeam']} vs {game_data['homeTeam']} - {', '.join(validation['issues'])}")
+                        continue
+                    game_data = validation['game']
+                    
                     if insert_game_data(game_data):
                         success_in_file += 1
                         print(f"  ✅ {game_data['awayTeam']} vs {game_data['homeTeam']} ({game_data['date']} {game_data['time']})")
@@ -131,4 +133,5 @@ def process_csv_files():
     print("=" * 60)
 
 if __name__ == "__main__":
+    require_supabase()
     process_csv_files()
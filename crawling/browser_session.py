@@ -0,0 +1,274 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+크롬 드라이버 생성/재사용
+- 크롤러마다 복사되어 있던 모바일(iPhone) 크롬 설정을 한 곳에 모음
+- BrowserSession은 여러 크롤링 작업 사이에 드라이버를 유지 (매번 크롬을 새로 띄우지 않음)
+- 일정 마크업에 필요 없는 이미지/폰트/미디어와 광고·분석 스크립트는 DevTools(Network.setBlockedURLs)로 차단
+  (CRAWL_BLOCK_RESOURCES=off 이면 차단하지 않음 - 벤치마크 비교용)
+- report_page_transfer로 페이지마다 수신 바이트 / 요청 수 / 차단 요청 수 기록
+  (성능 로그는 transfer_log=True로 만든 드라이버에만 켬 - 비우지 않는 드라이버는 로그가 계속 쌓임)
+- 작업 수 / 크롬 프로세스 RSS 상한을 넘으면 드라이버 재시작 (장기 실행 시 메모리 고정)
+"""
+
+import json
+import os
+import threading
+from typing import Dict, Any, Optional, Tuple
+from urllib.parse import urlparse
+
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
+
+from instrumentation import span
+from process_memory import process_tree_rss
+
+MOBILE_USER_AGENT = 'Mozilla/5.0 (iPhone; CPU iPhone OS 15_0 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/15.0 Mobile/15E148 Safari/604.1'
+
+# 일정 페이지 렌더링에 필요 없는 리소스 (Network.setBlockedURLs 패턴, * 와일드카드)
+# 일정 앱 스크립트와 일정 API(api-gw.sports.naver.com) 요청은 그대로 둠
+BLOCKED_RESOURCE_PATTERNS = [
+    # 이미지 (팀 로고, 선수 사진, 배너)
+    '*.png*', '*.jpg*', '*.jpeg*', '*.gif*', '*.webp*', '*.svg*',
+    # 폰트
+    '*.woff*', '*.ttf*', '*.otf*', '*.eot*',
+    # 미디어 (하이라이트 영상)
+    '*.mp4*', '*.webm*', '*.m3u8*', '*.mp3*',
+]
+
+# 광고 / 분석 (제3자 스크립트와 비콘)
+BLOCKED_DOMAIN_PATTERNS = [
+    '*://*.veta.naver.com/*',
+    '*://tivan.naver.com/*',
+    '*://lcs.naver.com/*',
+    '*://nlog.naver.com/*',
+    '*://ntm.pstatic.net/*',
+    '*://*.doubleclick.net/*',
+    '*://*.googlesyndication.com/*',
+    '*://*.google-analytics.com/*',
+    '*://*.googletagmanager.com/*',
+    '*://*.facebook.net/*',
+]
+
+# 드라이버 재시작 기준 (CRAWL_BROWSER_MAX_PAGES / CRAWL_BROWSER_MAX_RSS_MB, 0이면 해당 기준 사용 안 함)
+DEFAULT_MAX_PAGES = 200
+DEFAULT_MAX_RSS_MB = 700
+
+_transfer_lock = threading.Lock()
+_transfer_totals = {'pages': 0, 'bytes': 0, 'requests': 0, 'blocked': 0}
+
+def request_blocking_enabled() -> bool:
+    """CRAWL_BLOCK_RESOURCES (기본: 차단)"""
+    return os.getenv('CRAWL_BLOCK_RESOURCES', 'on').lower() not in ('0', 'off', 'false')
+
+def create_chrome_options(block_resources: Optional[bool] = None, transfer_log: bool = False) -> Options:
+    """
+    네이버 모바일 스포츠용 헤드리스 크롬 설정
+
+    transfer_log: 네트워크 이벤트 성능 로그 사용 (report_page_transfer로 주기적으로 비우는 경우만)
+    """
+    if block_resources is None:
+        block_resources = request_blocking_enabled()
+    
+    options = Options()
+    options.add_argument('--headless')
+    options.add_argument('--no-sandbox')
+    options.add_argument('--disable-dev-shm-usage')
+    options.add_argument(f'--user-agent={MOBILE_USER_AGENT}')
+    if block_resources:
+        # URL 패턴에 걸리지 않는 이미지(data:, 확장자 없는 URL)까지 렌더러에서 불러오지 않음
+        options.add_argument('--blink-settings=imagesEnabled=false')
+        options.add_argument('--autoplay-policy=user-gesture-required')
+        options.add_experimental_option('prefs', {'profile.managed_default_content_settings.images': 2})
+    if transfer_log:
+        # 페이지별 수신 바이트/차단 수 집계용 네트워크 이벤트 로그 (report_page_transfer에서 비움)
+        options.set_capability('goog:loggingPrefs', {'performance': 'ALL'})
+        options.add_experimental_option('perfLoggingPrefs', {'enableNetwork': True, 'enablePage': False})
+    return options
+
+def enable_request_blocking(driver) -> bool:
+    """DevTools로 불필요한 리소스/도메인 요청 차단 (크롬이 아니면 False)"""
+    try:
+        driver.execute_cdp_cmd('Network.enable', {})
+        driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': BLOCKED_RESOURCE_PATTERNS + BLOCKED_DOMAIN_PATTERNS})
+        return True
+    except Exception as e:
+        print(f"⚠️ 요청 차단 설정 실패 (전체 리소스 로드): {e}")
+        return False
+
+def create_chrome_driver(page_load_timeout: int = 30, block_resources: Optional[bool] = None,
+                         transfer_log: bool = False):
+    """헤드리스 크롬 드라이버 생성 (페이지마다 report_page_transfer를 부르면 transfer_log=True)"""
+    if block_resources is None:
+        block_resources = request_blocking_enabled()
+    
+    with span('driver_start'):
+        driver = webdriver.Chrome(options=create_chrome_options(block_resources, transfer_log))
+        driver.set_page_load_timeout(page_load_timeout)
+        if block_resources:
+            enable_request_blocking(driver)
+    return driver
+
+def page_transfer_stats(driver) -> Optional[Dict[str, Any]]:
+    """
+    지난 호출 이후 네트워크 이벤트 로그 집계 (로그를 비움)
+
+    Returns:
+        bytes: 실제 수신 바이트 (압축 전송 기준), requests: 요청 수, blocked: 차단된 요청 수
+        (성능 로그를 켜지 않은 드라이버면 None)
+    """
+    try:
+        entries = driver.get_log('performance')
+    except Exception:
+        return None
+    
+    stats = {'bytes': 0, 'requests': 0, 'blocked': 0}
+    for entry in entries:
+        try:
+            message = json.loads(entry['message'])['message']
+        except (KeyError, TypeError, ValueError):
+            continue
+        method = message.get('method')
+        if method == 'Network.requestWillBeSent':
+            stats['requests'] += 1
+        elif method == 'Network.loadingFinished':
+            stats['bytes'] += int(message.get('params', {}).get('encodedDataLength') or 0)
+        elif method == 'Network.loadingFailed' and message.get('params', {}).get('blockedReason'):
+            stats['blocked'] += 1
+    return stats
+
+def report_page_transfer(driver, label: str) -> Optional[Dict[str, Any]]:
+    """페이지 하나의 수신량/차단 수 출력 후 프로세스 누적값에 합산"""
+    stats = page_transfer_stats(driver)
+    if stats is None:
+        return None
+    
+    with _transfer_lock:
+        _transfer_totals['pages'] += 1
+        for key in ('bytes', 'requests', 'blocked'):
+            _transfer_totals[key] += stats[key]
+    print(f"📦 {label}: 수신 {stats['bytes'] / 1024:.0f}KB (요청 {stats['requests']}건, 차단 {stats['blocked']}건)")
+    return stats
+
+def clear_browser_state(driver):
+    """빈 페이지로 이동 후 캐시/쿠키/스토리지 삭제 (이전 페이지 DOM과 캐시된 리소스 해제)"""
+    try:
+        parsed = urlparse(driver.current_url)
+        driver.delete_all_cookies()
+        driver.get('about:blank')
+        driver.execute_cdp_cmd('Network.clearBrowserCache', {})
+        if parsed.scheme in ('http', 'https'):
+            driver.execute_cdp_cmd('Storage.clearDataForOrigin',
+                                   {'origin': f'{parsed.scheme}://{parsed.netloc}', 'storageTypes': 'all'})
+    except Exception as e:
+        print(f"⚠️ 브라우저 상태 초기화 실패: {e}")
+
+def transfer_totals() -> Dict[str, int]:
+    """report_page_transfer 누적값 (벤치마크 구간 비교용)"""
+    with _transfer_lock:
+        return dict(_transfer_totals)
+
+class BrowserSession:
+    """
+    작업 간에 재사용하는 크롬 드라이버 (처음 사용할 때 생성)
+
+    오래 실행하면 크롬 렌더러 메모리가 페이지마다 늘어나므로, 작업 수(max_pages)나
+    chromedriver + 크롬 프로세스 트리 RSS(max_rss_mb)가 상한을 넘으면 다음 작업 전에 드라이버를 새로 띄움.
+    종목이 바뀌면 캐시/쿠키/스토리지를 비워 이전 종목 페이지 상태를 끌고 다니지 않음.
+    세션 드라이버로 도는 크롤러는 페이지마다 report_page_transfer를 부르므로 기본으로 성능 로그를 켬.
+    """
+    
+    def __init__(self, page_load_timeout: int = 30, max_pages: Optional[int] = None,
+                 max_rss_mb: Optional[float] = None, window_size: Optional[Tuple[int, int]] = None,
+                 transfer_log: bool = True):
+        self.page_load_timeout = page_load_timeout
+        self.transfer_log = transfer_log
+        if max_pages is None:
+            max_pages = int(os.getenv('CRAWL_BROWSER_MAX_PAGES', DEFAULT_MAX_PAGES))
+        if max_rss_mb is None:
+            max_rss_mb = float(os.getenv('CRAWL_BROWSER_MAX_RSS_MB', DEFAULT_MAX_RSS_MB))
+        self.max_pages = max_pages
+        self.max_rss_mb = max_rss_mb
+        self.window_size = window_size
+        self._driver = None
+        self.job_count = 0
+        self.restarts = 0
+        self.last_sport: Optional[str] = None
+    
+    @property
+    def driver(self):
+        if self._driver is None:
+            print("🌐 크롬 드라이버 시작")
+            self._driver = create_chrome_driver(self.page_load_timeout, transfer_log=self.transfer_log)
+            if self.window_size:
+                self._driver.set_window_size(*self.window_size)
+            self.job_count = 0
+            self.last_sport = None
+        return self._driver
+    
+    def rss_mb(self) -> Optional[float]:
+        """chromedriver와 크롬 하위 프로세스 RSS 합 (MB, 측정할 수 없으면 None)"""
+        try:
+            pid = self._driver.service.process.pid
+        except AttributeError:
+            return None
+        rss = process_tree_rss(pid)
+        return rss / 1024 / 1024 if rss else None
+    
+    def recycle_reason(self) -> Optional[str]:
+        """드라이버를 새로 띄워야 하는 이유 (상한 이내면 None)"""
+        if self._driver is None:
+            return None
+        if self.max_pages and self.job_count >= self.max_pages:
+            return f"작업 {self.job_count}회"
+        if self.max_rss_mb:
+            rss = self.rss_mb()
+            if rss is not None and rss >= self.max_rss_mb:
+                return f"메모리 {rss:.0f}MB ≥ {self.max_rss_mb:.0f}MB"
+        return None
+    
+    def acquire(self, sport: Optional[str] = None):
+        """작업 하나에 사용할 드라이버 반환 (상한을 넘었으면 재시작, 종목이 바뀌면 상태 초기화)"""
+        reason = self.recycle_reason()
+        if reason:
+            print(f"♻️ 크롬 드라이버 재시작 ({reason})")
+            self.reset()
+            self.restarts += 1
+        
+        driver = self.driver
+        if sport and self.last_sport and sport != self.last_sport:
+            clear_browser_state(driver)
+        if sport:
+            self.last_sport = sport
+        self.job_count += 1
+        return driver
+    
+    def is_alive(self) -> bool:
+        """드라이버가 아직 응답하는지 확인"""
+        if self._driver is None:
+            return False
+        try:
+            self._driver.current_url
+            return True
+        except Exception:
+            return False
+    
+    def reset(self):
+        """드라이버 종료 (오류 후 다음 작업에서 새로 생성)"""
+        if self._driver is not None:
+            try:
+                self._driver.quit()
+            except Exception as e:
+                print(f"⚠️ 드라이버 종료 중 오류: {e}")
+            self._driver = None
+    
+    def close(self):
+        self.reset()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
@@ -0,0 +1,344 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+크롤러 종단간(end-to-end) 벤치마크
+- 저장해 둔 일정 페이지({sport}_page_source_{date}.html)를 로컬 HTTP 서버로 제공
+- SCHEDULE_BASE_URL을 로컬 서버로 바꿔 KBO / 배구 / EPL 크롤러를 실제 크롬으로 그대로 실행
+- 페이지/초, 경기/초, 날짜별 지연 p50/p95, 최대 RSS(파이썬 + 크롬 프로세스 트리) 측정
+- 결과는 커밋 해시와 함께 JSON으로 저장해 커밋 간 비교
+
+사용법:
+    python crawl_benchmark.py run [--fixtures .] [--sports volleyball] [--repeat 3] [--output bench.json]
+    python crawl_benchmark.py record kbo 2025-09-23 [--fixtures .]
+    python crawl_benchmark.py compare bench_before.json bench_after.json
+    (리소스 차단 효과: CRAWL_BLOCK_RESOURCES=off 로 한 번, 기본값으로 한 번 실행 후 compare)
+"""
+
+import glob
+import json
+import os
+import re
+import resource
+import subprocess
+import threading
+import time
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import List, Dict, Any, Optional
+from urllib.parse import urlparse, parse_qs
+
+from process_memory import process_tree_rss
+from profiling import profiled
+from sport_registry import SPORTS, get_sport, load_crawler, schedule_url
+
+FIXTURE_NAME = '{sport}_page_source_{date}.html'
+
+# 저장된 페이지의 스크립트는 외부 리소스를 불러오고 DOM을 다시 그리므로 제거 후 제공
+SCRIPT_PATTERN = re.compile(r'<script\b[^>]*>.*?</script>', re.IGNORECASE | re.DOTALL)
+
+EMPTY_SCHEDULE_PAGE = '<html><body><p>경기가 없습니다</p></body></html>'
+
+# 크롬 프로세스 트리 RSS 측정 간격 (초)
+RSS_SAMPLE_INTERVAL = 0.5
+
+def find_fixtures(fixtures_dir: str) -> Dict[str, List[str]]:
+    """저장된 페이지 목록 (종목별 날짜)"""
+    fixtures: Dict[str, List[str]] = {}
+    for sport in SPORTS:
+        pattern = os.path.join(fixtures_dir, FIXTURE_NAME.format(sport=sport, date='*'))
+        for path in sorted(glob.glob(pattern)):
+            date = re.search(r'(\d{4}-\d{2}-\d{2})\.html$', path)
+            if date:
+                fixtures.setdefault(sport, []).append(date.group(1))
+    return fixtures
+
+def sport_for_path(path: str, query: Dict[str, List[str]]) -> Optional[str]:
+    """요청 경로/쿼리가 어느 종목 일정 페이지인지"""
+    for sport, spec in SPORTS.items():
+        template = urlparse(spec['schedule_url'])
+        template_query = parse_qs(template.query)
+        if template.path == path and all(query.get(key) == value for key, value in template_query.items()
+                                         if '{date}' not in value[0]):
+            return sport
+    return None
+
+class FixtureServer:
+    """저장된 일정 페이지를 제공하는 로컬 HTTP 서버 (별도 스레드)"""
+    
+    def __init__(self, fixtures_dir: str, strip_scripts: bool = True):
+        self.fixtures_dir = fixtures_dir
+        self.strip_scripts = strip_scripts
+        self.requests = 0
+        self._pages: Dict[str, bytes] = {}
+        server = self
+        
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                parsed = urlparse(self.path)
+                query = parse_qs(parsed.query)
+                sport = sport_for_path(parsed.path, query)
+                date = (query.get('date') or [None])[0]
+                server.requests += 1
+                
+                if sport is None or date is None:
+                    self.send_error(404)
+                    return
+                
+                body = server.page(sport, date)
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/html; charset=utf-8')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+            
+            def log_message(self, format, *args):
+                pass
+        
+        self.httpd = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.base_url = f"http://127.0.0.1:{self.httpd.server_address[1]}"
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+    
+    def page(self, sport: str, date: str) -> bytes:
+        """저장된 페이지 (없으면 경기 없음 페이지), 한 번 읽은 페이지는 메모리에 보관"""
+        key = f"{sport}/{date}"
+        if key not in self._pages:
+            path = os.path.join(self.fixtures_dir, FIXTURE_NAME.format(sport=sport, date=date))
+            if os.path.exists(path):
+                with open(path, 'r', encoding='utf-8') as file:
+                    html = file.read()
+                if self.strip_scripts:
+                    html = SCRIPT_PATTERN.sub('', html)
+            else:
+                html = EMPTY_SCHEDULE_PAGE
+            self._pages[key] = html.encode('utf-8')
+        return self._pages[key]
+    
+    def __enter__(self):
+        self._thread.start()
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        return False
+
+class RssSampler:
+    """벤치마크 중 파이썬 + 크롬 프로세스 트리 RSS 최댓값 기록"""
+    
+    def __init__(self, interval: float = RSS_SAMPLE_INTERVAL):
+        self.interval = interval
+        self.peak_bytes = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+    
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self.peak_bytes = max(self.peak_bytes, process_tree_rss(os.getpid()))
+    
+    def __enter__(self):
+        self._thread.start()
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._stop.set()
+        self._thread.join()
+        return False
+
+def percentile(values: List[float], fraction: float) -> Optional[float]:
+    if not values:
+        return None
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * fraction))]
+
+def git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                              check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def benchmark_sport(sport: str, dates: List[str], session, repeat: int = 1) -> Dict[str, Any]:
+    """한 종목 크롤러를 저장된 날짜들로 repeat번 실행"""
+    from browser_session import transfer_totals
+    from validation_rules import validate_record
+    
+    crawler = load_crawler(sport)
+    latencies = []
+    games_total = 0
+    valid_total = 0
+    failures = 0
+    
+    transfer_before = transfer_totals()
+    started = time.perf_counter()
+    for _ in range(repeat):
+        for date in dates:
+            date_started = time.perf_counter()
+            try:
+                games = crawler(date, driver=session.acquire(sport))
+                if games is None:
+                    raise RuntimeError('크롤링 실패')
+            except Exception as e:
+                print(f"❌ {sport} {date} 실패: {e}")
+                failures += 1
+                session.reset()
+                continue
+            latencies.append(time.perf_counter() - date_started)
+            games_total += len(games)
+            valid_total += sum(1 for game in games if validate_record(sport, game)['valid'])
+    elapsed = time.perf_counter() - started
+    transfer = {key: value - transfer_before[key] for key, value in transfer_totals().items()}
+    
+    return {
+        'dates': dates,
+        'repeat': repeat,
+        'pages': len(latencies),
+        'failures': failures,
+        'games': games_total,
+        'valid_games': valid_total,
+        'seconds': round(elapsed, 3),
+        'pages_per_sec': round(len(latencies) / elapsed, 4) if elapsed else None,
+        'games_per_sec': round(games_total / elapsed, 4) if elapsed else None,
+        'latency_p50': percentile(latencies, 0.5),
+        'latency_p95': percentile(latencies, 0.95),
+        'kb_per_page': round(transfer['bytes'] / 1024 / transfer['pages'], 1) if transfer['pages'] else None,
+        'blocked_per_page': round(transfer['blocked'] / transfer['pages'], 1) if transfer['pages'] else None,
+        'latencies': [round(latency, 4) for latency in latencies]
+    }
+
+def run_benchmark(fixtures_dir: str = '.', sports: Optional[List[str]] = None, repeat: int = 1,
+                  output_path: Optional[str] = None, strip_scripts: bool = True) -> Dict[str, Any]:
+    """저장된 페이지 전체로 종목별 벤치마크 실행 후 JSON 저장"""
+    from browser_session import BrowserSession, request_blocking_enabled
+    
+    fixtures = find_fixtures(fixtures_dir)
+    sports = [sport for sport in (sports or list(SPORTS)) if sport in fixtures]
+    if not sports:
+        raise ValueError(f"{fixtures_dir}에 저장된 일정 페이지가 없습니다 ({FIXTURE_NAME})")
+    
+    result = {
+        'commit': git_commit(),
+        'started_at': datetime.now().isoformat(),
+        'fixtures_dir': os.path.abspath(fixtures_dir),
+        'strip_scripts': strip_scripts,
+        'block_resources': request_blocking_enabled(),
+        'sports': {}
+    }
+    
+    print(f"🏁 크롤러 벤치마크: {', '.join(f'{sport} {len(fixtures[sport])}일' for sport in sports)} x {repeat}회")
+    print("=" * 60)
+    
+    # 벤치마크 페이지는 운영 크롤링 상태 지표에 섞이지 않도록 기록하지 않음
+    overrides = {'SCHEDULE_BASE_URL': None, 'CRAWL_HEALTH_DB': 'off'}
+    previous_env = {name: os.environ.get(name) for name in overrides}
+    with FixtureServer(fixtures_dir, strip_scripts) as server, RssSampler() as rss:
+        overrides['SCHEDULE_BASE_URL'] = server.base_url
+        os.environ.update(overrides)
+        try:
+            with BrowserSession() as session:
+                driver_started = time.perf_counter()
+                session.acquire()
+                result['driver_start_seconds'] = round(time.perf_counter() - driver_started, 3)
+                
+                for sport in sports:
+                    result['sports'][sport] = benchmark_sport(sport, fixtures[sport], session, repeat)
+                result['driver_restarts'] = session.restarts
+        finally:
+            for name, value in previous_env.items():
+                if value is None:
+                    os.environ.pop(name, None)
+                else:
+                    os.environ[name] = value
+        result['server_requests'] = server.requests
+    
+    result['peak_rss_mb'] = round(rss.peak_bytes / 1024 / 1024, 1)
+    result['python_peak_rss_mb'] = round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1)
+    
+    print(f"\n📊 결과 (커밋 {result['commit'] or '-'}):")
+    for sport, stats in result['sports'].items():
+        print(f"   {sport}: {stats['pages_per_sec']} 페이지/초, {stats['games_per_sec']} 경기/초, "
+              f"p50 {stats['latency_p50']:.2f}초, p95 {stats['latency_p95']:.2f}초, 경기 {stats['games']}개"
+              if stats['pages'] else f"   {sport}: 모든 날짜 실패")
+        if stats.get('kb_per_page') is not None:
+            print(f"      페이지당 수신 {stats['kb_per_page']}KB, 차단 {stats['blocked_per_page']}건")
+    print(f"   최대 RSS: {result['peak_rss_mb']}MB (파이썬 {result['python_peak_rss_mb']}MB)")
+    
+    if output_path:
+        with open(output_path, 'w', encoding='utf-8') as file:
+            json.dump(result, file, ensure_ascii=False, indent=2)
+        print(f"💾 결과 저장: {output_path}")
+    
+    return result
+
+def record_fixture(sport: str, date: str, fixtures_dir: str = '.') -> str:
+    """실제 일정 페이지를 렌더링된 상태로 저장 (벤치마크/파서 코퍼스용)"""
+    from browser_session import create_chrome_driver
+    
+    driver = create_chrome_driver()
+    try:
+        driver.get(schedule_url(sport, date))
+        time.sleep(8)
+        path = os.path.join(fixtures_dir, FIXTURE_NAME.format(sport=sport, date=date))
+        with open(path, 'w', encoding='utf-8') as file:
+            file.write(driver.page_source)
+    finally:
+        driver.quit()
+    
+    print(f"💾 {get_sport(sport)['name']} {date} 페이지 저장: {path}")
+    return path
+
+COMPARE_METRICS = ('pages_per_sec', 'games_per_sec', 'latency_p50', 'latency_p95', 'kb_per_page')
+
+def compare_results(before_path: str, after_path: str):
+    """두 벤치마크 결과 비교 출력"""
+    with open(before_path, 'r', encoding='utf-8') as file:
+        before = json.load(file)
+    with open(after_path, 'r', encoding='utf-8') as file:
+        after = json.load(file)
+    
+    print(f"🔍 {before.get('commit') or before_path} → {after.get('commit') or after_path}")
+    for sport in sorted(set(before['sports']) & set(after['sports'])):
+        print(f"\n{sport}:")
+        for metric in COMPARE_METRICS:
+            old, new = before['sports'][sport].get(metric), after['sports'][sport].get(metric)
+            if old is None or new is None:
+                continue
+            change = (new - old) / old if old else 0
+            print(f"   {metric:<14} {old:>10.4f} → {new:>10.4f} ({change:+.1%})")
+    print(f"\n   peak_rss_mb    {before.get('peak_rss_mb')} → {after.get('peak_rss_mb')}")
+
+@profiled
+def main():
+    """메인 실행 함수"""
+    import argparse
+    
+    parser = argparse.ArgumentParser(description='크롤러 종단간 벤치마크')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    
+    run_parser = subparsers.add_parser('run', help='저장된 페이지로 벤치마크 실행')
+    run_parser.add_argument('--fixtures', default='.', help='저장된 페이지 디렉터리')
+    run_parser.add_argument('--sports', nargs='+', choices=list(SPORTS))
+    run_parser.add_argument('--repeat', type=int, default=1, help='날짜별 반복 횟수')
+    run_parser.add_argument('--output', default=f"bench_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json")
+    run_parser.add_argument('--keep-scripts', action='store_true', help='저장된 페이지의 script 태그 유지')
+    
+    record_parser = subparsers.add_parser('record', help='실제 일정 페이지 저장')
+    record_parser.add_argument('sport', choices=list(SPORTS))
+    record_parser.add_argument('date')
+    record_parser.add_argument('--fixtures', default='.')
+    
+    compare_parser = subparsers.add_parser('compare', help='두 결과 JSON 비교')
+    compare_parser.add_argument('before')
+    compare_parser.add_argument('after')
+    
+    args = parser.parse_args()
+    
+    if args.command == 'run':
+        run_benchmark(args.fixtures, args.sports, args.repeat, args.output, not args.keep_scripts)
+    elif args.command == 'record':
+        record_fixture(args.sport, args.date, args.fixtures)
+    else:
+        compare_results(args.before, args.after)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+날짜 범위 크롤링 체크포인트
+- 날짜 하나가 끝날 때마다 그 날짜 경기를 CSV에 바로 추가하고 완료 날짜를 기록
+- 같은 인자로 다시 실행하면 완료되지 않은 첫 날짜부터 이어서 크롤링
+- 체크포인트 파일은 임시 파일에 쓴 뒤 교체 (중간에 죽어도 깨지지 않음)
+- 결과 파일 크기도 함께 기록해, 완료 기록 전에 죽은 날짜의 레코드는 재시작 시 잘라냄 (중복 없음)
+- 크롤링에 실패한 날짜는 완료로 기록하지 않고, 모든 날짜가 끝나면 clear()로 체크포인트 삭제 (다음 실행은 새로 크롤링)
+"""
+
+import csv
+import json
+import os
+from datetime import datetime
+from typing import List, Dict, Any, Optional
+
+class CrawlCheckpoint:
+    """날짜 범위 크롤링 진행 상황"""
+    
+    def __init__(self, name: str, params: Dict[str, Any], output_file: Optional[str] = None,
+                 directory: str = '.'):
+        self.path = os.path.join(directory, f"{name}.checkpoint.json")
+        self.params = params
+        self.completed: Dict[str, int] = {}
+        self.output_file = output_file
+        self.output_bytes = 0
+        self.resumed = False
+        
+        if os.path.exists(self.path):
+            with open(self.path, 'r', encoding='utf-8') as file:
+                state = json.load(file)
+            
+            # 인자가 같은 실행만 이어서 진행
+            if state.get('params') == params:
+                self.completed = state.get('completed', {})
+                self.output_file = state.get('output_file') or output_file
+                self.output_bytes = state.get('output_bytes', 0)
+                self.resumed = True
+                self.truncate_output()
+                print(f"♻️ 체크포인트 발견: {len(self.completed)}일 완료, 이어서 크롤링 ({self.path})")
+            else:
+                print(f"⚠️ 인자가 다른 체크포인트는 무시하고 새로 시작합니다: {self.path}")
+        
+        self.save()
+    
+    def truncate_output(self):
+        """완료 기록 이후에 추가된(완료되지 않은 날짜의) 레코드 제거"""
+        if self.output_file and os.path.exists(self.output_file) and os.path.getsize(self.output_file) > self.output_bytes:
+            with open(self.output_file, 'r+b') as file:
+                file.truncate(self.output_bytes)
+            print(f"✂️ 완료되지 않은 날짜의 레코드 정리: {self.output_file}")
+    
+    def is_done(self, date: str) -> bool:
+        return date in self.completed
+    
+    def pending(self, dates: List[str]) -> List[str]:
+        """아직 완료되지 않은 날짜"""
+        return [date for date in dates if date not in self.completed]
+    
+    def mark_done(self, date: str, game_count: int):
+        """날짜 완료 기록 (해당 날짜 경기를 먼저 flush한 뒤 호출)"""
+        self.completed[date] = game_count
+        if self.output_file and os.path.exists(self.output_file):
+            self.output_bytes = os.path.getsize(self.output_file)
+        self.save()
+    
+    def clear(self, remove_output: bool = False):
+        """모든 날짜 완료 후 체크포인트 삭제 (remove_output이면 부분 결과 파일도 삭제)"""
+        if os.path.exists(self.path):
+            os.remove(self.path)
+        if remove_output and self.output_file and os.path.exists(self.output_file):
+            os.remove(self.output_file)
+        self.completed = {}
+        self.output_bytes = 0
+    
+    def save(self):
+        state = {
+            'params': self.params,
+            'output_file': self.output_file,
+            'output_bytes': self.output_bytes,
+            'completed': self.completed,
+            'updated_at': datetime.now().isoformat()
+        }
+        temp_path = f"{self.path}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as file:
+            json.dump(state, file, ensure_ascii=False, indent=2)
+        os.replace(temp_path, self.path)
+
+def append_games_csv(filename: str, games: List[Dict[str, Any]], fieldnames: List[str]):
+    """경기 레코드를 CSV에 추가 (파일이 없으면 헤더부터), 디스크까지 flush"""
+    write_header = not os.path.exists(filename) or os.path.getsize(filename) == 0
+    
+    with open(filename, 'a', newline='', encoding='utf-8') as csvfile:
+        writer = csv.DictWriter(csvfile, fieldnames=fieldnames, extrasaction='ignore')
+        if write_header:
+            writer.writeheader()
+        writer.writerows(games)
+        csvfile.flush()
+        os.fsync(csvfile.fileno())
+
+def read_games_csv(filename: str) -> List[Dict[str, Any]]:
+    """append_games_csv로 저장한 경기 레코드 읽기 (빈 값은 None)"""
+    if not filename or not os.path.exists(filename):
+        return []
+    
+    with open(filename, 'r', encoding='utf-8') as csvfile:
+        return [{key: value if value != '' else None for key, value in row.items()} for row in csv.DictReader(csvfile)]
+
+def append_games_jsonl(filename: str, games: List[Dict[str, Any]]):
+    """경기 레코드를 JSONL에 추가 (값 타입 유지), 디스크까지 flush"""
+    with open(filename, 'a', encoding='utf-8') as file:
+        for game in games:
+            file.write(json.dumps(game, ensure_ascii=False) + '\n')
+        file.flush()
+        os.fsync(file.fileno())
+
+def read_games_jsonl(filename: str) -> List[Dict[str, Any]]:
+    """append_games_jsonl로 저장한 경기 레코드 읽기"""
+    if not filename or not os.path.exists(filename):
+        return []
+    
+    with open(filename, 'r', encoding='utf-8') as file:
+        return [json.loads(line) for line in file if line.strip()]
@@ -0,0 +1,242 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+크롤링 상태 지표 (종목/일자별)
+- 날짜별 크롤러가 페이지마다 시도/성공, 경기 수, 요소 추출 실패, 대체 선택자 사용, 소요 시간을 기록
+- 로컬 SQLite(CRAWL_HEALTH_DB, 기본 crawl_health.sqlite3)에 종목/일자별 합계와 소요 시간 히스토그램으로 누적
+  (여러 프로세스가 동시에 기록해도 됨, CRAWL_HEALTH_DB=off 이면 기록하지 않음)
+- summary로 일자별 추이와 성공률 하락 / 지연 증가 / 경기 수 감소 / 대체 선택자 사용(레이아웃 변경 의심) 경고 출력
+
+사용법:
+    python crawl_health.py summary [--days 14] [--sports kbo volleyball] [--db crawl_health.sqlite3]
+"""
+
+import os
+import sqlite3
+from datetime import datetime, timedelta
+from typing import List, Dict, Any, Optional
+
+DEFAULT_DB = 'crawl_health.sqlite3'
+
+# 소요 시간 히스토그램 버킷 상한 (초, 마지막 버킷은 그 이상 전부)
+LATENCY_BUCKETS = (2, 5, 10, 15, 20, 30, 60, 120)
+
+BUCKET_COLUMNS = [f'le_{bound}' for bound in LATENCY_BUCKETS] + ['le_inf']
+
+COUNTER_COLUMNS = ['pages', 'succeeded', 'games', 'elements', 'extract_failures', 'fallback', 'seconds_sum']
+
+# 추이 경고 기준 (최근 RECENT_DAYS일 vs 그 이전 BASELINE_DAYS일)
+RECENT_DAYS = 3
+BASELINE_DAYS = 7
+SUCCESS_RATE_DROP = 0.1
+GAMES_PER_PAGE_DROP = 0.5
+P95_INCREASE = 0.5
+
+def db_path() -> Optional[str]:
+    """지표 DB 경로 (기록하지 않도록 설정했으면 None)"""
+    path = os.getenv('CRAWL_HEALTH_DB', DEFAULT_DB)
+    if not path or path.lower() in ('0', 'off', 'false'):
+        return None
+    return path
+
+def connect(path: str) -> sqlite3.Connection:
+    connection = sqlite3.connect(path, timeout=30)
+    connection.row_factory = sqlite3.Row
+    columns = ', '.join(f'{column} {"REAL" if column == "seconds_sum" else "INTEGER"} NOT NULL DEFAULT 0'
+                        for column in COUNTER_COLUMNS + BUCKET_COLUMNS)
+    connection.execute(f"""
+        CREATE TABLE IF NOT EXISTS crawl_health (
+            sport TEXT NOT NULL,
+            day TEXT NOT NULL,
+            {columns},
+            seconds_max REAL NOT NULL DEFAULT 0,
+            PRIMARY KEY (sport, day)
+        )
+    """)
+    return connection
+
+def bucket_column(seconds: float) -> str:
+    for bound, column in zip(LATENCY_BUCKETS, BUCKET_COLUMNS):
+        if seconds <= bound:
+            return column
+    return BUCKET_COLUMNS[-1]
+
+def record_page(sport: str, seconds: float, games: Optional[List[Dict[str, Any]]] = None, success: bool = True,
+                stats: Optional[Dict[str, Any]] = None, day: Optional[str] = None):
+    """
+    페이지 한 번 크롤링 결과 누적 (지표 기록 실패는 크롤링에 영향을 주지 않음)
+
+    Args:
+        seconds: 페이지 접속부터 파싱까지 소요 시간
+        success: 페이지를 받아 파싱까지 마쳤는지 (경기 요소를 전혀 찾지 못했으면 False)
+        stats: 파서가 채운 값 (elements: 경기 요소 수, extract_failures: 추출 실패 수, fallback: 대체 선택자 사용 여부)
+        day: 집계 일자 (기본: 오늘)
+    """
+    path = db_path()
+    if path is None:
+        return
+    
+    stats = stats or {}
+    values = {
+        'pages': 1,
+        'succeeded': 1 if success else 0,
+        'games': len(games or []),
+        'elements': int(stats.get('elements', 0)),
+        'extract_failures': int(stats.get('extract_failures', 0)),
+        'fallback': 1 if stats.get('fallback') else 0,
+        'seconds_sum': seconds,
+        bucket_column(seconds): 1
+    }
+    columns = list(values)
+    updates = ', '.join(f'{column} = {column} + excluded.{column}' for column in columns)
+    
+    try:
+        connection = connect(path)
+        try:
+            with connection:
+                connection.execute(
+                    f"INSERT INTO crawl_health (sport, day, {', '.join(columns)}, seconds_max) "
+                    f"VALUES (?, ?, {', '.join('?' for _ in columns)}, ?) "
+                    f"ON CONFLICT (sport, day) DO UPDATE SET {updates}, "
+                    f"seconds_max = MAX(seconds_max, excluded.seconds_max)",
+                    [sport, day or datetime.now().strftime('%Y-%m-%d'), *values.values(), seconds]
+                )
+        finally:
+            connection.close()
+    except sqlite3.Error as e:
+        print(f"⚠️ 크롤링 지표 기록 실패: {e}")
+
+def histogram_percentile(buckets: List[int], fraction: float) -> Optional[float]:
+    """히스토그램 버킷 개수로 백분위 추정 (버킷 안에서는 선형 보간)"""
+    total = sum(buckets)
+    if not total:
+        return None
+    target = total * fraction
+    cumulative = 0
+    lower = 0.0
+    for bound, count in zip(list(LATENCY_BUCKETS) + [None], buckets):
+        if count and cumulative + count >= target:
+            if bound is None:
+                return float(LATENCY_BUCKETS[-1])
+            return lower + (bound - lower) * (target - cumulative) / count
+        cumulative += count
+        lower = float(bound) if bound is not None else lower
+    return float(LATENCY_BUCKETS[-1])
+
+def summarize_row(row: Dict[str, Any]) -> Dict[str, Any]:
+    """집계 행 → 비율/백분위"""
+    buckets = [row[column] for column in BUCKET_COLUMNS]
+    pages = row['pages']
+    # 버킷 보간값이 실제 최댓값을 넘지 않도록
+    p50, p95 = (histogram_percentile(buckets, fraction) for fraction in (0.5, 0.95))
+    p50, p95 = (min(value, row['seconds_max']) if value is not None else None for value in (p50, p95))
+    return {
+        'sport': row['sport'],
+        'day': row['day'],
+        'pages': pages,
+        'success_rate': row['succeeded'] / pages if pages else None,
+        'games_per_page': row['games'] / pages if pages else None,
+        'extract_failure_rate': row['extract_failures'] / row['elements'] if row['elements'] else 0.0,
+        'fallback_rate': row['fallback'] / pages if pages else 0.0,
+        'mean_seconds': row['seconds_sum'] / pages if pages else None,
+        'p50': p50,
+        'p95': p95,
+        'max_seconds': row['seconds_max'],
+        'buckets': buckets
+    }
+
+def load_summary(path: str, days: int = 14, sports: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+    """최근 days일 종목/일자별 지표"""
+    since = (datetime.now() - timedelta(days=days - 1)).strftime('%Y-%m-%d')
+    connection = connect(path)
+    try:
+        rows = [dict(row) for row in connection.execute(
+            "SELECT * FROM crawl_health WHERE day >= ? ORDER BY sport, day", [since])]
+    finally:
+        connection.close()
+    return [summarize_row(row) for row in rows if not sports or row['sport'] in sports]
+
+def combine(rows: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """여러 일자 지표를 페이지 수 가중으로 합침"""
+    pages = sum(row['pages'] for row in rows)
+    if not pages:
+        return None
+    buckets = [sum(values) for values in zip(*(row['buckets'] for row in rows))]
+    return {
+        'success_rate': sum(row['success_rate'] * row['pages'] for row in rows) / pages,
+        'games_per_page': sum(row['games_per_page'] * row['pages'] for row in rows) / pages,
+        'fallback_rate': sum(row['fallback_rate'] * row['pages'] for row in rows) / pages,
+        'p95': histogram_percentile(buckets, 0.95)
+    }
+
+def detect_trends(rows: List[Dict[str, Any]]) -> List[str]:
+    """종목별 최근 RECENT_DAYS일과 그 이전 BASELINE_DAYS일 비교 경고"""
+    warnings = []
+    for sport in sorted({row['sport'] for row in rows}):
+        sport_rows = [row for row in rows if row['sport'] == sport]
+        days = sorted({row['day'] for row in sport_rows})
+        recent_days = set(days[-RECENT_DAYS:])
+        baseline_days = set(days[:-RECENT_DAYS][-BASELINE_DAYS:])
+        recent = combine([row for row in sport_rows if row['day'] in recent_days])
+        baseline = combine([row for row in sport_rows if row['day'] in baseline_days])
+        if recent is None:
+            continue
+        
+        if recent['fallback_rate'] > 0 and (baseline is None or baseline['fallback_rate'] == 0):
+            warnings.append(f"{sport}: 대체 선택자 사용 {recent['fallback_rate']:.0%} (레이아웃 변경 의심)")
+        if baseline is None:
+            continue
+        if baseline['success_rate'] - recent['success_rate'] >= SUCCESS_RATE_DROP:
+            warnings.append(f"{sport}: 성공률 하락 {baseline['success_rate']:.0%} → {recent['success_rate']:.0%}")
+        if baseline['games_per_page'] and recent['games_per_page'] <= baseline['games_per_page'] * (1 - GAMES_PER_PAGE_DROP):
+            warnings.append(f"{sport}: 페이지당 경기 수 감소 {baseline['games_per_page']:.1f} → {recent['games_per_page']:.1f}")
+        if baseline['p95'] and recent['p95'] and recent['p95'] >= baseline['p95'] * (1 + P95_INCREASE):
+            warnings.append(f"{sport}: p95 지연 증가 {baseline['p95']:.1f}초 → {recent['p95']:.1f}초")
+    return warnings
+
+def print_summary(rows: List[Dict[str, Any]]):
+    print(f"{'종목':<11} {'일자':<10} {'페이지':>6} {'성공률':>7} {'경기/페이지':>10} {'추출실패':>8} {'대체선택자':>9} {'p50':>6} {'p95':>6} {'최대':>6}")
+    print("-" * 96)
+    for row in rows:
+        p50 = f"{row['p50']:.1f}" if row['p50'] is not None else '-'
+        p95 = f"{row['p95']:.1f}" if row['p95'] is not None else '-'
+        print(f"{row['sport']:<11} {row['day']:<10} {row['pages']:>6} {row['success_rate']:>7.0%} "
+              f"{row['games_per_page']:>10.1f} {row['extract_failure_rate']:>8.1%} {row['fallback_rate']:>9.0%} "
+              f"{p50:>6} {p95:>6} {row['max_seconds']:>6.1f}")
+
+def main():
+    """메인 실행 함수"""
+    import argparse
+    
+    parser = argparse.ArgumentParser(description='크롤링 상태 지표')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    summary_parser = subparsers.add_parser('summary', help='종목/일자별 지표와 추이 경고')
+    summary_parser.add_argument('--days', type=int, default=14)
+    summary_parser.add_argument('--sports', nargs='+')
+    summary_parser.add_argument('--db', help='지표 DB 경로 (기본: CRAWL_HEALTH_DB 또는 crawl_health.sqlite3)')
+    args = parser.parse_args()
+    
+    path = args.db or db_path() or DEFAULT_DB
+    if not os.path.exists(path):
+        print(f"❌ 지표 DB가 없습니다: {path}")
+        return
+    
+    rows = load_summary(path, args.days, args.sports)
+    if not rows:
+        print(f"📭 최근 {args.days}일 기록이 없습니다.")
+        return
+    
+    print(f"🩺 크롤링 상태 (최근 {args.days}일, {path})")
+    print_summary(rows)
+    
+    warnings = detect_trends(rows)
+    print()
+    if warnings:
+        for warning in warnings:
+            print(f"⚠️ {warning}")
+    else:
+        print("✅ 추이 이상 없음")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+크롤러 로깅 설정
+- 경기 요소 단위 반복문의 print 대신 레벨이 있는 logging 사용 (CRAWL_LOG_LEVEL, 기본 INFO)
+- 메시지는 %s 인자로 넘겨 실제로 출력될 때만 문자열로 만듦 (DOM 요소를 str()/get_text()하지 않음)
+- HTML/텍스트 덤프는 별도 dump 로거로 N번째마다만 기록 (CRAWL_LOG_DUMP_EVERY, 0이면 끔)
+- 운영 환경은 CRAWL_LOG_LEVEL=WARNING CRAWL_LOG_DUMP_EVERY=200 처럼 조용히 + 가끔 덤프
+
+사용법:
+    from crawl_logging import get_logger, dump, element_html, element_text
+
+    logger = get_logger(__name__)
+    logger.debug("경기 후보: %s", element_text(element, 100))
+    dump(logger, "경기 %d HTML: %s", idx, element_html(element, 200))
+"""
+
+import itertools
+import logging
+import os
+import sys
+import threading
+from typing import Callable, Optional
+
+ROOT_LOGGER = 'crawl'
+
+# CRAWL_LOG_LEVEL 미지정 시 레벨
+DEFAULT_LEVEL = 'INFO'
+
+DEFAULT_FORMAT = '%(message)s'
+
+_lock = threading.Lock()
+_configured = False
+_dump_every = 0
+_dump_counter = itertools.count()
+
+class StdoutHandler(logging.StreamHandler):
+    """출력할 때마다 현재 sys.stdout에 기록 (redirect_stdout으로 바꾼 출력도 따라감)"""
+    
+    def __init__(self):
+        logging.Handler.__init__(self)
+    
+    @property
+    def stream(self):
+        return sys.stdout
+    
+    @stream.setter
+    def stream(self, value):
+        pass
+
+def configure(level: Optional[str] = None, dump_every: Optional[int] = None, fmt: Optional[str] = None):
+    """
+    크롤러 로거 설정 (지정하지 않은 항목은 환경 변수 사용)
+
+    CRAWL_LOG_LEVEL: DEBUG / INFO / WARNING / ERROR
+    CRAWL_LOG_DUMP_EVERY: DOM 덤프를 N번째마다 기록 (기본: DEBUG면 1, 아니면 0)
+    CRAWL_LOG_FORMAT: logging 포맷 (기본: 메시지만, 예: '%(asctime)s %(levelname)s %(message)s')
+    """
+    global _configured, _dump_every
+    level_name = (level or os.getenv('CRAWL_LOG_LEVEL') or DEFAULT_LEVEL).upper()
+    numeric_level = getattr(logging, level_name, None)
+    if not isinstance(numeric_level, int):
+        print(f"⚠️ 알 수 없는 CRAWL_LOG_LEVEL={level_name}, {DEFAULT_LEVEL} 사용")
+        numeric_level = getattr(logging, DEFAULT_LEVEL)
+    
+    if dump_every is None:
+        env_value = os.getenv('CRAWL_LOG_DUMP_EVERY', '')
+        dump_every = int(env_value) if env_value.strip() else (1 if numeric_level <= logging.DEBUG else 0)
+    
+    with _lock:
+        root = logging.getLogger(ROOT_LOGGER)
+        if not root.handlers:
+            root.addHandler(StdoutHandler())
+        for handler in root.handlers:
+            handler.setFormatter(logging.Formatter(fmt or os.getenv('CRAWL_LOG_FORMAT') or DEFAULT_FORMAT))
+        root.setLevel(numeric_level)
+        root.propagate = False
+        
+        # 덤프는 본 레벨과 무관하게 샘플 비율로만 켜고 끔
+        dump_root = logging.getLogger(f'{ROOT_LOGGER}.dump')
+        dump_root.setLevel(logging.DEBUG if dump_every > 0 else logging.CRITICAL + 1)
+        _dump_every = max(0, dump_every)
+        _configured = True
+
+def get_logger(name: str) -> logging.Logger:
+    """모듈별 로거 (crawl.<모듈명>)"""
+    if not _configured:
+        configure()
+    return logging.getLogger(f'{ROOT_LOGGER}.{name}')
+
+def dump_logger(logger: logging.Logger) -> logging.Logger:
+    return logging.getLogger(f'{ROOT_LOGGER}.dump.{logger.name[len(ROOT_LOGGER) + 1:]}')
+
+def dump(logger: logging.Logger, message: str, *args):
+    """DOM/텍스트 덤프를 CRAWL_LOG_DUMP_EVERY번째마다 한 번만 기록 (건너뛴 호출은 인자를 문자열로 만들지 않음)"""
+    if not _dump_every or next(_dump_counter) % _dump_every:
+        return
+    dump_logger(logger).debug(message, *args)
+
+class LazyText:
+    """출력될 때만 계산되는 로그 인자 (logging이 %s 포맷할 때 str() 호출)"""
+    
+    __slots__ = ('func',)
+    
+    def __init__(self, func: Callable[[], object]):
+        self.func = func
+    
+    def __str__(self) -> str:
+        return str(self.func())
+
+def truncate(text: str, limit: Optional[int]) -> str:
+    return text if limit is None or len(text) <= limit else text[:limit] + '...'
+
+def element_html(element, limit: Optional[int] = 200) -> LazyText:
+    """요소 HTML (출력 시에만 직렬화)"""
+    return LazyText(lambda: truncate(str(element), limit))
+
+def element_text(element, limit: Optional[int] = None) -> LazyText:
+    """요소 텍스트 (출력 시에만 추출) - 이미 추출한 문자열이면 그대로 잘라서 사용"""
+    if isinstance(element, str):
+        return LazyText(lambda: truncate(element, limit))
+    return LazyText(lambda: truncate(element.get_text(strip=True), limit))
@@ -0,0 +1,271 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+상주형 크롤링 스케줄러
+- (스포츠, 날짜) 작업을 다음 실행 시각 기준 우선순위 큐(heapq)로 관리
+- 진행 중인 날짜는 몇 분마다, 예정된 날짜는 하루 몇 번, 종료된 날짜는 다시 크롤링하지 않음
+- 스포츠별 크롬 드라이버를 작업 간에 재사용
+- --queue 지정 시 직접 크롤링하지 않고 SQLite 작업 큐에 넣고, 워커(job_queue.py worker) 결과를 받아 재스케줄
+
+사용법:
+    python crawl_scheduler.py --sports kbo volleyball epl --days-back 1 --days-ahead 7
+    python crawl_scheduler.py --queue crawl_jobs.db  (+ 워커 여러 개: python job_queue.py worker)
+"""
+
+import heapq
+import itertools
+import time
+from datetime import datetime, timedelta, timezone
+from typing import List, Dict, Any, Optional, Tuple
+
+from browser_session import BrowserSession
+from jsonl_report import JsonlReportWriter
+from profiling import profiled
+from sport_registry import get_sport, load_crawler
+
+# 경기 날짜/시각 기준 (서버 로컬 시간대와 무관하게 KST로 비교)
+KST = timezone(timedelta(hours=9))
+
+# 날짜 상태별 재크롤링 간격 (초, None이면 다시 크롤링하지 않음)
+POLL_INTERVALS = {
+    'live': 3 * 60,          # 진행 중: 3분
+    'upcoming': 6 * 60 * 60, # 예정: 하루 4번
+    'final': None            # 종료: 다시 크롤링하지 않음
+}
+
+# 같은 시각에 실행할 작업이 여러 개면 진행 중 → 예정 → 처음 순으로
+STATE_PRIORITY = {'live': 0, 'upcoming': 1, 'new': 2}
+
+# 종료 처리되지 않은 경기라도 이 기간이 지나면 더 이상 크롤링하지 않음
+STALE_AFTER = timedelta(days=2)
+
+# 경기 시작 후 이 시간 동안은 진행 중으로 간주
+LIVE_WINDOW = timedelta(hours=4)
+
+RETRY_BASE_SECONDS = 5 * 60
+RETRY_MAX_SECONDS = 60 * 60
+
+def game_start(sport: str, game: Dict[str, Any]) -> Optional[datetime]:
+    """경기 시작 시각 (KST, 시간대 포함)"""
+    try:
+        if sport == 'kbo':
+            return datetime.strptime(f"{game['date']} {game['time']}", '%Y-%m-%d %H:%M').replace(tzinfo=KST)
+        start = datetime.fromisoformat(game['start_time'])
+    except (KeyError, TypeError, ValueError):
+        return None
+    # 시간대가 없는 값은 KST로 간주
+    return start.replace(tzinfo=KST) if start.tzinfo is None else start.astimezone(KST)
+
+def game_is_final(sport: str, game: Dict[str, Any]) -> bool:
+    """경기가 끝났는지 (취소/연기 포함)"""
+    if sport == 'kbo':
+        return game.get('status') in ('종료', '취소', '연기')
+    return bool(game.get('is_closed'))
+
+def game_is_live(sport: str, game: Dict[str, Any], now: datetime) -> bool:
+    """경기가 진행 중인지"""
+    if sport == 'kbo' and game.get('status') == '진행중':
+        return True
+    start = game_start(sport, game)
+    return start is not None and not game_is_final(sport, game) and start <= now < start + LIVE_WINDOW
+
+def classify_date(sport: str, date: str, games: List[Dict[str, Any]], now: datetime) -> Tuple[str, Optional[datetime]]:
+    """
+    크롤링 결과로 날짜 상태 판정
+
+    Args:
+        now: 현재 시각 (KST, 시간대 포함)
+
+    Returns:
+        (상태, 다음으로 시작할 경기 시각)
+    """
+    day = datetime.strptime(date, '%Y-%m-%d').replace(tzinfo=KST)
+    
+    if any(game_is_live(sport, game, now) for game in games):
+        return 'live', None
+    
+    pending = [game for game in games if not game_is_final(sport, game)]
+    
+    # 모두 끝났거나, 경기 없이 지나간 날짜, 오래 지난 날짜
+    if (games and not pending) or (not games and day.date() < now.date()) or day + STALE_AFTER < now:
+        return 'final', None
+    
+    starts = [start for start in (game_start(sport, game) for game in pending) if start and start > now]
+    return 'upcoming', min(starts) if starts else None
+
+class CrawlScheduler:
+    """(스포츠, 날짜) 작업 우선순위 큐 스케줄러"""
+    
+    def __init__(self, sports: List[str], days_back: int = 1, days_ahead: int = 7,
+                 report_path: Optional[str] = None, job_queue=None):
+        for sport in sports:
+            get_sport(sport)
+        
+        self.sports = sports
+        self.days_back = days_back
+        self.days_ahead = days_ahead
+        self.queue: List[Tuple[float, int, int, str, str]] = []
+        self.states: Dict[Tuple[str, str], str] = {}
+        self.failures: Dict[Tuple[str, str], int] = {}
+        self.sessions = {sport: BrowserSession() for sport in sports}
+        self.crawlers = {}
+        self._sequence = itertools.count()
+        self.report = JsonlReportWriter(report_path, 'crawl_scheduler', sports=sports) if report_path else None
+        self.job_queue = job_queue
+    
+    def schedule(self, sport: str, date: str, run_at: float, state: str = 'new'):
+        """작업 추가 (run_at: time.time() 기준)"""
+        heapq.heappush(self.queue, (run_at, STATE_PRIORITY.get(state, 2), next(self._sequence), sport, date))
+        self.states[(sport, date)] = state
+    
+    def seed(self, now: Optional[datetime] = None):
+        """크롤링 구간 안의 새 날짜 작업 추가 (이미 등록된 날짜는 건너뜀)"""
+        now = now or datetime.now(KST)
+        for offset in range(-self.days_back, self.days_ahead + 1):
+            date = (now + timedelta(days=offset)).strftime('%Y-%m-%d')
+            for sport in self.sports:
+                if (sport, date) not in self.states:
+                    self.schedule(sport, date, time.time())
+    
+    def run_job(self, sport: str, date: str) -> Optional[List[Dict[str, Any]]]:
+        """작업 하나 실행 (실패 시 None)"""
+        if sport not in self.crawlers:
+            self.crawlers[sport] = load_crawler(sport)
+        
+        session = self.sessions[sport]
+        try:
+            games = self.crawlers[sport](date, driver=session.acquire(sport))
+        except Exception as e:
+            print(f"❌ {sport} {date} 크롤링 실패: {e}")
+            session.reset()
+            return None
+        
+        # 크롤러는 오류 시 None을 반환, 결과가 없으면 드라이버 상태도 확인
+        if not games and not session.is_alive():
+            print(f"❌ {sport} {date}: 드라이버 응답 없음, 재시작 예정")
+            session.reset()
+            return None
+        
+        if games is None:
+            print(f"❌ {sport} {date} 크롤링 실패")
+        return games
+    
+    def reschedule(self, sport: str, date: str, games: Optional[List[Dict[str, Any]]]):
+        """크롤링 결과에 따라 다음 실행 시각 결정"""
+        key = (sport, date)
+        now = datetime.now(KST)
+        
+        if games is None:
+            failures = self.failures.get(key, 0) + 1
+            self.failures[key] = failures
+            delay = min(RETRY_BASE_SECONDS * 2 ** (failures - 1), RETRY_MAX_SECONDS)
+            self.schedule(sport, date, time.time() + delay, self.states.get(key, 'new'))
+            print(f"🔁 {sport} {date}: {delay // 60}분 후 재시도 ({failures}회 실패)")
+            return
+        
+        self.failures.pop(key, None)
+        state, next_start = classify_date(sport, date, games, now)
+        interval = POLL_INTERVALS[state]
+        
+        if self.report:
+            self.report.write('job', sport=sport, date=date, state=state, game_count=len(games), games=games)
+        
+        if interval is None:
+            self.states[key] = state
+            print(f"🏁 {sport} {date}: 종료 ({len(games)}개 경기), 더 이상 크롤링하지 않음")
+            return
+        
+        run_at = now + timedelta(seconds=interval)
+        # 예정된 경기가 폴링 간격보다 먼저 시작하면 시작 시각에 맞춰 실행
+        if next_start and next_start < run_at:
+            run_at = next_start
+        
+        self.schedule(sport, date, run_at.timestamp(), state)
+        print(f"⏰ {sport} {date}: {state}, 다음 크롤링 {run_at.strftime('%m-%d %H:%M')}")
+    
+    def run_pending(self) -> int:
+        """실행 시각이 된 작업 모두 실행, 실행한 작업 수 반환"""
+        executed = 0
+        while self.queue and self.queue[0][0] <= time.time():
+            _, _, _, sport, date = heapq.heappop(self.queue)
+            
+            # 작업 큐 모드: 워커에게 넘기고 결과는 collect()에서 처리
+            if self.job_queue is not None:
+                self.job_queue.enqueue(sport, date, 'crawl')
+                print(f"📤 {sport} {date} 작업 큐에 추가 ({self.states.get((sport, date))})")
+                executed += 1
+                continue
+            
+            print(f"\n🏃 {sport} {date} 크롤링 ({self.states.get((sport, date))})")
+            games = self.run_job(sport, date)
+            self.reschedule(sport, date, games)
+            executed += 1
+        return executed
+    
+    def collect(self) -> int:
+        """작업 큐에서 끝난 작업 결과를 받아 재스케줄 (dead 작업은 실패로 처리)"""
+        if self.job_queue is None:
+            return 0
+        
+        finished = self.job_queue.take_finished()
+        for job in finished:
+            if job['mode'] != 'crawl' or (job['sport'], job['date']) not in self.states:
+                continue
+            games = job['result']['games'] if job['status'] == 'done' and job['result'] else None
+            self.reschedule(job['sport'], job['date'], games)
+        return len(finished)
+    
+    def run_forever(self, idle_sleep: float = 30):
+        """상주 실행 (날짜가 바뀌면 새 날짜 작업 추가)"""
+        print(f"🚀 크롤링 스케줄러 시작: {', '.join(self.sports)} (-{self.days_back}일 ~ +{self.days_ahead}일)")
+        print("=" * 60)
+        
+        try:
+            while True:
+                self.seed()
+                self.collect()
+                self.run_pending()
+                
+                wait = idle_sleep
+                if self.queue:
+                    wait = max(0, min(idle_sleep, self.queue[0][0] - time.time()))
+                time.sleep(wait)
+        except KeyboardInterrupt:
+            print("\n🛑 스케줄러 종료")
+        finally:
+            self.close()
+    
+    def close(self):
+        for session in self.sessions.values():
+            session.close()
+        if self.report:
+            summary = {}
+            for state in self.states.values():
+                summary[state] = summary.get(state, 0) + 1
+            self.report.close({'date_states': summary})
+
+@profiled
+def main():
+    """메인 실행 함수"""
+    import argparse
+    
+    parser = argparse.ArgumentParser(description='상주형 크롤링 스케줄러')
+    parser.add_argument('--sports', nargs='+', default=['kbo', 'volleyball', 'epl'],
+                        choices=['kbo', 'volleyball', 'epl'])
+    parser.add_argument('--days-back', type=int, default=1, help='오늘 이전 며칠까지 크롤링')
+    parser.add_argument('--days-ahead', type=int, default=7, help='오늘 이후 며칠까지 크롤링')
+    parser.add_argument('--report', help='작업 결과 JSONL 파일 (.gz면 압축)')
+    parser.add_argument('--queue', help='SQLite 작업 큐 파일 (지정 시 워커 프로세스가 크롤링)')
+    args = parser.parse_args()
+    
+    job_queue = None
+    if args.queue:
+        from job_queue import JobQueue
+        job_queue = JobQueue(args.queue)
+    
+    scheduler = CrawlScheduler(args.sports, args.days_back, args.days_ahead, args.report, job_queue)
+    scheduler.run_forever()
+
+if __name__ == "__main__":
+    main()
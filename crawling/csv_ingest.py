@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+CSV 스트리밍 적재
+- CSV 행을 한 줄씩 읽어 변환/검증하고 일정 크기(CSV_INGEST_CHUNK_SIZE, 기본 200행) 묶음으로 전달
+- 쓰기(Supabase 삽입)는 별도 쓰레드에서 하고, 그동안 다음 묶음을 읽음
+- 읽기와 쓰기 사이 큐 크기를 제한해 파일이 아무리 커도 메모리에는 몇 묶음만 올라감
+- 첫 묶음이 차는 즉시 쓰기 시작 (전체 파일을 목록으로 만든 뒤 삽입하지 않음)
+
+사용법:
+    from csv_ingest import ingest_csv, insert_chunk
+
+    result = ingest_csv(path, transform, lambda chunk: insert_chunk(get_supabase(), 'volleyball_games', chunk, sport='volleyball'))
+"""
+
+import csv
+import os
+import queue
+import threading
+import time
+from collections import Counter
+from typing import List, Dict, Any, Optional, Callable, Iterator, Tuple
+
+from instrumentation import span
+
+DEFAULT_CHUNK_SIZE = 200
+
+# 읽기 쓰레드가 쓰기보다 앞서 쌓아 둘 수 있는 묶음 수
+DEFAULT_QUEUE_DEPTH = 2
+
+# (CSV 행 번호, 삽입할 레코드)
+Chunk = List[Tuple[int, Dict[str, Any]]]
+
+def chunk_size_from_env() -> int:
+    return max(1, int(os.getenv('CSV_INGEST_CHUNK_SIZE', DEFAULT_CHUNK_SIZE)))
+
+def iter_csv_rows(path: str) -> Iterator[Tuple[int, Dict[str, str]]]:
+    """CSV 행을 (행 번호, 행) 으로 하나씩 반환"""
+    with open(path, 'r', encoding='utf-8', newline='') as file:
+        yield from enumerate(csv.DictReader(file), 1)
+
+def iter_chunks(rows: Iterator[Tuple[int, Dict[str, str]]],
+                transform: Callable[[int, Dict[str, str]], Optional[Dict[str, Any]]],
+                chunk_size: int, counts: Counter) -> Iterator[Chunk]:
+    """
+    행을 변환/검증해 chunk_size개씩 묶어서 반환
+
+    transform이 None을 반환하면 제외 (사유 출력은 transform에서), 예외는 해당 행만 제외
+    """
+    chunk: Chunk = []
+    for row_num, row in rows:
+        counts['rows'] += 1
+        try:
+            record = transform(row_num, row)
+        except Exception as e:
+            print(f"⚠️ {row_num}행 변환 실패로 제외: {e}")
+            record = None
+        if record is None:
+            counts['rejected'] += 1
+            continue
+        chunk.append((row_num, record))
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+def ingest_csv(path: str, transform: Callable[[int, Dict[str, str]], Optional[Dict[str, Any]]],
+               write_chunk: Callable[[Chunk], Dict[str, int]], chunk_size: Optional[int] = None,
+               queue_depth: int = DEFAULT_QUEUE_DEPTH) -> Dict[str, Any]:
+    """
+    CSV 파일을 묶음 단위로 읽으면서 쓰기 쓰레드로 넘김
+
+    Args:
+        transform: (행 번호, CSV 행) → 삽입할 레코드 (제외하면 None)
+        write_chunk: 묶음 하나 쓰기 → 결과별 개수 (예: {'success': 198, 'error': 2})
+
+    Returns:
+        rows / rejected / chunks / written(결과별 합계) / seconds
+    """
+    chunk_size = chunk_size or chunk_size_from_env()
+    counts: Counter = Counter()
+    written: Counter = Counter()
+    chunks = queue.Queue(maxsize=max(1, queue_depth))
+    
+    def writer():
+        while True:
+            chunk = chunks.get()
+            if chunk is None:
+                return
+            try:
+                written.update(write_chunk(chunk))
+            except Exception as e:
+                print(f"❌ {chunk[0][0]}~{chunk[-1][0]}행 쓰기 실패: {e}")
+                written['error'] += len(chunk)
+    
+    started = time.perf_counter()
+    thread = threading.Thread(target=writer, name='csv-ingest-writer', daemon=True)
+    thread.start()
+    try:
+        for chunk in iter_chunks(iter_csv_rows(path), transform, chunk_size, counts):
+            counts['chunks'] += 1
+            chunks.put(chunk)
+    finally:
+        chunks.put(None)
+        thread.join()
+    
+    return {
+        'rows': counts['rows'],
+        'rejected': counts['rejected'],
+        'chunks': counts['chunks'],
+        'written': dict(written),
+        'seconds': round(time.perf_counter() - started, 3)
+    }
+
+def insert_chunk(client, table: str, chunk: Chunk,
+                 insert_one: Optional[Callable[[int, Dict[str, Any]], bool]] = None,
+                 sport: Optional[str] = None) -> Dict[str, int]:
+    """
+    묶음을 한 번의 insert로 삽입, 오류가 나면(묶음 전체가 롤백됨) 행 단위로 다시 시도해 실패한 행만 골라냄
+
+    insert_one: 행 단위 재시도 함수 (기본: 같은 테이블에 한 행 insert)
+    sport: span 태그 (insert 요청마다 supabase_insert span 기록)
+    """
+    tags = {'sport': sport, 'table': table} if sport else {'table': table}
+    try:
+        with span('supabase_insert', **tags):
+            result = client.table(table).insert([record for _, record in chunk]).execute()
+        inserted = len(result.data or [])
+        if inserted == len(chunk):
+            print(f"✅ {chunk[0][0]}~{chunk[-1][0]}행: {inserted}개 업로드 완료")
+        else:
+            # 이미 삽입됐을 수 있으므로 재시도하지 않음 (기존 행 단위 삽입과 같이 응답 없는 행은 실패로 집계)
+            print(f"⚠️ {chunk[0][0]}~{chunk[-1][0]}행: 응답 데이터 {inserted}/{len(chunk)}개")
+        return {'success': inserted, 'error': len(chunk) - inserted}
+    except Exception as e:
+        print(f"⚠️ {chunk[0][0]}~{chunk[-1][0]}행: 묶음 삽입 실패 ({e}), 행 단위로 재시도")
+    
+    def insert_row(row_num: int, record: Dict[str, Any]) -> bool:
+        try:
+            with span('supabase_insert', **tags):
+                data = client.table(table).insert(record).execute().data
+            if data:
+                return True
+            print(f"❌ {row_num}행: 업로드 실패 - 응답 데이터 없음")
+        except Exception as e:
+            print(f"❌ {row_num}행: {record.get('away_team', 'Unknown')} vs {record.get('home_team', 'Unknown')} - {e}")
+        return False
+    
+    counts = Counter()
+    for row_num, record in chunk:
+        counts['success' if (insert_one or insert_row)(row_num, record) else 'error'] += 1
+    return dict(counts)
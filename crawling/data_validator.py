@@ -2,187 +2,299 @@
 # -*- coding: utf-8 -*-
 
 import csv
-import json
+import os
 import re
+import sys
 from datetime import datetime
 from typing import List, Dict, Any, Optional
 
+from jsonl_report import JsonlReportWriter
+from profiling import profiled
+from team_aliases import get_stadium_index
+from validation_rules import RULE_SETS, get_rule_set
+
 class KBODataValidator:
     def __init__(self):
-        """KBO 데이터 검증 및 정제 시스템 초기화"""
+        """KBO 데이터 검증 및 정제 시스템 초기화 (validation_rules의 KBO 규칙 세트 사용)"""
+        
+        self.rules = get_rule_set('kbo')
+        spec = RULE_SETS['kbo']
         
         # KBO 팀 정규화
-        self.valid_teams = {
-            'KIA', 'KT', 'LG', 'NC', 'SSG',
-            '두산', '롯데', '삼성', '한화', '키움'
-        }
+        self.valid_teams = self.rules.teams
         
         # 구장 매핑
-        self.stadium_mapping = {
-            'KIA': '광주-기아 챔피언스 필드',
-            'KT': '수원 KT위즈파크',
-            'LG': '서울 잠실야구장',
-            'NC': '창원 NC파크',
-            'SSG': '인천 SSG랜더스필드',
-            '두산': '서울 잠실야구장',
-            '롯데': '부산 사직야구장',
-            '삼성': '대구 삼성라이온즈파크',
-            '한화': '대전 한화생명이글스파크',
-            '키움': '서울 고척스카이돔'
-        }
+        self.stadium_mapping = spec['stadiums']
         
         # 유효한 결과 값
-        self.valid_results = {'0', '1', '2', None}  # 무승부, 홈팀승, 원정팀승, 예정
+        self.valid_results = set(spec['result_labels'].values()) | {None}  # 무승부, 홈팀승, 원정팀승, 예정
         
         # 유효한 상태 값
-        self.valid_statuses = {'예정', '진행중', '종료', '취소', '연기'}
-        
-        # 실제 2024년 8월 31일 KBO 경기 결과 (검증용)
-        self.reference_games = {
-            ('LG', '삼성'): {'homeScore': 5, 'awayScore': 3, 'result': '1'},
-            ('KT', 'SSG'): {'homeScore': 7, 'awayScore': 4, 'result': '1'},
-            ('두산', 'KIA'): {'homeScore': 3, 'awayScore': 6, 'result': '2'},
-            ('NC', '롯데'): {'homeScore': 8, 'awayScore': 2, 'result': '1'},
-            ('한화', '키움'): {'homeScore': 4, 'awayScore': 7, 'result': '2'}
-        }
+        self.valid_statuses = spec['statuses']
+        
+        # 실제 경기 결과 (날짜별, 검증용)
+        self.reference_games = spec['reference_results']
     
     def validate_game(self, game: Dict[str, Any]) -> Dict[str, Any]:
-        """단일 경기 데이터 검증 및 정제"""
-        validated_game = game.copy()
-        issues = []
+        """단일 경기 데이터 검증 및 정제 (컴파일된 KBO 규칙으로 한 번에 검증)"""
+        return self.rules.validate(game)
+    
+    def normalize_team_name(self, team_name: str) -> str:
+        """팀명 정규화"""
+        return self.rules.normalize_team(team_name)
+    
+    def validate_dataframe(self, df) -> Dict[str, Any]:
+        """DataFrame 일괄 검증 (validate_games_list와 같은 규칙을 컬럼 단위로 적용)
+
+        행 단위 경로(validate_game)가 기준 구현이며, 반환 형식과 이슈 목록은
+        validate_games_list와 동일하다. 팀명/점수/날짜 변환은 고유값마다 한 번만 계산한다.
+        """
+        import numpy as np
+        import pandas as pd
+        
+        total = len(df)
+        print(f"🔍 {total}개 경기 데이터 일괄 검증 시작 (DataFrame 모드)")
+        print("-" * 50)
         
-        # 1. 필수 필드 검증
-        required_fields = ['date', 'homeTeam', 'awayTeam']
-        for field in required_fields:
-            if field not in validated_game or not validated_game[field]:
-                issues.append(f"필수 필드 누락: {field}")
-                return {'game': validated_game, 'issues': issues, 'valid': False}
+        original_columns = list(df.columns)
+        df = df.astype(object)
+        df = df.where(df.notna(), None).reset_index(drop=True)
+        
+        for column in ['date', 'homeTeam', 'awayTeam', 'homeScore', 'awayScore',
+                       'result', 'status', 'time', 'stadium']:
+            if column not in df.columns:
+                df[column] = None
+        
+        def map_unique(series, func):
+            # 고유값마다 한 번만 func 계산 후 컬럼 전체에 매핑 (None은 그대로 유지)
+            codes, uniques = pd.factorize(series)
+            results = np.empty(len(uniques) + 1, dtype=object)
+            for i, value in enumerate(uniques):
+                results[i] = func(value)
+            return pd.Series(results[codes], index=series.index, dtype=object)
+        
+        def issue_column(mask, *parts):
+            # 이슈가 있는 행에 대해서만 메시지 생성 (문자열은 그대로, 컬럼 값은 str 변환)
+            column = pd.Series(None, index=df.index, dtype=object)
+            if mask.any():
+                message = ''
+                for part in parts:
+                    message = message + (part[mask].map(str) if isinstance(part, pd.Series) else part)
+                column[mask] = message
+            return column
+        
+        def parse_time_parts(value):
+            time_match = re.match(r'^(\d{1,2}):(\d{2})', value) if isinstance(value, str) else None
+            return (int(time_match.group(1)), int(time_match.group(2))) if time_match else None
+        
+        spec = self.rules.spec
+        low, high = spec['score_range']
+        labels = spec['result_labels']
+        issue_columns = []
+        
+        # 1. 필수 필드 검증 (누락 시 해당 행은 이후 규칙을 적용하지 않음)
+        missing_field = pd.Series(None, index=df.index, dtype=object)
+        for field in reversed(['date', 'homeTeam', 'awayTeam']):
+            if field in original_columns:
+                present = df[field].map(bool)
+            else:
+                present = pd.Series(False, index=df.index)
+            missing_field[~present] = field
+        early = missing_field.notna()
+        live = ~early
+        issue_columns.append(issue_column(early, "필수 필드 누락: ", missing_field))
         
         # 2. 팀명 검증 및 정규화
-        home_team = self.normalize_team_name(validated_game['homeTeam'])
-        away_team = self.normalize_team_name(validated_game['awayTeam'])
-        
-        if home_team not in self.valid_teams:
-            issues.append(f"유효하지 않은 홈팀: {validated_game['homeTeam']}")
-        else:
-            validated_game['homeTeam'] = home_team
+        home_team = map_unique(df['homeTeam'].where(live, None), self.normalize_team_name)
+        away_team = map_unique(df['awayTeam'].where(live, None), self.normalize_team_name)
         
-        if away_team not in self.valid_teams:
-            issues.append(f"유효하지 않은 원정팀: {validated_game['awayTeam']}")
-        else:
-            validated_game['awayTeam'] = away_team
+        bad_home = live & ~home_team.isin(self.valid_teams)
+        bad_away = live & ~away_team.isin(self.valid_teams)
+        issue_columns.append(issue_column(bad_home, "유효하지 않은 홈팀: ", df['homeTeam']))
+        issue_columns.append(issue_column(bad_away, "유효하지 않은 원정팀: ", df['awayTeam']))
+        df.loc[live & ~bad_home, 'homeTeam'] = home_team[live & ~bad_home]
+        df.loc[live & ~bad_away, 'awayTeam'] = away_team[live & ~bad_away]
         
         # 3. 같은 팀끼리 경기 불가
-        if home_team == away_team:
-            issues.append(f"같은 팀끼리 경기 불가: {home_team}")
+        same_team = live & (home_team == away_team)
+        issue_columns.append(issue_column(same_team, "같은 팀끼리 경기 불가: ", home_team))
         
         # 4. 날짜 형식 검증
-        try:
-            datetime.strptime(validated_game['date'], '%Y-%m-%d')
-        except ValueError:
-            issues.append(f"잘못된 날짜 형식: {validated_game['date']}")
+        def is_valid_date(value):
+            try:
+                datetime.strptime(value, '%Y-%m-%d')
+                return True
+            except ValueError:
+                return False
+        
+        bad_date = live & (map_unique(df['date'].where(live, None), is_valid_date) == False)
+        issue_columns.append(issue_column(bad_date, "잘못된 날짜 형식: ", df['date']))
         
         # 5. 점수 검증 및 정제
-        home_score = validated_game.get('homeScore')
-        away_score = validated_game.get('awayScore')
+        invalid = object()
         
-        if home_score is not None and away_score is not None:
-            # 점수 범위 검증 (0-30 사이)
+        def to_int(value):
             try:
-                home_score = int(home_score)
-                away_score = int(away_score)
-                
-                if home_score < 0 or home_score > 30:
-                    issues.append(f"비정상적인 홈팀 점수: {home_score}")
-                    home_score = None
-                
-                if away_score < 0 or away_score > 30:
-                    issues.append(f"비정상적인 원정팀 점수: {away_score}")
-                    away_score = None
-                
-                validated_game['homeScore'] = home_score
-                validated_game['awayScore'] = away_score
-                
-                # 결과 재계산
-                if home_score is not None and away_score is not None:
-                    if home_score > away_score:
-                        validated_game['result'] = '1'  # 홈팀 승
-                    elif home_score < away_score:
-                        validated_game['result'] = '2'  # 원정팀 승
-                    else:
-                        validated_game['result'] = '0'  # 무승부
-                    
-                    validated_game['status'] = '종료'
-                
+                return int(value)
             except (ValueError, TypeError):
-                issues.append(f"잘못된 점수 형식: home={home_score}, away={away_score}")
-                validated_game['homeScore'] = None
-                validated_game['awayScore'] = None
+                return invalid
+        
+        has_scores = live & df['homeScore'].notna() & df['awayScore'].notna()
+        home_int = map_unique(df['homeScore'].where(has_scores, None), to_int)
+        away_int = map_unique(df['awayScore'].where(has_scores, None), to_int)
+        home_bad = has_scores & home_int.map(lambda value: value is invalid)
+        away_bad = has_scores & away_int.map(lambda value: value is invalid)
+        
+        # validate_game은 홈 점수 변환 성공 후 원정 점수에서 실패하면 변환된 홈 점수를 출력
+        score_error = home_bad | away_bad
+        home_display = df['homeScore'].where(home_bad, home_int)
+        issue_columns.append(issue_column(
+            score_error, "잘못된 점수 형식: home=", home_display, ", away=", df['awayScore']
+        ))
+        
+        scored = has_scores & ~score_error
+        home_numeric = pd.to_numeric(home_int.where(scored, None))
+        away_numeric = pd.to_numeric(away_int.where(scored, None))
+        home_range = scored & ((home_numeric < low) | (home_numeric > high))
+        away_range = scored & ((away_numeric < low) | (away_numeric > high))
+        issue_columns.append(issue_column(home_range, "비정상적인 홈팀 점수: ", home_int))
+        issue_columns.append(issue_column(away_range, "비정상적인 원정팀 점수: ", away_int))
+        
+        # 경기 시간이 점수로 잘못 파싱된 경우 (18:30 -> 18:30)
+        in_range = scored & ~home_range & ~away_range
+        time_as_score = pd.Series(False, index=df.index)
+        if spec.get('reject_time_as_score'):
+            time_parts = map_unique(df['time'].where(in_range, None), parse_time_parts)
+            time_as_score = in_range & pd.Series(
+                [parts is not None and parts == (home, away) for parts, home, away in zip(time_parts, home_int, away_int)],
+                index=df.index
+            )
+            issue_columns.append(issue_column(time_as_score, "시간이 점수로 잘못 저장됨: ", df['time']))
+        
+        df.loc[scored, 'homeScore'] = home_int.where(~home_range & ~time_as_score, None)[scored]
+        df.loc[scored, 'awayScore'] = away_int.where(~away_range & ~time_as_score, None)[scored]
+        df.loc[score_error, ['homeScore', 'awayScore']] = None
+        
+        # 결과 재계산 (종료 상태인 경기만, 진행 중/예정 경기 점수는 결과 없음)
+        valid_scores = in_range & ~time_as_score
+        finished = valid_scores & (df['status'] == spec['final_status'])
+        df.loc[valid_scores & ~finished, 'result'] = None
+        df.loc[finished & (home_numeric > away_numeric), 'result'] = labels['home']  # 홈팀 승
+        df.loc[finished & (home_numeric < away_numeric), 'result'] = labels['away']  # 원정팀 승
+        df.loc[finished & (home_numeric == away_numeric), 'result'] = labels['draw']  # 무승부
         
         # 6. 결과 검증
-        result = validated_game.get('result')
-        if result not in self.valid_results:
-            issues.append(f"유효하지 않은 결과: {result}")
-            validated_game['result'] = None
-        
-        # 7. 상태 검증
-        status = validated_game.get('status', '예정')
-        if status not in self.valid_statuses:
-            issues.append(f"유효하지 않은 상태: {status}")
-            validated_game['status'] = '예정'
-        
-        # 8. 시간 형식 검증
-        time_str = validated_game.get('time', '14:00')
-        if not re.match(r'^\d{1,2}:\d{2}$', time_str):
-            issues.append(f"잘못된 시간 형식: {time_str}")
-            validated_game['time'] = '14:00'
-        
-        # 9. 구장 정보 보정
-        if home_team in self.stadium_mapping:
-            validated_game['stadium'] = self.stadium_mapping[home_team]
-        
-        # 10. 실제 데이터와 비교 검증 (2024-08-31인 경우)
-        if validated_game['date'] == '2024-08-31':
-            match_key = (home_team, away_team)
-            reverse_key = (away_team, home_team)
-            
-            if match_key in self.reference_games:
-                ref = self.reference_games[match_key]
-                validated_game.update(ref)
-                issues.append("실제 데이터로 교체됨")
-            elif reverse_key in self.reference_games:
-                ref = self.reference_games[reverse_key]
-                validated_game.update({
-                    'homeScore': ref['awayScore'],
-                    'awayScore': ref['homeScore'],
-                    'result': '2' if ref['result'] == '1' else '1' if ref['result'] == '2' else '0'
-                })
-                issues.append("실제 데이터로 교체됨 (홈/원정 뒤바뀜)")
+        bad_result = live & df['result'].notna() & ~df['result'].isin(list(labels.values()))
+        issue_columns.append(issue_column(bad_result, "유효하지 않은 결과: ", df['result']))
+        df.loc[bad_result, 'result'] = None
+        
+        # 7. 상태 검증 (컬럼이 없으면 validate_game과 같이 기본 상태로 간주)
+        default_status = spec['default_status']
+        status = df['status'] if 'status' in original_columns else df['status'].fillna(default_status)
+        bad_status = live & ~status.isin(self.valid_statuses)
+        issue_columns.append(issue_column(bad_status, "유효하지 않은 상태: ", status))
+        df.loc[bad_status, 'status'] = default_status
+        
+        # 8. 시간 형식 검증 (값이 비어 있으면 잘못된 형식으로 처리)
+        default_time = spec['default_time']
+        time_pattern = re.compile(spec['time_pattern'])
+        time_values = df['time'] if 'time' in original_columns else df['time'].fillna(default_time)
+        time_ok = map_unique(time_values, lambda value: isinstance(value, str) and bool(time_pattern.match(value)))
+        bad_time = live & (time_ok != True)
+        issue_columns.append(issue_column(bad_time, "잘못된 시간 형식: ", time_values))
+        df.loc[bad_time, 'time'] = default_time
+        
+        # 9. 구장 정보 보정 (홈 구장을 모르는 팀이면 입력된 구장명만 대표 이름으로)
+        stadium = home_team.map(self.stadium_mapping)
+        has_stadium = live & stadium.notna()
+        df.loc[has_stadium, 'stadium'] = stadium[has_stadium]
+        other_stadium = live & ~has_stadium & df['stadium'].map(lambda value: isinstance(value, str))
+        if other_stadium.any():
+            stadium_index = get_stadium_index('kbo')
+            normalized = map_unique(df['stadium'].where(other_stadium, None), stadium_index.normalize)
+            df.loc[other_stadium, 'stadium'] = normalized[other_stadium]
+        
+        # 10. 실제 데이터와 비교 검증 (해당 날짜 행만 처리)
+        reference_issue = pd.Series(None, index=df.index, dtype=object)
+        reference_rows = df.index[live & df['date'].isin(list(self.reference_games))]
+        reference_updates = {}
+        for idx, date, home, away in zip(reference_rows, df['date'][reference_rows],
+                                         home_team[reference_rows], away_team[reference_rows]):
+            references = self.reference_games[date]
+            if (home, away) in references:
+                ref = references[(home, away)]
+                reference_updates[idx] = [ref['homeScore'], ref['awayScore'], ref['result']]
+                reference_issue[idx] = "실제 데이터로 교체됨"
+            elif (away, home) in references:
+                ref = references[(away, home)]
+                reference_updates[idx] = [
+                    ref['awayScore'], ref['homeScore'],
+                    labels['away'] if ref['result'] == labels['home'] else
+                    labels['home'] if ref['result'] == labels['away'] else labels['draw']
+                ]
+                reference_issue[idx] = "실제 데이터로 교체됨 (홈/원정 뒤바뀜)"
+        
+        if reference_updates:
+            df.loc[list(reference_updates), ['homeScore', 'awayScore', 'result']] = list(reference_updates.values())
         
         # 검증 결과
-        is_valid = len([issue for issue in issues if not issue.startswith("실제 데이터로")]) == 0
+        issue_frame = pd.concat(issue_columns, axis=1)
+        valid = issue_frame.isna().all(axis=1)
+        issue_frame[len(issue_columns)] = reference_issue
+        valid_count = int(valid.sum())
+        
+        # 원본에 없던 컬럼은 validate_game이 값을 채운 경우에만 남김
+        added_columns = [column for column in df.columns if column not in original_columns]
+        columns = list(df.columns)
+        validated_games = []
+        for values in zip(*(df[column].to_numpy() for column in columns)):
+            record = dict(zip(columns, values))
+            for column in added_columns:
+                if record[column] is None:
+                    del record[column]
+            validated_games.append(record)
         
-        return {
-            'game': validated_game,
-            'issues': issues,
-            'valid': is_valid
-        }
-    
-    def normalize_team_name(self, team_name: str) -> str:
-        """팀명 정규화"""
-        if not team_name:
-            return team_name
+        all_issues = []
+        invalid_rows = issue_frame[~valid]
+        for idx, row_issues in zip(invalid_rows.index, invalid_rows.to_numpy()):
+            for issue in row_issues:
+                if isinstance(issue, str):
+                    all_issues.append(f"경기 {idx + 1}: {issue}")
+        
+        # 중복 경기 검출 (팀 순서에 관계없이)
+        keyed = df[df['homeTeam'].map(bool) & df['awayTeam'].map(bool) & df['date'].map(bool)]
+        home_first = keyed['homeTeam'] <= keyed['awayTeam']
+        match_keys = pd.DataFrame({
+            'first': keyed['homeTeam'].where(home_first, keyed['awayTeam']),
+            'second': keyed['awayTeam'].where(home_first, keyed['homeTeam']),
+            'date': keyed['date']
+        })
+        duplicates = keyed[match_keys.duplicated(keep='first')]
+        duplicate_indices = list(duplicates.index)
+        
+        for idx, home, away in zip(duplicate_indices, duplicates['homeTeam'], duplicates['awayTeam']):
+            all_issues.append(f"경기 {idx + 1}: 중복 경기 - {away} vs {home}")
+        
+        duplicate_set = set(duplicate_indices)
+        final_games = [game for i, game in enumerate(validated_games) if i not in duplicate_set]
         
-        team_name = team_name.strip()
+        print(f"\n📊 검증 결과:")
+        print(f"   총 경기: {total}개")
+        print(f"   유효한 경기: {valid_count}개")
+        print(f"   중복 제거: {len(duplicate_indices)}개")
+        print(f"   최종 경기: {len(final_games)}개")
+        print(f"   총 이슈: {len(all_issues)}개")
         
-        # 팀명 매핑
-        team_mapping = {
-            'kt': 'KT', 'lg': 'LG', 'nc': 'NC', 'ssg': 'SSG',
-            'SK': 'SSG', '기아': 'KIA', 'Kiwoom': '키움', 'Nexen': '키움'
+        return {
+            'original_count': total,
+            'validated_games': final_games,
+            'valid_count': len(final_games),
+            'duplicate_count': len(duplicate_indices),
+            'issues': all_issues,
+            'success_rate': len(final_games) / total * 100 if total else 0
         }
-        
-        return team_mapping.get(team_name, team_name)
     
+    @profiled
     def validate_games_list(self, games: List[Dict[str, Any]]) -> Dict[str, Any]:
         """경기 리스트 전체 검증"""
         validated_games = []
@@ -244,6 +356,7 @@ class KBODataValidator:
             'success_rate': len(final_games) / len(games) * 100 if games else 0
         }
     
+    @profiled
     def load_and_validate_csv(self, csv_file: str) -> Dict[str, Any]:
         """CSV 파일 로드 및 검증"""
         print(f"📁 CSV 파일 로드: {csv_file}")
@@ -274,6 +387,113 @@ class KBODataValidator:
         
         return self.validate_games_list(games)
     
+    @profiled
+    def load_and_validate_csv_batch(self, csv_file: str) -> Dict[str, Any]:
+        """CSV 파일 로드 및 DataFrame 일괄 검증"""
+        import pandas as pd
+        
+        print(f"📁 CSV 파일 로드 (DataFrame 모드): {csv_file}")
+        
+        try:
+            # 빈 값을 None으로 변환 (load_and_validate_csv와 동일)
+            df = pd.read_csv(csv_file, dtype=str, keep_default_na=False, encoding='utf-8').astype(object)
+            df = df.where(df.notna() & (df != ''), None)
+            print(f"✅ {len(df)}개 경기 로드 완료")
+            
+        except FileNotFoundError:
+            print(f"❌ 파일을 찾을 수 없습니다: {csv_file}")
+            return {'error': 'File not found'}
+        except Exception as e:
+            print(f"❌ 파일 로드 오류: {e}")
+            return {'error': str(e)}
+        
+        return self.validate_dataframe(df)
+    
+    @profiled
+    def stream_validate_csv(self, csv_file: str, report_path: str) -> Dict[str, Any]:
+        """CSV를 한 행씩 검증하며 결과를 JSONL 리포트로 바로 기록 (경기/이슈를 메모리에 쌓지 않음)"""
+        print(f"📁 CSV 스트리밍 검증: {csv_file} → {report_path}")
+        
+        try:
+            file = open(csv_file, 'r', encoding='utf-8')
+        except FileNotFoundError:
+            print(f"❌ 파일을 찾을 수 없습니다: {csv_file}")
+            return {'error': 'File not found'}
+        
+        total = 0
+        valid_count = 0
+        final_count = 0
+        duplicate_count = 0
+        issue_count = 0
+        unique_matches = set()
+        
+        with file, JsonlReportWriter(report_path, 'validation', flush_every=100, source=csv_file) as report:
+            for i, row in enumerate(csv.DictReader(file), 1):
+                total = i
+                # 빈 값을 None으로 변환
+                game = {key: (None if value == '' else value) for key, value in row.items()}
+                validation_result = self.validate_game(game)
+                game = validation_result['game']
+                
+                if validation_result['valid']:
+                    valid_count += 1
+                else:
+                    for issue in validation_result['issues']:
+                        report.issue(f"경기 {i}: {issue}", row=i)
+                        issue_count += 1
+                
+                # 중복 경기 검출 (팀 순서에 관계없이, 먼저 나온 경기 유지)
+                home_team = game.get('homeTeam')
+                away_team = game.get('awayTeam')
+                date = game.get('date')
+                if home_team and away_team and date:
+                    match_key = tuple(sorted([home_team, away_team]) + [date])
+                    if match_key in unique_matches:
+                        duplicate_count += 1
+                        issue_count += 1
+                        report.issue(f"경기 {i}: 중복 경기 - {away_team} vs {home_team}", row=i, duplicate=True)
+                        continue
+                    unique_matches.add(match_key)
+                
+                report.game(game, row=i, valid=validation_result['valid'])
+                final_count += 1
+                
+                if i % 1000 == 0:
+                    print(f"   ⏳ {i}개 처리 (이슈 {issue_count}개)")
+            
+            summary = {
+                'original_count': total,
+                'valid_count': final_count,
+                'rule_valid_count': valid_count,
+                'duplicate_count': duplicate_count,
+                'issue_count': issue_count,
+                'success_rate': final_count / total * 100 if total else 0
+            }
+            report.close(summary)
+        
+        print(f"\n📊 스트리밍 검증 결과:")
+        print(f"   총 경기: {total}개")
+        print(f"   유효한 경기: {valid_count}개")
+        print(f"   중복 제거: {duplicate_count}개")
+        print(f"   최종 경기: {final_count}개")
+        print(f"   총 이슈: {issue_count}개")
+        
+        return summary
+    
+    def compare_validation_modes(self, csv_file: str) -> bool:
+        """행 단위 검증(기준)과 DataFrame 일괄 검증 결과가 같은지 확인"""
+        reference = self.load_and_validate_csv(csv_file)
+        batch = self.load_and_validate_csv_batch(csv_file)
+        
+        mismatches = [key for key in reference if reference.get(key) != batch.get(key)]
+        
+        if mismatches:
+            print(f"❌ {csv_file}: 검증 결과 불일치 ({', '.join(mismatches)})")
+            return False
+        
+        print(f"✅ {csv_file}: 행 단위/일괄 검증 결과 일치")
+        return True
+    
     def save_validated_data(self, validation_result: Dict[str, Any], output_prefix: str):
         """검증된 데이터 저장"""
         if 'error' in validation_result:
@@ -293,20 +513,21 @@ class KBODataValidator:
                 for game in games:
                     writer.writerow(game)
         
-        # JSON 저장
-        json_filename = f"{output_prefix}_validated_{timestamp}.json"
-        with open(json_filename, 'w', encoding='utf-8') as jsonfile:
-            json.dump({
-                'metadata': {
-                    'original_count': validation_result['original_count'],
-                    'valid_count': validation_result['valid_count'],
-                    'duplicate_count': validation_result['duplicate_count'],
-                    'success_rate': validation_result['success_rate'],
-                    'validated_at': datetime.now().isoformat()
-                },
-                'games': games,
-                'issues': validation_result['issues']
-            }, jsonfile, ensure_ascii=False, indent=2)
+        # JSON Lines 저장 (경기/이슈 한 줄씩, 마지막 줄에 요약)
+        json_filename = f"{output_prefix}_validated_{timestamp}.jsonl"
+        report = JsonlReportWriter(json_filename, 'validation', flush_every=500)
+        for summary in validation_result.get('file_summaries', []):
+            report.write('file', **summary)
+        for game in games:
+            report.game(game)
+        for issue in validation_result['issues']:
+            report.issue(issue)
+        report.close({
+            'original_count': validation_result['original_count'],
+            'valid_count': validation_result['valid_count'],
+            'duplicate_count': validation_result['duplicate_count'],
+            'success_rate': validation_result['success_rate']
+        })
         
         # 검증 리포트 저장
         report_filename = f"{output_prefix}_validation_report_{timestamp}.txt"
@@ -319,6 +540,19 @@ class KBODataValidator:
             reportfile.write(f"중복 제거: {validation_result['duplicate_count']}개\n")
             reportfile.write(f"성공률: {validation_result['success_rate']:.1f}%\n\n")
             
+            # 여러 파일 일괄 검증 시 파일별 요약
+            if validation_result.get('file_summaries'):
+                reportfile.write(f"파일 간 중복 제거: {validation_result['cross_file_duplicate_count']}개\n\n")
+                reportfile.write("파일별 결과:\n")
+                reportfile.write("-" * 30 + "\n")
+                for summary in validation_result['file_summaries']:
+                    if summary.get('error'):
+                        reportfile.write(f"- {summary['file']}: 로드 실패 ({summary['error']})\n")
+                    else:
+                        reportfile.write(f"- {summary['file']}: {summary['original_count']}개 중 {summary['valid_count']}개 유효, "
+                                         f"중복 {summary['duplicate_count']}개, 이슈 {summary['issue_count']}개\n")
+                reportfile.write("\n")
+            
             if validation_result['issues']:
                 reportfile.write("발견된 이슈들:\n")
                 reportfile.write("-" * 30 + "\n")
@@ -329,18 +563,160 @@ class KBODataValidator:
         
         print(f"\n💾 검증된 데이터 저장 완료:")
         print(f"   📊 CSV: {csv_filename}")
-        print(f"   📋 JSON: {json_filename}")
+        print(f"   📋 JSONL: {json_filename}")
         print(f"   📄 리포트: {report_filename}")
 
+def validate_csv_file(csv_file: str, batch: bool = True) -> Dict[str, Any]:
+    """단일 CSV 파일 검증 (프로세스 풀 작업 단위, 경기별 출력은 생략)"""
+    import contextlib
+    import io
+    
+    validator = KBODataValidator()
+    with contextlib.redirect_stdout(io.StringIO()):
+        if batch:
+            result = validator.load_and_validate_csv_batch(csv_file)
+        else:
+            result = validator.load_and_validate_csv(csv_file)
+    
+    result['file'] = csv_file
+    return result
+
+def merge_validation_results(file_results: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """파일별 검증 결과 병합 (파일 간 중복 경기는 먼저 나온 파일 기준으로 제거)"""
+    merged_games = []
+    all_issues = []
+    file_summaries = []
+    seen_matches = {}
+    original_count = 0
+    duplicate_count = 0
+    cross_file_duplicates = 0
+    
+    for result in file_results:
+        csv_file = result['file']
+        
+        if 'error' in result:
+            file_summaries.append({'file': csv_file, 'error': result['error']})
+            all_issues.append(f"{csv_file}: 로드 실패 - {result['error']}")
+            continue
+        
+        original_count += result['original_count']
+        duplicate_count += result['duplicate_count']
+        all_issues.extend(f"{csv_file} {issue}" for issue in result['issues'])
+        
+        kept = 0
+        for game in result['validated_games']:
+            home_team = game.get('homeTeam')
+            away_team = game.get('awayTeam')
+            date = game.get('date')
+            
+            if home_team and away_team and date:
+                # 팀 순서에 관계없이 중복 체크
+                match_key = tuple(sorted([home_team, away_team]) + [date])
+                
+                if match_key in seen_matches:
+                    cross_file_duplicates += 1
+                    all_issues.append(f"{csv_file}: 파일 간 중복 경기 - {away_team} vs {home_team} ({date}, 최초: {seen_matches[match_key]})")
+                    continue
+                
+                seen_matches[match_key] = csv_file
+            
+            merged_games.append(game)
+            kept += 1
+        
+        file_summaries.append({
+            'file': csv_file,
+            'original_count': result['original_count'],
+            'valid_count': kept,
+            'duplicate_count': result['duplicate_count'],
+            'issue_count': len(result['issues'])
+        })
+    
+    return {
+        'original_count': original_count,
+        'validated_games': merged_games,
+        'valid_count': len(merged_games),
+        'duplicate_count': duplicate_count + cross_file_duplicates,
+        'cross_file_duplicate_count': cross_file_duplicates,
+        'issues': all_issues,
+        'success_rate': len(merged_games) / original_count * 100 if original_count else 0,
+        'file_summaries': file_summaries
+    }
+
+def validate_files_parallel(csv_files: List[str], workers: Optional[int] = None, batch: bool = True) -> Dict[str, Any]:
+    """여러 CSV 파일을 프로세스 풀에서 병렬 검증 후 하나의 결과로 병합"""
+    from concurrent.futures import ProcessPoolExecutor
+    
+    print(f"🔍 {len(csv_files)}개 파일 병렬 검증 시작 (워커: {workers or os.cpu_count()}개)")
+    print("-" * 50)
+    
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        file_results = list(executor.map(validate_csv_file, csv_files, [batch] * len(csv_files)))
+    
+    for result in file_results:
+        if 'error' in result:
+            print(f"❌ {result['file']}: {result['error']}")
+        else:
+            print(f"✅ {result['file']}: {result['valid_count']}/{result['original_count']}개 경기, 이슈 {len(result['issues'])}개")
+    
+    merged = merge_validation_results(file_results)
+    
+    print(f"\n📊 통합 검증 결과:")
+    print(f"   총 경기: {merged['original_count']}개")
+    print(f"   중복 제거: {merged['duplicate_count']}개 (파일 간 {merged['cross_file_duplicate_count']}개)")
+    print(f"   최종 경기: {merged['valid_count']}개")
+    print(f"   총 이슈: {len(merged['issues'])}개")
+    
+    return merged
+
+@profiled
 def main():
     """메인 실행 함수"""
+    import argparse
+    import glob
+    
+    parser = argparse.ArgumentParser(description='KBO 데이터 검증 시스템')
+    parser.add_argument('--batch', action='store_true', help='DataFrame 일괄 검증 모드 사용')
+    parser.add_argument('--verify-batch', nargs='*', metavar='CSV',
+                        help='행 단위/일괄 검증 결과 비교 (파일 미지정 시 현재 폴더의 모든 CSV)')
+    parser.add_argument('--files', nargs='+', metavar='CSV',
+                        help='여러 CSV 파일(글롭 패턴 가능)을 병렬 검증해 하나의 리포트로 저장')
+    parser.add_argument('--workers', type=int, default=None, help='병렬 검증 프로세스 수 (기본: CPU 코어 수)')
+    parser.add_argument('--output-prefix', default='kbo_batch', help='통합 리포트 파일 접두어')
+    parser.add_argument('--stream', nargs=2, metavar=('CSV', 'REPORT'),
+                        help='CSV를 한 행씩 검증하며 JSONL 리포트로 기록 (REPORT가 .gz면 압축)')
+    args = parser.parse_args()
+    
     print("🚀 KBO 데이터 검증 시스템 시작")
     print("=" * 60)
     
     validator = KBODataValidator()
     
+    if args.verify_batch is not None:
+        target_files = args.verify_batch or sorted(glob.glob("*.csv"))
+        results = [validator.compare_validation_modes(csv_file) for csv_file in target_files]
+        print(f"\n🎯 일괄 검증 동등성 확인: {sum(results)}/{len(results)}개 파일 일치")
+        if not all(results):
+            sys.exit(1)
+        return
+    
+    if args.stream:
+        csv_file, report_path = args.stream
+        summary = validator.stream_validate_csv(csv_file, report_path)
+        if 'error' in summary:
+            sys.exit(1)
+        return
+    
+    if args.files:
+        target_files = sorted({csv_file for pattern in args.files for csv_file in (glob.glob(pattern) or [pattern])})
+        validation_result = validate_files_parallel(target_files, args.workers, batch=args.batch)
+        validator.save_validated_data(validation_result, args.output_prefix)
+        
+        print(f"\n🎯 일괄 검증 완료!")
+        print(f"   성공률: {validation_result['success_rate']:.1f}%")
+        print(f"   최종 경기 수: {validation_result['valid_count']}개")
+        return
+    
     # 최근 생성된 CSV 파일 찾기
-    import glob
     csv_files = glob.glob("production_kbo_*.csv")
     
     if not csv_files:
@@ -352,7 +728,10 @@ def main():
     print(f"📁 최근 파일 선택: {latest_csv}")
     
     # 검증 실행
-    validation_result = validator.load_and_validate_csv(latest_csv)
+    if args.batch:
+        validation_result = validator.load_and_validate_csv_batch(latest_csv)
+    else:
+        validation_result = validator.load_and_validate_csv(latest_csv)
     
     if 'error' not in validation_result:
         # 검증 결과 저장
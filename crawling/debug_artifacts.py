@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+디버그용 페이지 소스 보관소
+- 파싱 실패 / 이상 결과(검증 실패 레코드) / 크롤링 오류일 때만 페이지 소스를 저장
+- 정상 페이지는 설정한 비율(CRAWL_ARTIFACT_SAMPLE, 기본 0)로만 표본 저장
+- gzip 압축해 한 디렉터리(CRAWL_ARTIFACT_DIR, 기본 debug_artifacts)에 보관하고
+  전체 크기가 상한(CRAWL_ARTIFACT_MAX_MB, 기본 200MB)을 넘으면 오래된 파일부터 삭제
+- export로 압축을 풀어 벤치마크/파서 코퍼스 이름({sport}_page_source_{date}.html)으로 꺼내 재현
+
+사용법:
+    CRAWL_ARTIFACT_SAMPLE=0.05 python all_sports_crawler.py 2025-09-23
+    python debug_artifacts.py list [--dir debug_artifacts]
+    python debug_artifacts.py export debug_artifacts/kbo_2025-09-23_20250923_181500_parse_failure.html.gz [--to .]
+"""
+
+import gzip
+import os
+import random
+import re
+import threading
+from datetime import datetime
+from typing import List, Dict, Any, Optional
+
+DEFAULT_DIRECTORY = 'debug_artifacts'
+
+DEFAULT_MAX_MB = 200
+
+ARTIFACT_SUFFIX = '.html.gz'
+
+ARTIFACT_PATTERN = re.compile(r'^(?P<sport>[a-z]+)_(?P<date>\d{4}-\d{2}-\d{2})_(?P<saved>\d{8}_\d{6}(?:_\d+)?)_(?P<reason>[a-z_]+)\.html\.gz$')
+
+# 저장 사유 (파일 이름에 포함)
+REASON_PARSE_FAILURE = 'parse_failure'
+REASON_ANOMALY = 'anomaly'
+REASON_ERROR = 'error'
+REASON_SAMPLE = 'sample'
+
+class DebugArtifactStore:
+    """크기 상한이 있는 gzip 페이지 소스 보관소"""
+    
+    def __init__(self, directory: Optional[str] = None, max_bytes: Optional[int] = None,
+                 sample_rate: Optional[float] = None):
+        self.directory = directory or os.getenv('CRAWL_ARTIFACT_DIR', DEFAULT_DIRECTORY)
+        if max_bytes is None:
+            max_bytes = int(float(os.getenv('CRAWL_ARTIFACT_MAX_MB', DEFAULT_MAX_MB)) * 1024 * 1024)
+        self.max_bytes = max_bytes
+        if sample_rate is None:
+            sample_rate = float(os.getenv('CRAWL_ARTIFACT_SAMPLE', '0') or 0)
+        self.sample_rate = sample_rate
+        self._lock = threading.Lock()
+    
+    def reason_for(self, sport: str, games: Optional[List[Dict[str, Any]]] = None,
+                   issues: Optional[List[str]] = None) -> Optional[str]:
+        """저장 사유 판단 (저장하지 않으면 None)"""
+        if issues:
+            return REASON_PARSE_FAILURE
+        if games:
+            from validation_rules import validate_record
+            
+            if any(not validate_record(sport, game)['valid'] for game in games):
+                return REASON_ANOMALY
+        if self.sample_rate > 0 and random.random() < self.sample_rate:
+            return REASON_SAMPLE
+        return None
+    
+    def capture(self, sport: str, date: str, page_source: Optional[str], games: Optional[List[Dict[str, Any]]] = None,
+                issues: Optional[List[str]] = None, reason: Optional[str] = None) -> Optional[str]:
+        """
+        필요한 경우에만 페이지 소스 저장
+
+        Args:
+            games: 파싱 결과 (검증 실패 레코드가 있으면 anomaly)
+            issues: 파서가 남긴 문제 목록 (있으면 parse_failure)
+            reason: 사유를 직접 지정 (예: error)
+
+        Returns:
+            저장한 파일 경로 (저장하지 않았으면 None)
+        """
+        if not page_source:
+            return None
+        reason = reason or self.reason_for(sport, games, issues)
+        if reason is None:
+            return None
+        
+        try:
+            return self.save(sport, date, page_source, reason)
+        except OSError as e:
+            print(f"⚠️ 디버그 페이지 저장 실패: {e}")
+            return None
+    
+    def save(self, sport: str, date: str, page_source: str, reason: str) -> str:
+        """압축 저장 후 상한 초과분 정리"""
+        os.makedirs(self.directory, exist_ok=True)
+        saved = datetime.now().strftime('%Y%m%d_%H%M%S')
+        path = os.path.join(self.directory, f"{sport}_{date}_{saved}_{reason}{ARTIFACT_SUFFIX}")
+        suffix = 1
+        while os.path.exists(path):
+            path = os.path.join(self.directory, f"{sport}_{date}_{saved}_{suffix}_{reason}{ARTIFACT_SUFFIX}")
+            suffix += 1
+        
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        with gzip.open(temp_path, 'wt', encoding='utf-8', compresslevel=6) as file:
+            file.write(page_source)
+        os.replace(temp_path, path)
+        
+        print(f"🗃️ 디버그 페이지 저장 ({reason}): {path} ({os.path.getsize(path) // 1024}KB)")
+        self.rotate()
+        return path
+    
+    def artifacts(self) -> List[os.DirEntry]:
+        """보관 중인 파일 (오래된 순)"""
+        if not os.path.isdir(self.directory):
+            return []
+        entries = [entry for entry in os.scandir(self.directory)
+                   if entry.is_file() and entry.name.endswith(ARTIFACT_SUFFIX)]
+        return sorted(entries, key=lambda entry: entry.stat().st_mtime)
+    
+    def rotate(self) -> int:
+        """전체 크기가 상한을 넘으면 오래된 파일부터 삭제 → 삭제한 파일 수"""
+        with self._lock:
+            entries = self.artifacts()
+            total = sum(entry.stat().st_size for entry in entries)
+            removed = 0
+            for entry in entries:
+                if total <= self.max_bytes:
+                    break
+                try:
+                    size = entry.stat().st_size
+                    os.remove(entry.path)
+                except OSError:
+                    continue
+                total -= size
+                removed += 1
+            return removed
+
+_default_store: Optional[DebugArtifactStore] = None
+
+def get_store() -> DebugArtifactStore:
+    """환경 변수 설정을 따르는 기본 보관소"""
+    global _default_store
+    if _default_store is None:
+        _default_store = DebugArtifactStore()
+    return _default_store
+
+def capture_page(sport: str, date: str, page_source: Optional[str], games: Optional[List[Dict[str, Any]]] = None,
+                 issues: Optional[List[str]] = None, reason: Optional[str] = None) -> Optional[str]:
+    """기본 보관소에 필요한 경우에만 페이지 소스 저장"""
+    return get_store().capture(sport, date, page_source, games, issues, reason)
+
+def export_artifact(path: str, directory: str = '.') -> str:
+    """압축을 풀어 벤치마크/파서 코퍼스 이름으로 저장"""
+    from crawl_benchmark import FIXTURE_NAME
+    
+    match = ARTIFACT_PATTERN.match(os.path.basename(path))
+    if not match:
+        raise ValueError(f"디버그 페이지 파일 이름이 아닙니다: {path}")
+    
+    target = os.path.join(directory, FIXTURE_NAME.format(sport=match.group('sport'), date=match.group('date')))
+    with gzip.open(path, 'rt', encoding='utf-8') as source, open(target, 'w', encoding='utf-8') as file:
+        file.write(source.read())
+    print(f"📤 {path} → {target}")
+    return target
+
+def main():
+    """메인 실행 함수"""
+    import argparse
+    
+    parser = argparse.ArgumentParser(description='디버그 페이지 소스 보관소')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    list_parser = subparsers.add_parser('list', help='보관 중인 페이지 목록')
+    list_parser.add_argument('--dir', help='보관 디렉터리 (기본: CRAWL_ARTIFACT_DIR 또는 debug_artifacts)')
+    export_parser = subparsers.add_parser('export', help='압축을 풀어 코퍼스 이름으로 저장')
+    export_parser.add_argument('files', nargs='+')
+    export_parser.add_argument('--to', default='.', help='저장 디렉터리')
+    args = parser.parse_args()
+    
+    if args.command == 'list':
+        store = DebugArtifactStore(args.dir)
+        entries = store.artifacts()
+        for entry in entries:
+            print(f"{entry.stat().st_size // 1024:>6}KB  {entry.name}")
+        total = sum(entry.stat().st_size for entry in entries)
+        print(f"\n📊 {len(entries)}개, {total / 1024 / 1024:.1f}MB / 상한 {store.max_bytes / 1024 / 1024:.0f}MB")
+    else:
+        for path in args.files:
+            export_artifact(path, args.to)
+
+if __name__ == "__main__":
+    main()
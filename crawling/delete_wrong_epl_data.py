@@ -1,17 +1,7 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
-import os
-from supabase import create_client, Client
-from dotenv import load_dotenv
-
-# 환경 변수 로드
-load_dotenv('../.env.local')
-
-# Supabase 클라이언트 초기화
-url: str = os.environ.get("NEXT_PUBLIC_SUPABASE_URL")
-key: str = os.environ.get("NEXT_PUBLIC_SUPABASE_ANON_KEY")
-supabase: Client = create_client(url, key)
+from supabase_client import require_supabase, traced_supabase
 
 def delete_epl_games():
     """잘못 저장된 EPL 경기 데이터 삭제"""
@@ -21,7 +11,7 @@ def delete_epl_games():
     
     try:
         # 먼저 현재 저장된 EPL 경기 확인
-        result = supabase.table('soccer_games').select('*').eq('league_type', 'epl').execute()
+        result = traced_supabase('epl').table('soccer_games').select('*').eq('league_type', 'epl').execute()
         
         if result.data:
             print(f"📊 현재 저장된 EPL 경기 수: {len(result.data)}개")
@@ -45,7 +35,7 @@ def delete_epl_games():
             print("🚀 자동 삭제 진행...")
             
             # EPL 경기 모두 삭제
-            delete_result = supabase.table('soccer_games').delete().eq('league_type', 'epl').execute()
+            delete_result = traced_supabase('epl').table('soccer_games').delete().eq('league_type', 'epl').execute()
             
             print(f"✅ EPL 경기 {len(result.data)}개 삭제 완료!")
             
@@ -53,7 +43,7 @@ def delete_epl_games():
             print("📋 삭제할 EPL 경기가 없습니다.")
             
         # 삭제 후 확인
-        check_result = supabase.table('soccer_games').select('*').eq('league_type', 'epl').execute()
+        check_result = traced_supabase('epl').table('soccer_games').select('*').eq('league_type', 'epl').execute()
         print(f"🔍 삭제 후 EPL 경기 수: {len(check_result.data) if check_result.data else 0}개")
         
         return True
@@ -75,4 +65,5 @@ def main():
         print("\n❌ EPL 데이터 삭제 실패!")
 
 if __name__ == "__main__":
+    require_supabase()
     main()
@@ -2,21 +2,13 @@
 # -*- coding: utf-8 -*-
 
 import os
-import csv
 import json
 from datetime import datetime
-from supabase import create_client, Client
-from dotenv import load_dotenv
 
-# 환경 변수 로드
-load_dotenv('../.env.local')
-
-# Supabase 클라이언트 초기화
-url: str = os.environ.get("NEXT_PUBLIC_SUPABASE_URL")
-key: str = os.environ.get("NEXT_PUBLIC_SUPABASE_ANON_KEY")
-supabase: Client = create_client(url, key)
-
-print(f"🔐 Supabase 연결: Anon 키 사용")
+from csv_ingest import ingest_csv, insert_chunk
+from profiling import profiled
+from supabase_client import get_supabase, require_supabase, traced_supabase
+from validation_rules import get_rule_set
 
 def import_epl_games_from_csv(csv_file_path):
     """CSV 파일에서 EPL 경기 데이터를 읽어서 Supabase에 삽입"""
@@ -29,36 +21,14 @@ def import_epl_games_from_csv(csv_file_path):
         print(f"❌ 파일을 찾을 수 없습니다: {csv_file_path}")
         return False
     
-    success_count = 0
-    error_count = 0
+    rules = get_rule_set('epl')
     
     try:
-        with open(csv_file_path, 'r', encoding='utf-8') as csvfile:
-            reader = csv.DictReader(csvfile)
-            
-            for row_num, row in enumerate(reader, 1):
-                try:
-                    # 데이터 전처리
-                    game_data = prepare_epl_game_data(row)
-                    
-                    # Supabase에 삽입
-                    result = supabase.table('soccer_games').insert(game_data).execute()
-                    
-                    if result.data:
-                        status = "종료" if game_data['is_closed'] else "예정"
-                        score_info = ""
-                        if game_data['home_score'] is not None and game_data['away_score'] is not None:
-                            score_info = f" ({game_data['away_score']}:{game_data['home_score']})"
-                        print(f"✅ 경기 {row_num}: {row['away_team']} vs {row['home_team']} | {status}{score_info} 업로드 완료")
-                        success_count += 1
-                    else:
-                        print(f"❌ 경기 {row_num}: 업로드 실패 - 응답 데이터 없음")
-                        error_count += 1
-                        
-                except Exception as e:
-                    print(f"❌ 경기 {row_num}: {row.get('away_team', 'Unknown')} vs {row.get('home_team', 'Unknown')} - {str(e)}")
-                    error_count += 1
-                    continue
+        # 읽는 동안 이전 묶음을 한 번의 insert로 업로드 (실패한 묶음만 행 단위로 재시도)
+        result = ingest_csv(csv_file_path, lambda row_num, row: validate_and_prepare(row_num, row, rules),
+                            lambda chunk: insert_chunk(get_supabase(), 'soccer_games', chunk, sport='epl'))
+        success_count = result['written'].get('success', 0)
+        error_count = result['written'].get('error', 0) + result['rejected']
         
         print("\n" + "=" * 60)
         print(f"🎉 EPL 데이터 업로드 완료!")
@@ -71,6 +41,14 @@ def import_epl_games_from_csv(csv_file_path):
         print(f"❌ CSV 파일 읽기 오류: {e}")
         return False
 
+def validate_and_prepare(row_num, row, rules):
+    """CSV 행 검증 후 삽입용 데이터로 변환 (검증 실패 시 None)"""
+    validation = rules.validate(row)
+    if not validation['valid']:
+        print(f"⚠️ 경기 {row_num}: 검증 실패로 제외 - {', '.join(validation['issues'])}")
+        return None
+    return prepare_epl_game_data(validation['game'])
+
 def prepare_epl_game_data(row):
     """CSV 행 데이터를 Supabase 삽입용 데이터로 변환"""
     
@@ -78,13 +56,13 @@ def prepare_epl_game_data(row):
     home_score = None
     away_score = None
     
-    if row['home_score'] and row['home_score'].strip():
+    if row['home_score'] is not None and str(row['home_score']).strip():
         try:
             home_score = int(row['home_score'])
         except ValueError:
             pass
     
-    if row['away_score'] and row['away_score'].strip():
+    if row['away_score'] is not None and str(row['away_score']).strip():
         try:
             away_score = int(row['away_score'])
         except ValueError:
@@ -92,7 +70,7 @@ def prepare_epl_game_data(row):
     
     # is_closed 처리
     is_closed = False
-    if row['is_closed'].lower() in ['true', '1', 'yes']:
+    if str(row['is_closed']).lower() in ['true', '1', 'yes']:
         is_closed = True
     
     # 경기 상태 결정
@@ -128,14 +106,14 @@ def verify_epl_upload():
     
     try:
         # 전체 축구 경기 수 확인
-        result = supabase.table('soccer_games').select('*', count='exact').execute()
+        result = traced_supabase('epl').table('soccer_games').select('*', count='exact').execute()
         total_games = len(result.data) if result.data else 0
         
         print(f"📈 총 축구 경기 수: {total_games}개")
         
         if total_games > 0:
             # EPL 경기만 확인
-            epl_games = supabase.table('soccer_games').select('*').eq('league_type', 'epl').order('created_at', desc=True).limit(10).execute()
+            epl_games = traced_supabase('epl').table('soccer_games').select('*').eq('league_type', 'epl').order('created_at', desc=True).limit(10).execute()
             
             print(f"⚽ EPL 경기 수: {len(epl_games.data)}개")
             print("\n📋 최근 업로드된 EPL 경기:")
@@ -157,6 +135,7 @@ def verify_epl_upload():
         print(f"❌ 데이터 검증 중 오류: {e}")
         return False
 
+@profiled
 def main():
     """메인 실행 함수"""
     
@@ -181,4 +160,5 @@ def main():
     print("👀 Supabase 대시보드에서 soccer_games 테이블을 확인해보세요!")
 
 if __name__ == "__main__":
+    require_supabase()
     main()
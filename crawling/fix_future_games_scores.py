@@ -1,16 +1,9 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
-import os
 from datetime import datetime
-from supabase import create_client, Client
-from dotenv import load_dotenv
 
-load_dotenv('../.env.local')
-
-url: str = os.environ.get("NEXT_PUBLIC_SUPABASE_URL")
-key: str = os.environ.get("NEXT_PUBLIC_SUPABASE_ANON_KEY")
-supabase: Client = create_client(url, key)
+from supabase_client import require_supabase, traced_supabase
 
 def fix_future_games():
     """9월 23일 이후 미래 경기의 잘못된 점수 데이터 수정"""
@@ -19,7 +12,7 @@ def fix_future_games():
     
     try:
         # 9월 23일 이후 경기 조회
-        games_result = supabase.table('games').select('*').gte('start_time', '2025-09-23T00:00:00+00:00').execute()
+        games_result = traced_supabase('kbo').table('games').select('*').gte('start_time', '2025-09-23T00:00:00+00:00').execute()
         
         if not games_result.data:
             print("❌ 수정할 경기 데이터가 없습니다.")
@@ -67,7 +60,7 @@ def fix_future_games():
                     'result': None
                 }
                 
-                update_result = supabase.table('games').update(update_data).eq('id', game_id).execute()
+                update_result = traced_supabase('kbo').table('games').update(update_data).eq('id', game_id).execute()
                 
                 if update_result.data:
                     date_str = game['start_time'][:10]
@@ -84,7 +77,7 @@ def fix_future_games():
         
         # 수정 결과 확인
         print("\n📋 수정 후 상태 확인:")
-        verification_result = supabase.table('games').select('*').gte('start_time', '2025-09-23T00:00:00+00:00').order('start_time').execute()
+        verification_result = traced_supabase('kbo').table('games').select('*').gte('start_time', '2025-09-23T00:00:00+00:00').order('start_time').execute()
         
         if verification_result.data:
             for game in verification_result.data:
@@ -100,4 +93,5 @@ def fix_future_games():
         print(f"❌ 오류 발생: {e}")
 
 if __name__ == "__main__":
+    require_supabase()
     fix_future_games()
@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+단계별 소요 시간 계측
+- 크롤러/임포터의 단계(드라이버 시작, driver.get, 대기, 파싱, CSV 저장, Supabase 호출 등)를 span으로 기록
+- span마다 sport/date 태그를 붙여 JSON Lines로 기록 (CRAWL_METRICS_JSONL 또는 configure())
+- 단계/종목별 합계를 Prometheus textfile 형식 스냅샷으로 저장 (CRAWL_METRICS_PROM, node_exporter textfile collector용)
+- 아무것도 설정하지 않으면 메모리에만 집계 (출력 없음)
+
+사용법:
+    CRAWL_METRICS_JSONL=spans.jsonl CRAWL_METRICS_PROM=crawl.prom python all_sports_crawler.py 2025-09-23
+    python instrumentation.py summarize spans.jsonl
+"""
+
+import atexit
+import functools
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import List, Dict, Any, Optional, Tuple
+
+# Prometheus 스냅샷 최소 갱신 간격 (상주 프로세스용)
+PROM_WRITE_INTERVAL = 15
+
+# Prometheus 라벨 (date는 값이 계속 늘어나므로 JSONL에만 기록)
+PROM_LABELS = ('stage', 'sport')
+
+_lock = threading.Lock()
+_stats: Dict[Tuple[str, str], Dict[str, float]] = {}
+_report = None
+_prom_path: Optional[str] = None
+_last_prom_write = 0.0
+_configured = False
+
+def configure(jsonl_path: Optional[str] = None, prom_path: Optional[str] = None):
+    """출력 경로 설정 (지정하지 않은 항목은 환경 변수 사용)"""
+    global _report, _prom_path, _configured
+    from jsonl_report import JsonlReportWriter
+    
+    jsonl_path = jsonl_path or os.getenv('CRAWL_METRICS_JSONL')
+    with _lock:
+        if _report is None and jsonl_path:
+            _report = JsonlReportWriter(jsonl_path, 'spans', flush_every=50, pid=os.getpid())
+        _prom_path = prom_path or os.getenv('CRAWL_METRICS_PROM') or _prom_path
+        _configured = True
+
+def record(stage: str, seconds: float, error: bool = False, **tags):
+    """완료된 span 하나 기록"""
+    if not _configured:
+        configure()
+    
+    key = (stage, str(tags.get('sport') or ''))
+    with _lock:
+        stats = _stats.setdefault(key, {'count': 0, 'sum': 0.0, 'max': 0.0, 'errors': 0})
+        stats['count'] += 1
+        stats['sum'] += seconds
+        stats['max'] = max(stats['max'], seconds)
+        if error:
+            stats['errors'] += 1
+        
+        if _report is not None:
+            _report.write('span', stage=stage, seconds=round(seconds, 6), error=error, **tags)
+    
+    if _prom_path and time.time() - _last_prom_write >= PROM_WRITE_INTERVAL:
+        write_prometheus()
+
+@contextmanager
+def span(stage: str, **tags):
+    """with 블록 소요 시간을 stage로 기록 (예외가 나면 error=True)"""
+    started = time.perf_counter()
+    error = False
+    try:
+        yield
+    except BaseException:
+        error = True
+        raise
+    finally:
+        record(stage, time.perf_counter() - started, error, **tags)
+
+def timed_sleep(seconds: float, **tags):
+    """고정 대기도 별도 단계로 기록 (time.sleep 대신 사용)"""
+    with span('sleep', **tags):
+        time.sleep(seconds)
+
+def timed(stage: str, sport: Optional[str] = None):
+    """함수 전체를 stage로 기록하는 데코레이터 (첫 번째 인자를 date 태그로 사용)"""
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            tags = {'sport': sport} if sport else {}
+            if args:
+                tags['date'] = args[0]
+            with span(stage, **tags):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+def snapshot() -> Dict[Tuple[str, str], Dict[str, float]]:
+    """(단계, 종목)별 집계 복사본"""
+    with _lock:
+        return {key: dict(stats) for key, stats in _stats.items()}
+
+def _labels(key: Tuple[str, str]) -> str:
+    return ','.join(f'{name}="{value}"' for name, value in zip(PROM_LABELS, key))
+
+def format_prometheus(stats: Dict[Tuple[str, str], Dict[str, float]]) -> str:
+    """집계를 Prometheus 텍스트 형식으로 변환"""
+    lines = [
+        '# HELP crawl_stage_duration_seconds 크롤링/임포트 단계별 소요 시간',
+        '# TYPE crawl_stage_duration_seconds summary'
+    ]
+    for key in sorted(stats):
+        lines.append(f"crawl_stage_duration_seconds_sum{{{_labels(key)}}} {stats[key]['sum']:.6f}")
+        lines.append(f"crawl_stage_duration_seconds_count{{{_labels(key)}}} {stats[key]['count']}")
+    
+    lines += ['# HELP crawl_stage_duration_max_seconds 단계별 최대 소요 시간',
+              '# TYPE crawl_stage_duration_max_seconds gauge']
+    lines += [f"crawl_stage_duration_max_seconds{{{_labels(key)}}} {stats[key]['max']:.6f}" for key in sorted(stats)]
+    
+    lines += ['# HELP crawl_stage_errors_total 예외로 끝난 단계 수',
+              '# TYPE crawl_stage_errors_total counter']
+    lines += [f"crawl_stage_errors_total{{{_labels(key)}}} {stats[key]['errors']}" for key in sorted(stats)]
+    
+    lines += ['# HELP crawl_metrics_snapshot_timestamp_seconds 스냅샷 작성 시각',
+              '# TYPE crawl_metrics_snapshot_timestamp_seconds gauge',
+              f"crawl_metrics_snapshot_timestamp_seconds {time.time():.3f}"]
+    return '\n'.join(lines) + '\n'
+
+def write_prometheus(path: Optional[str] = None) -> Optional[str]:
+    """Prometheus textfile 스냅샷 저장 (임시 파일에 쓴 뒤 교체, collector가 반쪽 파일을 읽지 않도록)"""
+    global _last_prom_write
+    path = path or _prom_path
+    if not path:
+        return None
+    
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    with open(temp_path, 'w', encoding='utf-8') as file:
+        file.write(format_prometheus(snapshot()))
+    os.replace(temp_path, path)
+    _last_prom_write = time.time()
+    return path
+
+def close():
+    """종료 시 JSONL 요약과 마지막 스냅샷 기록"""
+    global _report
+    if _prom_path:
+        write_prometheus()
+    
+    with _lock:
+        if _report is not None:
+            _report.close({
+                'stages': [
+                    {'stage': stage, 'sport': sport, **stats}
+                    for (stage, sport), stats in sorted(_stats.items())
+                ]
+            })
+            _report = None
+
+atexit.register(close)
+
+def summarize(paths: List[str]) -> List[Dict[str, Any]]:
+    """span JSONL 파일들을 (단계, 종목)별로 집계 (합계 순)"""
+    from jsonl_report import read_jsonl
+    
+    durations: Dict[Tuple[str, str], List[float]] = {}
+    for path in paths:
+        for record in read_jsonl(path):
+            if record['type'] == 'span':
+                durations.setdefault((record['stage'], record.get('sport') or ''), []).append(record['seconds'])
+    
+    rows = []
+    for (stage, sport), values in durations.items():
+        values.sort()
+        rows.append({
+            'stage': stage,
+            'sport': sport,
+            'count': len(values),
+            'total': sum(values),
+            'p50': values[len(values) // 2],
+            'p95': values[min(len(values) - 1, int(len(values) * 0.95))],
+            'max': values[-1]
+        })
+    rows.sort(key=lambda row: row['total'], reverse=True)
+    return rows
+
+def main():
+    """메인 실행 함수"""
+    import argparse
+    
+    parser = argparse.ArgumentParser(description='단계별 소요 시간 집계')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    summarize_parser = subparsers.add_parser('summarize', help='span JSONL 집계')
+    summarize_parser.add_argument('files', nargs='+', help='span JSONL 파일 (.gz 가능)')
+    args = parser.parse_args()
+    
+    rows = summarize(args.files)
+    # 함수 전체 span(*_total)은 하위 단계와 겹치므로 비중 계산에서 제외
+    grand_total = sum(row['total'] for row in rows if not row['stage'].endswith('_total')) or 1
+    
+    print(f"{'단계':<20} {'종목':<11} {'횟수':>6} {'합계(s)':>10} {'비중':>6} {'p50':>8} {'p95':>8} {'최대':>8}")
+    print("-" * 84)
+    for row in rows:
+        print(f"{row['stage']:<20} {row['sport'] or '-':<11} {row['count']:>6} {row['total']:>10.2f} "
+              f"{row['total'] / grand_total:>6.1%} {row['p50']:>8.3f} {row['p95']:>8.3f} {row['max']:>8.3f}")
+
+if __name__ == "__main__":
+    main()
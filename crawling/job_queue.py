@@ -0,0 +1,391 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+SQLite 기반 로컬 크롤링 작업 큐
+- (sport, date, mode) 작업을 여러 워커 프로세스가 나눠 처리
+- 리스(lease) + 하트비트: 작업 중 죽은 워커의 작업은 리스 만료 후 다른 워커가 가져감
+- 재시도 횟수 초과 시 dead-letter 상태로 보관
+- 같은 (sport, date, mode) 작업은 한 번만 대기열에 존재 (중복 없음)
+
+사용법:
+    python job_queue.py enqueue kbo 2025-09-23 2025-09-24 [--mode crawl]
+    python job_queue.py worker [--worker-id w1] [--output-dir crawl_results]
+    python job_queue.py stats
+    python job_queue.py requeue-dead
+"""
+
+import json
+import os
+import socket
+import sqlite3
+import threading
+import time
+from typing import List, Dict, Any, Optional
+
+from profiling import profiled
+
+DEFAULT_QUEUE_PATH = 'crawl_jobs.db'
+
+LEASE_SECONDS = 5 * 60
+HEARTBEAT_SECONDS = 60
+MAX_ATTEMPTS = 5
+RETRY_BASE_SECONDS = 60
+RETRY_MAX_SECONDS = 60 * 60
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    sport TEXT NOT NULL,
+    date TEXT NOT NULL,
+    mode TEXT NOT NULL DEFAULT 'crawl',
+    status TEXT NOT NULL DEFAULT 'queued' CHECK (status IN ('queued', 'leased', 'done', 'dead')),
+    attempts INTEGER NOT NULL DEFAULT 0,
+    max_attempts INTEGER NOT NULL DEFAULT 5,
+    available_at REAL NOT NULL,
+    lease_owner TEXT,
+    lease_expires_at REAL,
+    last_error TEXT,
+    result TEXT,
+    collected INTEGER NOT NULL DEFAULT 0,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL,
+    UNIQUE (sport, date, mode)
+);
+CREATE INDEX IF NOT EXISTS idx_jobs_claim ON jobs (status, available_at);
+CREATE INDEX IF NOT EXISTS idx_jobs_collect ON jobs (collected, status);
+"""
+
+class JobQueue:
+    """SQLite 작업 큐 (프로세스마다 하나씩 생성)"""
+    
+    def __init__(self, path: str = DEFAULT_QUEUE_PATH):
+        self.path = path
+        # autocommit 모드에서 BEGIN IMMEDIATE로 직접 트랜잭션 관리
+        self.conn = sqlite3.connect(path, timeout=30, isolation_level=None, check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute('PRAGMA synchronous=NORMAL')
+        self.conn.executescript(SCHEMA)
+        self._lock = threading.Lock()
+    
+    def _transaction(self, statements):
+        """쓰기 트랜잭션 실행 (다른 프로세스와 경합 시 sqlite timeout만큼 대기)"""
+        with self._lock:
+            self.conn.execute('BEGIN IMMEDIATE')
+            try:
+                result = statements(self.conn)
+                self.conn.execute('COMMIT')
+                return result
+            except Exception:
+                self.conn.execute('ROLLBACK')
+                raise
+    
+    def enqueue(self, sport: str, date: str, mode: str = 'crawl', run_at: Optional[float] = None,
+                max_attempts: int = MAX_ATTEMPTS) -> bool:
+        """
+        작업 추가
+
+        이미 대기/처리 중인 같은 작업이 있으면 그대로 두고,
+        완료/dead 상태였다면 다시 대기열에 넣는다.
+
+        Returns:
+            새로 대기열에 들어갔는지 여부
+        """
+        now = time.time()
+        run_at = run_at or now
+        
+        def statements(conn):
+            cursor = conn.execute("""
+                INSERT INTO jobs (sport, date, mode, available_at, max_attempts, created_at, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT (sport, date, mode) DO UPDATE SET
+                    status = 'queued', attempts = 0, available_at = excluded.available_at,
+                    max_attempts = excluded.max_attempts, lease_owner = NULL, lease_expires_at = NULL,
+                    last_error = NULL, result = NULL, collected = 0, updated_at = excluded.updated_at
+                WHERE jobs.status IN ('done', 'dead')
+            """, (sport, date, mode, run_at, max_attempts, now, now))
+            return cursor.rowcount > 0
+        
+        return self._transaction(statements)
+    
+    def claim(self, worker_id: str, lease_seconds: int = LEASE_SECONDS) -> Optional[Dict[str, Any]]:
+        """실행할 작업 하나를 리스 (대기 중이거나 리스가 만료된 작업)"""
+        now = time.time()
+        
+        def statements(conn):
+            # 리스가 만료된 작업 중 재시도 횟수를 다 쓴 작업은 dead 처리
+            conn.execute("""
+                UPDATE jobs SET status = 'dead', lease_owner = NULL, updated_at = ?,
+                    last_error = COALESCE(last_error, '') || ' [리스 만료]'
+                WHERE status = 'leased' AND lease_expires_at < ? AND attempts >= max_attempts
+            """, (now, now))
+            
+            row = conn.execute("""
+                SELECT * FROM jobs
+                WHERE (status = 'queued' AND available_at <= ?)
+                   OR (status = 'leased' AND lease_expires_at < ?)
+                ORDER BY available_at, id
+                LIMIT 1
+            """, (now, now)).fetchone()
+            if row is None:
+                return None
+            
+            conn.execute("""
+                UPDATE jobs SET status = 'leased', lease_owner = ?, lease_expires_at = ?,
+                    attempts = attempts + 1, updated_at = ?
+                WHERE id = ?
+            """, (worker_id, now + lease_seconds, now, row['id']))
+            
+            job = dict(row)
+            job['attempts'] += 1
+            job['lease_owner'] = worker_id
+            return job
+        
+        return self._transaction(statements)
+    
+    def heartbeat(self, job_id: int, worker_id: str, lease_seconds: int = LEASE_SECONDS) -> bool:
+        """리스 연장 (리스를 잃었으면 False)"""
+        now = time.time()
+        
+        def statements(conn):
+            cursor = conn.execute("""
+                UPDATE jobs SET lease_expires_at = ?, updated_at = ?
+                WHERE id = ? AND lease_owner = ? AND status = 'leased'
+            """, (now + lease_seconds, now, job_id, worker_id))
+            return cursor.rowcount > 0
+        
+        return self._transaction(statements)
+    
+    def complete(self, job_id: int, worker_id: str, result: Any = None) -> bool:
+        """작업 완료 (리스를 가진 워커만 완료 가능)"""
+        now = time.time()
+        
+        def statements(conn):
+            cursor = conn.execute("""
+                UPDATE jobs SET status = 'done', result = ?, lease_owner = NULL, lease_expires_at = NULL,
+                    last_error = NULL, collected = 0, updated_at = ?
+                WHERE id = ? AND lease_owner = ? AND status = 'leased'
+            """, (json.dumps(result, ensure_ascii=False, default=str), now, job_id, worker_id))
+            return cursor.rowcount > 0
+        
+        return self._transaction(statements)
+    
+    def fail(self, job_id: int, worker_id: str, error: str) -> Optional[str]:
+        """작업 실패 처리 (재시도 대기 또는 dead), 바뀐 상태 반환"""
+        now = time.time()
+        
+        def statements(conn):
+            row = conn.execute("""
+                SELECT attempts, max_attempts FROM jobs
+                WHERE id = ? AND lease_owner = ? AND status = 'leased'
+            """, (job_id, worker_id)).fetchone()
+            if row is None:
+                return None
+            
+            if row['attempts'] >= row['max_attempts']:
+                status, available_at = 'dead', now
+            else:
+                status = 'queued'
+                available_at = now + min(RETRY_BASE_SECONDS * 2 ** (row['attempts'] - 1), RETRY_MAX_SECONDS)
+            
+            conn.execute("""
+                UPDATE jobs SET status = ?, available_at = ?, last_error = ?, lease_owner = NULL,
+                    lease_expires_at = NULL, collected = 0, updated_at = ?
+                WHERE id = ?
+            """, (status, available_at, error, now, job_id))
+            return status
+        
+        return self._transaction(statements)
+    
+    def take_finished(self) -> List[Dict[str, Any]]:
+        """아직 가져가지 않은 완료/dead 작업 반환 후 collected 표시 (스케줄러용)"""
+        def statements(conn):
+            rows = conn.execute("""
+                SELECT * FROM jobs WHERE collected = 0 AND status IN ('done', 'dead') ORDER BY updated_at
+            """).fetchall()
+            conn.executemany('UPDATE jobs SET collected = 1 WHERE id = ?', [(row['id'],) for row in rows])
+            return rows
+        
+        jobs = []
+        for row in self._transaction(statements):
+            job = dict(row)
+            job['result'] = json.loads(job['result']) if job['result'] else None
+            jobs.append(job)
+        return jobs
+    
+    def requeue_dead(self) -> int:
+        """dead-letter 작업을 다시 대기열로"""
+        now = time.time()
+        
+        def statements(conn):
+            cursor = conn.execute("""
+                UPDATE jobs SET status = 'queued', attempts = 0, available_at = ?, updated_at = ?
+                WHERE status = 'dead'
+            """, (now, now))
+            return cursor.rowcount
+        
+        return self._transaction(statements)
+    
+    def dead_letters(self) -> List[Dict[str, Any]]:
+        """dead-letter 작업 목록"""
+        rows = self.conn.execute("SELECT * FROM jobs WHERE status = 'dead' ORDER BY updated_at").fetchall()
+        return [dict(row) for row in rows]
+    
+    def stats(self) -> Dict[str, int]:
+        """상태별 작업 수"""
+        rows = self.conn.execute('SELECT status, COUNT(*) AS count FROM jobs GROUP BY status').fetchall()
+        return {row['status']: row['count'] for row in rows}
+    
+    def close(self):
+        self.conn.close()
+
+class Heartbeat:
+    """작업 실행 중 백그라운드에서 리스 연장"""
+    
+    def __init__(self, queue: JobQueue, job_id: int, worker_id: str, interval: float = HEARTBEAT_SECONDS):
+        self.queue = queue
+        self.job_id = job_id
+        self.worker_id = worker_id
+        self.interval = interval
+        self.lost = False
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+    
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            if not self.queue.heartbeat(self.job_id, self.worker_id):
+                self.lost = True
+                print(f"⚠️ 작업 {self.job_id} 리스를 잃었습니다")
+                return
+    
+    def __enter__(self):
+        self._thread.start()
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._stop.set()
+        self._thread.join()
+        return False
+
+def save_job_output(output_dir: str, job: Dict[str, Any], games: List[Dict[str, Any]]) -> str:
+    """작업 결과를 JSONL로 저장 (임시 파일에 쓴 뒤 교체하므로 중간에 죽어도 반쪽 파일이 남지 않음)"""
+    from jsonl_report import JsonlReportWriter
+    
+    os.makedirs(output_dir, exist_ok=True)
+    path = os.path.join(output_dir, f"{job['sport']}_{job['date']}_{job['mode']}.jsonl")
+    temp_path = f"{path}.{job['lease_owner']}.tmp"
+    
+    with JsonlReportWriter(temp_path, 'crawl_job', flush_every=100, sport=job['sport'], date=job['date'],
+                           mode=job['mode'], attempt=job['attempts']) as report:
+        for game in games:
+            report.game(game)
+        report.close({'game_count': len(games)})
+    
+    os.replace(temp_path, path)
+    return path
+
+def run_worker(queue_path: str = DEFAULT_QUEUE_PATH, worker_id: Optional[str] = None,
+               output_dir: str = 'crawl_results', idle_sleep: float = 5, max_jobs: Optional[int] = None):
+    """작업을 하나씩 리스해 크롤링하는 워커 루프"""
+    from browser_session import BrowserSession
+    from sport_registry import load_crawler
+    
+    worker_id = worker_id or f"{socket.gethostname()}-{os.getpid()}"
+    queue = JobQueue(queue_path)
+    sessions: Dict[str, BrowserSession] = {}
+    crawlers = {}
+    processed = 0
+    
+    print(f"👷 워커 시작: {worker_id} (큐: {queue_path})")
+    
+    try:
+        while max_jobs is None or processed < max_jobs:
+            job = queue.claim(worker_id)
+            if job is None:
+                time.sleep(idle_sleep)
+                continue
+            
+            processed += 1
+            sport, date = job['sport'], job['date']
+            print(f"\n🏃 작업 {job['id']}: {sport} {date} ({job['mode']}, {job['attempts']}번째 시도)")
+            
+            try:
+                if job['mode'] not in ('crawl', 'backfill'):
+                    raise ValueError(f"지원하지 않는 작업 모드: {job['mode']}")
+                if sport not in crawlers:
+                    crawlers[sport] = load_crawler(sport)
+                session = sessions.setdefault(sport, BrowserSession())
+                
+                with Heartbeat(queue, job['id'], worker_id) as heartbeat:
+                    games = crawlers[sport](date, driver=session.acquire(sport))
+                    if games is None:
+                        raise RuntimeError('크롤링 실패')
+                    if not games and not session.is_alive():
+                        session.reset()
+                        raise RuntimeError('드라이버 응답 없음')
+                
+                if heartbeat.lost:
+                    print(f"⚠️ 작업 {job['id']}: 다른 워커가 가져간 작업이므로 결과를 버립니다")
+                    continue
+                
+                output_path = save_job_output(output_dir, job, games)
+                queue.complete(job['id'], worker_id, {'games': games, 'output': output_path})
+                print(f"✅ 작업 {job['id']} 완료: {len(games)}개 경기 → {output_path}")
+            
+            except Exception as e:
+                status = queue.fail(job['id'], worker_id, str(e))
+                print(f"❌ 작업 {job['id']} 실패 ({status}): {e}")
+    
+    except KeyboardInterrupt:
+        print("\n🛑 워커 종료 (처리 중이던 작업은 리스 만료 후 다시 실행됨)")
+    finally:
+        for session in sessions.values():
+            session.close()
+        queue.close()
+
+@profiled
+def main():
+    """메인 실행 함수"""
+    import argparse
+    
+    parser = argparse.ArgumentParser(description='SQLite 크롤링 작업 큐')
+    parser.add_argument('--queue', default=DEFAULT_QUEUE_PATH, help='큐 SQLite 파일')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    
+    enqueue_parser = subparsers.add_parser('enqueue', help='작업 추가')
+    enqueue_parser.add_argument('sport', choices=['kbo', 'volleyball', 'epl'])
+    enqueue_parser.add_argument('dates', nargs='+', help='날짜 (YYYY-MM-DD)')
+    enqueue_parser.add_argument('--mode', default='crawl')
+    
+    worker_parser = subparsers.add_parser('worker', help='워커 실행')
+    worker_parser.add_argument('--worker-id')
+    worker_parser.add_argument('--output-dir', default='crawl_results')
+    worker_parser.add_argument('--max-jobs', type=int)
+    
+    subparsers.add_parser('stats', help='상태별 작업 수')
+    subparsers.add_parser('requeue-dead', help='dead-letter 작업 재시도')
+    
+    args = parser.parse_args()
+    
+    if args.command == 'worker':
+        run_worker(args.queue, args.worker_id, args.output_dir, max_jobs=args.max_jobs)
+        return
+    
+    queue = JobQueue(args.queue)
+    
+    if args.command == 'enqueue':
+        added = sum(queue.enqueue(args.sport, date, args.mode) for date in args.dates)
+        print(f"📥 {added}/{len(args.dates)}개 작업 추가")
+    elif args.command == 'stats':
+        for status, count in sorted(queue.stats().items()):
+            print(f"   {status}: {count}개")
+        for job in queue.dead_letters():
+            print(f"   💀 {job['sport']} {job['date']} ({job['mode']}): {job['last_error']}")
+    elif args.command == 'requeue-dead':
+        print(f"🔁 {queue.requeue_dead()}개 작업 재시도 대기")
+    
+    queue.close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+JSON Lines 스트리밍 리포트
+- 처리 중인 경기/이슈를 한 줄씩 바로 기록 (tail -f 로 진행 상황 확인 가능)
+- 마지막 줄에 요약(summary) 기록
+- 파일명이 .gz 로 끝나면 gzip 압축 스트림으로 기록
+"""
+
+import gzip
+import json
+from datetime import datetime
+from typing import Any, Dict, Iterator, Optional
+
+def open_jsonl(path: str, mode: str = 'r'):
+    """JSONL 파일 열기 (.gz 이면 gzip 텍스트 스트림)"""
+    if path.endswith('.gz'):
+        return gzip.open(path, mode + 't', encoding='utf-8')
+    return open(path, mode, encoding='utf-8')
+
+def read_jsonl(path: str) -> Iterator[Dict[str, Any]]:
+    """JSONL 리포트를 한 줄씩 읽기 (빈 줄은 무시)"""
+    with open_jsonl(path) as file:
+        for line in file:
+            line = line.strip()
+            if line:
+                yield json.loads(line)
+
+class JsonlReportWriter:
+    """JSON Lines 리포트 작성기"""
+    
+    def __init__(self, path: str, report_type: str, flush_every: int = 1, **metadata):
+        self.path = path
+        self.report_type = report_type
+        self.flush_every = max(1, flush_every)
+        self.counts: Dict[str, int] = {}
+        self.started_at = datetime.now()
+        self.closed = False
+        self._pending = 0
+        self._file = open_jsonl(path, 'w')
+        
+        self.write('header', report=report_type, started_at=self.started_at.isoformat(), **metadata)
+    
+    def write(self, record_type: str, **fields):
+        """레코드 한 줄 기록"""
+        record = {'type': record_type}
+        record.update(fields)
+        self._file.write(json.dumps(record, ensure_ascii=False, default=str) + '\n')
+        self.counts[record_type] = self.counts.get(record_type, 0) + 1
+        
+        # 실시간 확인을 위해 주기적으로 flush
+        self._pending += 1
+        if self._pending >= self.flush_every:
+            self._file.flush()
+            self._pending = 0
+    
+    def game(self, game: Dict[str, Any], **fields):
+        """경기 레코드 기록"""
+        self.write('game', game=game, **fields)
+    
+    def issue(self, message: str, **fields):
+        """이슈 레코드 기록"""
+        self.write('issue', message=message, **fields)
+    
+    def close(self, summary: Optional[Dict[str, Any]] = None):
+        """요약 footer 기록 후 닫기"""
+        if self.closed:
+            return
+        
+        finished_at = datetime.now()
+        footer = dict(summary or {})
+        footer['record_counts'] = {key: value for key, value in self.counts.items() if key != 'header'}
+        footer['finished_at'] = finished_at.isoformat()
+        footer['elapsed_seconds'] = round((finished_at - self.started_at).total_seconds(), 3)
+        self.write('summary', **footer)
+        
+        self._file.close()
+        self.closed = True
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is not None and not self.closed:
+            self.close({'status': 'failed', 'error': str(exc_value)})
+        else:
+            self.close()
+        return False
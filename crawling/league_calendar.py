@@ -0,0 +1,269 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+리그 캘린더 + 시즌 백필
+- 스포츠별 월 캘린더(경기 있는 날짜)를 월 단위로 한 번 조회해 JSON 인덱스에 캐시
+- 지난 달은 다시 조회하지 않고, 이번 달 이후는 일정 변경(우천 순연 등) 반영을 위해 하루마다 갱신
+- 시즌 백필은 경기가 있는 날짜만 크롤링 (KBO 월요일, V-리그 비시즌, EPL 주중 공백 등 제외)
+- 캘린더를 가져오지 못한 달은 모든 날짜를 크롤링 (누락보다 낭비가 나음)
+- --bulk: 브라우저 없이 일정 API로 한 달치 경기를 한 번에 받아 날짜별로 저장 (페이지 로드 O(일) → 요청 O(월))
+
+사용법:
+    python league_calendar.py dates kbo 2025-03-01 2025-10-31 [--refresh]
+    python league_calendar.py backfill kbo 2025-03-01 2025-10-31 --queue crawl_jobs.db
+    python league_calendar.py backfill epl 2025-08-01 2025-09-30 --output epl_backfill.jsonl
+    python league_calendar.py backfill volleyball 2025-10-01 2026-03-31 --bulk
+"""
+
+import json
+import os
+from datetime import datetime, timedelta
+from typing import List, Dict, Any, Optional, Tuple
+
+from profiling import profiled
+from sport_registry import get_sport
+
+DEFAULT_INDEX_PATH = 'league_calendar.json'
+
+# 이번 달 이후 캘린더 재조회 간격
+CURRENT_MONTH_TTL = timedelta(days=1)
+
+def month_key(date: datetime) -> str:
+    return date.strftime('%Y-%m')
+
+def iter_dates(start_date: str, end_date: str) -> List[str]:
+    """start_date ~ end_date (포함) 날짜 목록"""
+    start = datetime.strptime(start_date, '%Y-%m-%d')
+    end = datetime.strptime(end_date, '%Y-%m-%d')
+    return [(start + timedelta(days=offset)).strftime('%Y-%m-%d') for offset in range((end - start).days + 1)]
+
+class LeagueCalendar:
+    """스포츠별 월 캘린더 캐시 (JSON 인덱스 파일)"""
+    
+    def __init__(self, path: str = DEFAULT_INDEX_PATH, refresh: bool = False):
+        self.path = path
+        self.refresh = refresh
+        self.index: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        self.fetch_count = 0
+        
+        if os.path.exists(path):
+            with open(path, 'r', encoding='utf-8') as file:
+                self.index = json.load(file)
+    
+    def save(self):
+        temp_path = f"{self.path}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as file:
+            json.dump(self.index, file, ensure_ascii=False, indent=2)
+        os.replace(temp_path, self.path)
+    
+    def is_fresh(self, entry: Dict[str, Any], month: str, now: datetime) -> bool:
+        """캐시된 달을 그대로 써도 되는지"""
+        if self.refresh:
+            return False
+        if month < month_key(now):
+            # 지난 달이라도 그 달이 끝나기 전에 조회한 캐시는 다시 조회
+            return entry['fetched_at'][:7] > month
+        return now - datetime.fromisoformat(entry['fetched_at']) < CURRENT_MONTH_TTL
+    
+    def month_dates(self, sport: str, year: int, month: int) -> Optional[List[str]]:
+        """한 달 중 경기가 있는 날짜 (조회 실패 시 None)"""
+        from naver_schedule_api import fetch_month_game_dates
+        
+        key = f"{year:04d}-{month:02d}"
+        now = datetime.now()
+        entry = self.index.get(sport, {}).get(key)
+        if entry and self.is_fresh(entry, key, now):
+            return entry['dates']
+        
+        try:
+            dates = fetch_month_game_dates(sport, year, month)
+        except Exception as e:
+            print(f"⚠️ {get_sport(sport)['name']} {key} 캘린더 조회 실패: {e}")
+            # 오래된 캐시라도 있으면 사용
+            return entry['dates'] if entry else None
+        
+        self.fetch_count += 1
+        self.index.setdefault(sport, {})[key] = {'dates': dates, 'fetched_at': now.isoformat()}
+        self.save()
+        return dates
+    
+    def game_dates(self, sport: str, start_date: str, end_date: str) -> Tuple[List[str], List[str]]:
+        """
+        기간 중 크롤링할 날짜
+
+        Returns:
+            (크롤링할 날짜, 캘린더를 가져오지 못해 전부 포함한 달)
+        """
+        get_sport(sport)
+        dates = iter_dates(start_date, end_date)
+        months: Dict[str, Optional[set]] = {}
+        unknown_months = []
+        
+        for date in dates:
+            key = date[:7]
+            if key not in months:
+                month_dates = self.month_dates(sport, int(key[:4]), int(key[5:7]))
+                months[key] = set(month_dates) if month_dates is not None else None
+                if month_dates is None:
+                    unknown_months.append(key)
+        
+        return [date for date in dates if months[date[:7]] is None or date in months[date[:7]]], unknown_months
+
+def season_backfill(sport: str, start_date: str, end_date: str, queue_path: Optional[str] = None,
+                    output_file: Optional[str] = None, calendar: Optional[LeagueCalendar] = None,
+                    bulk: bool = False) -> Dict[str, Any]:
+    """
+    경기가 있는 날짜만 백필
+
+    queue_path 지정 시 작업 큐에 backfill 작업으로 넣고 (워커가 크롤링),
+    아니면 이 프로세스에서 직접 크롤링해 output_file(JSONL)에 날짜별로 저장 (체크포인트로 이어서 실행).
+    bulk면 캘린더/브라우저 없이 일정 API로 월 단위 일괄 조회.
+    """
+    output_file = output_file or f"{sport}_backfill_{start_date}_{end_date}.jsonl"
+    if bulk:
+        return crawl_range_bulk(sport, start_date, end_date, output_file)
+    
+    calendar = calendar or LeagueCalendar()
+    all_dates = iter_dates(start_date, end_date)
+    dates, unknown_months = calendar.game_dates(sport, start_date, end_date)
+    
+    summary = {
+        'sport': sport,
+        'calendar_days': len(all_dates),
+        'game_days': len(dates),
+        'pruned_days': len(all_dates) - len(dates),
+        'unknown_months': unknown_months,
+        'calendar_requests': calendar.fetch_count
+    }
+    
+    print(f"🗓️ {get_sport(sport)['name']} {start_date} ~ {end_date}: {len(all_dates)}일 중 경기 있는 날 {len(dates)}일 "
+          f"({summary['pruned_days']}일 제외, 캘린더 요청 {calendar.fetch_count}회)")
+    if unknown_months:
+        print(f"⚠️ 캘린더 없는 달은 전체 날짜 크롤링: {', '.join(unknown_months)}")
+    
+    if queue_path:
+        from job_queue import JobQueue
+        
+        queue = JobQueue(queue_path)
+        try:
+            summary['enqueued'] = sum(queue.enqueue(sport, date, 'backfill') for date in dates)
+        finally:
+            queue.close()
+        print(f"📥 {summary['enqueued']}/{len(dates)}개 백필 작업 추가 ({queue_path})")
+        return summary
+    
+    summary.update(crawl_dates(sport, dates, output_file))
+    return summary
+
+def crawl_dates(sport: str, dates: List[str], output_file: str) -> Dict[str, Any]:
+    """날짜 목록을 드라이버 하나로 직접 크롤링 (날짜마다 저장 + 체크포인트)"""
+    from browser_session import BrowserSession
+    from crawl_checkpoint import CrawlCheckpoint, append_games_jsonl
+    from sport_registry import load_crawler
+    
+    crawler = load_crawler(sport)
+    name = os.path.splitext(output_file)[0]
+    checkpoint = CrawlCheckpoint(name, {'sport': sport, 'dates': dates}, output_file=output_file)
+    pending_dates = checkpoint.pending(dates)
+    failed_dates = []
+    
+    with BrowserSession() as session:
+        for date in pending_dates:
+            print(f"\n📅 {date} 백필 크롤링...")
+            try:
+                games = crawler(date, driver=session.acquire(sport))
+                if games is None:
+                    raise RuntimeError('크롤링 실패')
+                if not games and not session.is_alive():
+                    session.reset()
+                    raise RuntimeError('드라이버 응답 없음')
+            except Exception as e:
+                print(f"❌ {date} 크롤링 실패: {e}")
+                failed_dates.append(date)
+                continue
+            
+            if games:
+                append_games_jsonl(checkpoint.output_file, games)
+            checkpoint.mark_done(date, len(games))
+    
+    total_games = sum(checkpoint.completed.values())
+    print(f"\n🎯 백필 완료: {len(dates) - len(failed_dates)}/{len(dates)}일, {total_games}개 경기 → {checkpoint.output_file}")
+    if failed_dates:
+        print(f"⚠️ 실패한 날짜는 다시 실행하면 이어서 크롤링: {', '.join(failed_dates)}")
+    
+    return {'crawled_days': len(pending_dates) - len(failed_dates), 'failed_dates': failed_dates,
+            'total_games': total_games, 'output_file': checkpoint.output_file}
+
+def crawl_range_bulk(sport: str, start_date: str, end_date: str, output_file: str) -> Dict[str, Any]:
+    """기간 전체를 일정 API 월 단위 요청으로 가져와 날짜별로 저장 (체크포인트로 완료된 달은 건너뜀)"""
+    from crawl_checkpoint import CrawlCheckpoint, append_games_jsonl
+    from naver_schedule_api import fetch_games_by_date, month_windows
+    
+    name = os.path.splitext(output_file)[0]
+    checkpoint = CrawlCheckpoint(name, {'sport': sport, 'start_date': start_date, 'end_date': end_date, 'bulk': True},
+                                 output_file=output_file)
+    windows = month_windows(start_date, end_date)
+    failed_months = []
+    
+    print(f"📦 {get_sport(sport)['name']} {start_date} ~ {end_date} 일괄 조회 ({len(windows)}개월)")
+    
+    for window_start, window_end in windows:
+        if not checkpoint.pending(iter_dates(window_start, window_end)):
+            continue
+        
+        try:
+            games_by_date = fetch_games_by_date(sport, window_start, window_end)
+        except Exception as e:
+            print(f"❌ {window_start[:7]} 일괄 조회 실패: {e}")
+            failed_months.append(window_start[:7])
+            continue
+        
+        for date in checkpoint.pending(sorted(games_by_date)):
+            games = games_by_date[date]
+            if games:
+                append_games_jsonl(checkpoint.output_file, games)
+            checkpoint.mark_done(date, len(games))
+    
+    total_games = sum(checkpoint.completed.values())
+    game_days = sum(1 for count in checkpoint.completed.values() if count)
+    print(f"🎯 일괄 조회 완료: 경기 있는 날 {game_days}일, {total_games}개 경기 → {checkpoint.output_file}")
+    if failed_months:
+        print(f"⚠️ 실패한 달은 다시 실행하면 이어서 조회: {', '.join(failed_months)}")
+    
+    return {'sport': sport, 'months': len(windows), 'failed_months': failed_months, 'game_days': game_days,
+            'total_games': total_games, 'output_file': checkpoint.output_file}
+
+@profiled
+def main():
+    """메인 실행 함수"""
+    import argparse
+    
+    parser = argparse.ArgumentParser(description='리그 캘린더 기반 시즌 백필')
+    parser.add_argument('--index', default=DEFAULT_INDEX_PATH, help='캘린더 캐시 JSON 파일')
+    parser.add_argument('--refresh', action='store_true', help='캐시를 무시하고 캘린더 다시 조회')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    
+    for command, help_text in (('dates', '경기 있는 날짜 출력'), ('backfill', '경기 있는 날짜만 백필')):
+        subparser = subparsers.add_parser(command, help=help_text)
+        subparser.add_argument('sport', choices=['kbo', 'volleyball', 'epl'])
+        subparser.add_argument('start_date', help='시작 날짜 (YYYY-MM-DD)')
+        subparser.add_argument('end_date', help='종료 날짜 (YYYY-MM-DD)')
+        if command == 'backfill':
+            subparser.add_argument('--queue', help='SQLite 작업 큐 파일 (지정 시 워커가 크롤링)')
+            subparser.add_argument('--output', help='직접 크롤링 결과 JSONL 파일')
+            subparser.add_argument('--bulk', action='store_true', help='브라우저 없이 일정 API로 월 단위 일괄 조회')
+    
+    args = parser.parse_args()
+    calendar = LeagueCalendar(args.index, refresh=args.refresh)
+    
+    if args.command == 'dates':
+        dates, unknown_months = calendar.game_dates(args.sport, args.start_date, args.end_date)
+        for date in dates:
+            print(date)
+        print(f"📊 {len(dates)}일 (캘린더 없는 달: {', '.join(unknown_months) or '없음'})")
+    else:
+        season_backfill(args.sport, args.start_date, args.end_date, args.queue, args.output, calendar, args.bulk)
+
+if __name__ == "__main__":
+    main()
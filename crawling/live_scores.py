@@ -0,0 +1,293 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+실시간 점수 폴링 (KBO / 배구 / EPL)
+- 일정 페이지를 한 번 열어 두고, 아직 끝나지 않은 경기의 MatchBox만 짧은 간격으로 다시 읽음
+- 시작 시 첫 스냅샷을 DB 행과 비교해 다른 필드를 먼저 반영하고, 이후 직전 스냅샷과 비교해 바뀐 점수/상태 필드만 모아 DB에 배치 반영
+- 모든 경기가 끝나면 종료
+
+사용법:
+    python live_scores.py kbo --date 2025-09-23 --interval 30 [--dry-run]
+"""
+
+import re
+import time
+from datetime import datetime
+from typing import List, Dict, Any, Optional, Tuple
+
+from auto_settlement import settle_closed_games
+from browser_session import create_chrome_driver
+from instrumentation import span
+from profiling import profiled
+from reconcile import iter_db_rows
+from sport_registry import get_sport, schedule_url
+from validation_rules import RULE_SETS, get_rule_set
+
+# 진행 중인 경기 박스만 골라 필요한 값만 반환 (브라우저 왕복 1회)
+READ_MATCH_BOXES_JS = r"""
+const tracked = arguments[0];
+const text = el => el ? el.textContent.trim() : null;
+return Array.from(document.querySelectorAll('li.MatchBox_match_item__WiPhj')).map(box => {
+    const teams = box.querySelectorAll('.MatchBoxHeadToHeadArea_team_item__9ZknX');
+    if (teams.length < 2) return null;
+    const home = text(teams[0].querySelector('.MatchBoxHeadToHeadArea_team__l2ZxP'));
+    const away = text(teams[1].querySelector('.MatchBoxHeadToHeadArea_team__l2ZxP'));
+    if (!home || !away || (tracked && !tracked.includes(home + '|' + away))) return null;
+    return {
+        home_team: home,
+        away_team: away,
+        home_score: text(teams[0].querySelector('.MatchBoxHeadToHeadArea_score__TChmp')),
+        away_score: text(teams[1].querySelector('.MatchBoxHeadToHeadArea_score__TChmp')),
+        status: text(box.querySelector('.MatchBox_status__xU6\\+d')),
+        time: text(box.querySelector('.MatchBox_time__Zt5-d'))
+    };
+}).filter(Boolean);
+"""
+
+FINAL_STATUS_WORDS = ('종료', 'final', '완료', 'ft')
+CANCELLED_STATUS_WORDS = ('취소', '연기')
+
+def parse_score(value: Optional[str]) -> Optional[int]:
+    """점수 텍스트 → 정수 (숫자가 아니면 None)"""
+    if value is None:
+        return None
+    value = value.strip()
+    return int(value) if value.isdigit() else None
+
+def parse_match_box(sport: str, box: Dict[str, Any]) -> Dict[str, Any]:
+    """MatchBox 원시 값을 점수/상태 스냅샷으로 변환"""
+    labels = RULE_SETS[sport]['result_labels']
+    rules = get_rule_set(sport)
+    status_text = (box.get('status') or '').strip()
+    home_score = parse_score(box.get('home_score'))
+    away_score = parse_score(box.get('away_score'))
+    
+    is_closed = any(word in status_text.lower() for word in FINAL_STATUS_WORDS)
+    cancelled = any(word in status_text for word in CANCELLED_STATUS_WORDS)
+    # 예정 경기에는 점수가 표시되지 않음
+    is_live = not is_closed and not cancelled and home_score is not None and away_score is not None
+    
+    # 결과는 경기가 끝났을 때만 기록
+    result = None
+    if is_closed and home_score is not None and away_score is not None:
+        if home_score > away_score:
+            result = labels['home']
+        elif home_score < away_score:
+            result = labels['away']
+        else:
+            result = labels['draw']
+    
+    time_match = re.search(r'(\d{1,2}):(\d{2})', box.get('time') or '')
+    
+    return {
+        'home_team': rules.normalize_team(box['home_team']),
+        'away_team': rules.normalize_team(box['away_team']),
+        'home_score': home_score,
+        'away_score': away_score,
+        'result': result,
+        'is_closed': is_closed,
+        'is_cancelled': cancelled,
+        'is_live': is_live,
+        'page_key': f"{box['home_team']}|{box['away_team']}",  # 페이지에 표시된 원래 팀명
+        'time': f"{time_match.group(1).zfill(2)}:{time_match.group(2)}" if time_match else None
+    }
+
+# 연속으로 이 횟수만큼 페이지에서 찾지 못한 경기는 추적 중단
+MAX_MISSING_POLLS = 5
+
+# DB에 반영할 필드 (스냅샷 비교 대상)
+PUSH_FIELDS = ('home_score', 'away_score', 'result', 'is_closed')
+
+def diff_snapshots(previous: Dict[Tuple[str, str], Dict[str, Any]],
+                   current: Dict[Tuple[str, str], Dict[str, Any]]) -> Dict[Tuple[str, str], Dict[str, Any]]:
+    """직전 스냅샷과 비교해 경기별로 바뀐 필드만 반환"""
+    changes = {}
+    for match, game in current.items():
+        before = previous.get(match, {})
+        changed = {field: game[field] for field in PUSH_FIELDS if before.get(field) != game[field]}
+        if changed:
+            changes[match] = changed
+    return changes
+
+def push_changes(client, table: str, changes_by_id: Dict[Any, Dict[str, Any]]) -> List[Any]:
+    """바뀐 필드 배치 반영 (같은 변경 내용은 한 번의 요청으로 묶음), 반영된 경기 ID 반환"""
+    groups: Dict[Tuple, List[Any]] = {}
+    for game_id, changes in changes_by_id.items():
+        groups.setdefault(tuple(sorted(changes.items())), []).append(game_id)
+    
+    updated = []
+    for changes, ids in groups.items():
+        try:
+            with span('supabase_update', table=table):
+                client.table(table).update(dict(changes)).in_('id', ids).execute()
+            updated.extend(ids)
+        except Exception as e:
+            print(f"❌ 점수 반영 실패 (id={ids}): {e}")
+    return updated
+
+class LiveScorePoller:
+    """한 스포츠/날짜의 진행 중 경기 점수 폴링"""
+    
+    def __init__(self, sport: str, date: str, client=None, interval: float = 30,
+                 refresh_every: int = 10, driver=None, settle: bool = False):
+        self.sport = sport
+        self.date = date
+        self.spec = get_sport(sport)
+        self.client = client
+        self.interval = interval
+        self.refresh_every = refresh_every
+        self.settle = settle
+        self.own_driver = driver is None
+        self.driver = driver
+        self.snapshot: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        self.game_ids: Dict[Tuple[str, str], Any] = {}
+        self.db_state: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        self.poll_count = 0
+        self.pushed = 0
+        self.missing_polls: Dict[Tuple[str, str], int] = {}
+    
+    def read_boxes(self, tracked: Optional[List[Tuple[str, str]]] = None) -> Dict[Tuple[str, str], Dict[str, Any]]:
+        """MatchBox 읽기 (tracked 지정 시 해당 경기만)"""
+        keys = [self.snapshot[match]['page_key'] for match in tracked] if tracked is not None else None
+        boxes = self.driver.execute_script(READ_MATCH_BOXES_JS, keys)
+        games = {}
+        for box in boxes:
+            game = parse_match_box(self.sport, box)
+            games[(game['home_team'], game['away_team'])] = game
+        return games
+    
+    def load_game_ids(self):
+        """DB 행 id와 저장된 점수/상태 조회 (같은 날짜, 팀 매치업 기준)"""
+        if self.client is None:
+            return
+        stats: Dict[str, int] = {}
+        for row in iter_db_rows(self.client, self.sport, self.date, self.date, stats):
+            match = (row['home_team'], row['away_team'])
+            self.game_ids[match] = row['id']
+            self.db_state[match] = {field: row[field] for field in PUSH_FIELDS}
+        print(f"🔗 DB 경기 {len(self.game_ids)}개 연결")
+    
+    def start(self):
+        """페이지 열고 첫 스냅샷 생성, DB 행과 다른 필드는 바로 반영"""
+        if self.driver is None:
+            self.driver = create_chrome_driver()
+        
+        url = schedule_url(self.sport, self.date)
+        print(f"📡 접속: {url}")
+        self.driver.get(url)
+        time.sleep(5)
+        
+        self.snapshot = self.read_boxes()
+        self.load_game_ids()
+        
+        live = [match for match, game in self.snapshot.items() if game['is_live']]
+        print(f"📊 {len(self.snapshot)}개 경기 중 진행 중 {len(live)}개")
+        
+        # 폴링 시작 전에 바뀐 점수/종료 상태 (첫 스냅샷과 DB 행 비교)
+        initial = {match: game for match, game in self.snapshot.items() if match in self.db_state}
+        changes = diff_snapshots(self.db_state, initial)
+        if changes:
+            print(f"🔄 DB와 다른 경기 {len(changes)}개 반영")
+            self.push(changes)
+    
+    def tracked_matches(self) -> List[Tuple[str, str]]:
+        """아직 끝나지 않은 경기 (취소/연기, 페이지에서 사라진 경기 제외)"""
+        return [
+            match for match, game in self.snapshot.items()
+            if not game['is_closed'] and not game['is_cancelled'] and self.missing_polls.get(match, 0) < MAX_MISSING_POLLS
+        ]
+    
+    def poll(self) -> Dict[Tuple[str, str], Dict[str, Any]]:
+        """진행 중 경기만 다시 읽고 바뀐 필드 반영"""
+        self.poll_count += 1
+        if self.refresh_every and self.poll_count % self.refresh_every == 0:
+            self.driver.refresh()
+            time.sleep(3)
+        
+        tracked = self.tracked_matches()
+        current = self.read_boxes(tracked)
+        for match in tracked:
+            if match in current:
+                self.missing_polls.pop(match, None)
+            else:
+                self.missing_polls[match] = self.missing_polls.get(match, 0) + 1
+        
+        changes = diff_snapshots(self.snapshot, current)
+        self.snapshot.update(current)
+        
+        if not changes:
+            return changes
+        
+        now = datetime.now().strftime('%H:%M:%S')
+        for (home, away), changed in changes.items():
+            game = current[(home, away)]
+            print(f"⚡ {now} {away} {game['away_score']} : {game['home_score']} {home} "
+                  f"{'(종료)' if game['is_closed'] else ''} {changed}")
+        
+        self.push(changes)
+        return changes
+    
+    def push(self, changes: Dict[Tuple[str, str], Dict[str, Any]]):
+        """경기별 바뀐 필드 DB 반영 (settle 지정 시 방금 종료된 경기 마켓 정산)"""
+        if self.client is None:
+            return
+        
+        changes_by_id = {self.game_ids[match]: changed for match, changed in changes.items() if match in self.game_ids}
+        missing = len(changes) - len(changes_by_id)
+        if missing:
+            print(f"⚠️ DB에 없는 경기 {missing}개는 반영하지 않음")
+        updated = push_changes(self.client, self.spec['table'], changes_by_id)
+        self.pushed += len(updated)
+        
+        # 방금 종료된 경기의 마켓 정산
+        closed_ids = [game_id for game_id in updated if changes_by_id[game_id].get('is_closed') is True]
+        if self.settle and closed_ids:
+            settle_closed_games(self.client, self.sport, closed_ids)
+    
+    def run(self, max_polls: Optional[int] = None):
+        """모든 경기가 끝날 때까지 폴링"""
+        print(f"🔴 {self.spec['name']} {self.date} 실시간 점수 폴링 시작 (간격 {self.interval}초)")
+        print("=" * 60)
+        
+        try:
+            self.start()
+            while self.tracked_matches():
+                if max_polls is not None and self.poll_count >= max_polls:
+                    break
+                time.sleep(self.interval)
+                self.poll()
+            print(f"\n🏁 폴링 종료: {self.poll_count}회 폴링, DB 반영 {self.pushed}건")
+        except KeyboardInterrupt:
+            print("\n🛑 폴링 중단")
+        finally:
+            self.close()
+    
+    def close(self):
+        if self.driver and self.own_driver:
+            self.driver.quit()
+            self.driver = None
+
+@profiled
+def main():
+    """메인 실행 함수"""
+    import argparse
+    
+    parser = argparse.ArgumentParser(description='실시간 점수 폴링')
+    parser.add_argument('sport', choices=['kbo', 'volleyball', 'epl'])
+    parser.add_argument('--date', default=datetime.now().strftime('%Y-%m-%d'), help='경기 날짜 (YYYY-MM-DD)')
+    parser.add_argument('--interval', type=float, default=30, help='폴링 간격 (초)')
+    parser.add_argument('--refresh-every', type=int, default=10, help='N번 폴링마다 페이지 새로고침 (0이면 안 함)')
+    parser.add_argument('--dry-run', action='store_true', help='DB에 반영하지 않고 변경만 출력')
+    parser.add_argument('--settle', action='store_true', help='종료된 경기의 스포츠 마켓 자동 정산')
+    args = parser.parse_args()
+    
+    client = None
+    if not args.dry_run:
+        from reconcile import create_supabase_client
+        client = create_supabase_client()
+    
+    LiveScorePoller(args.sport, args.date, client, args.interval, args.refresh_every, settle=args.settle).run()
+
+if __name__ == "__main__":
+    main()
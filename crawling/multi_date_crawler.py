@@ -3,87 +3,143 @@
 
 import time
 import json
-import csv
 import re
 from datetime import datetime, timedelta
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from bs4 import BeautifulSoup
+from browser_session import BrowserSession, report_page_transfer
+from crawl_checkpoint import CrawlCheckpoint, append_games_csv, read_games_csv
+from crawl_health import record_page
+from crawl_logging import get_logger
+from instrumentation import span, timed_sleep
+from jsonl_report import JsonlReportWriter
+from profiling import profiled
+from sport_registry import schedule_url
+from team_aliases import get_team_index
 
-def crawl_naver_kbo_multi_dates(start_date_str, days_count=7):
-    """네이버 스포츠 여러 날짜 KBO 일정 크롤링"""
+logger = get_logger(__name__)
+
+def crawl_naver_kbo_multi_dates(start_date_str, days_count=7, report_path=None):
+    """
+    네이버 스포츠 여러 날짜 KBO 일정 크롤링 (report_path 지정 시 진행 상황을 JSONL로 기록)
+    
+    날짜마다 경기를 CSV에 바로 저장하고 체크포인트를 남기므로,
+    중간에 오류/중단되더라도 같은 인자로 다시 실행하면 완료되지 않은 날짜부터 이어서 크롤링한다.
+    """
     
     print(f"🏟️ 네이버 스포츠 {days_count}일간 크롤링 시작 (시작: {start_date_str})")
     print("=" * 60)
     
-    # Chrome 설정
-    options = Options()
-    options.add_argument('--headless')
-    options.add_argument('--no-sandbox')
-    options.add_argument('--disable-dev-shm-usage')
-    options.add_argument('--user-agent=Mozilla/5.0 (iPhone; CPU iPhone OS 15_0 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/15.0 Mobile/15E148 Safari/604.1')
+    report = None
+    if report_path:
+        report = JsonlReportWriter(report_path, 'crawl', sport='kbo', start_date=start_date_str, days_count=days_count)
+    
+    fieldnames = ['date', 'homeTeam', 'awayTeam', 'homeScore', 'awayScore', 'result', 'status', 'time', 'stadium', 'source']
+    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+    checkpoint = CrawlCheckpoint(
+        f"kbo_multi_dates_{start_date_str}_{days_count}",
+        {'start_date': start_date_str, 'days_count': days_count},
+        output_file=f"kbo_multi_dates_{start_date_str}_{timestamp}.csv"
+    )
+    filename = checkpoint.output_file
+    
+    # 시작 날짜 파싱
+    start_date = datetime.strptime(start_date_str, '%Y-%m-%d')
+    dates = [(start_date + timedelta(days=day_offset)).strftime('%Y-%m-%d') for day_offset in range(days_count)]
+    pending_dates = checkpoint.pending(dates)
     
-    driver = None
-    all_games = []
+    if len(pending_dates) < len(dates):
+        print(f"⏭️ 이미 완료된 {len(dates) - len(pending_dates)}일은 건너뜀")
+    
+    # 날짜가 많아도 작업 수/메모리 상한을 넘으면 드라이버를 새로 띄워 메모리 사용량 유지
+    session = BrowserSession(window_size=(375, 812))  # iPhone 크기
     
     try:
-        driver = webdriver.Chrome(options=options)
-        driver.set_window_size(375, 812)  # iPhone 크기
-        
-        # 시작 날짜 파싱
-        start_date = datetime.strptime(start_date_str, '%Y-%m-%d')
-        
-        for day_offset in range(days_count):
-            current_date = start_date + timedelta(days=day_offset)
-            date_str = current_date.strftime('%Y-%m-%d')
-            
+        for date_str in pending_dates:
             print(f"\n📅 {date_str} 크롤링 중...")
+            started = time.perf_counter()
+            stats = {}
+            driver = session.acquire('kbo')
             
-            url = f"https://m.sports.naver.com/kbaseball/schedule/index?date={date_str}"
+            url = schedule_url('kbo', date_str)
             print(f"📡 접속: {url}")
             
-            driver.get(url)
-            time.sleep(3)
-            
-            # 페이지 소스 가져오기
-            page_source = driver.page_source
-            print(f"📄 페이지 크기: {len(page_source)} bytes")
-            
-            # BeautifulSoup으로 파싱
-            soup = BeautifulSoup(page_source, 'html.parser')
+            try:
+                tags = {'sport': 'kbo', 'date': date_str}
+                with span('page_load', **tags):
+                    driver.get(url)
+                timed_sleep(3, **tags)
+                
+                # 페이지 소스 가져오기
+                with span('page_source', **tags):
+                    page_source = driver.page_source
+                print(f"📄 페이지 크기: {len(page_source)} bytes")
+                report_page_transfer(driver, f"kbo {date_str}")
+                
+                # BeautifulSoup으로 파싱
+                with span('parse_html', **tags):
+                    soup = BeautifulSoup(page_source, 'html.parser')
+                
+                # 경기 정보 추출
+                with span('extract', **tags):
+                    games = extract_games_from_soup(soup, date_str, stats)
+            except Exception as e:
+                # 완료 처리하지 않으므로 다음 실행에서 다시 크롤링
+                print(f"❌ {date_str} 크롤링 중 오류 발생: {e}")
+                record_page('kbo', time.perf_counter() - started, success=False, stats=stats)
+                if report:
+                    report.issue(f"{date_str} 크롤링 중 오류 발생: {e}", date=date_str)
+                continue
             
-            # 경기 정보 추출
-            games = extract_games_from_soup(soup, date_str)
+            record_page('kbo', time.perf_counter() - started, games, success=bool(stats.get('elements')), stats=stats)
             
             if games:
-                all_games.extend(games)
+                with span('csv_write', **tags):
+                    append_games_csv(filename, games, fieldnames)
                 print(f"✅ {len(games)}개 경기 발견")
             else:
                 print("❌ 경기 없음")
             
-            time.sleep(2)  # 요청 간격
+            # 날짜 경기 저장 후 완료 기록
+            checkpoint.mark_done(date_str, len(games))
+            
+            if report:
+                for game in games:
+                    report.game(game)
+                report.write('date', date=date_str, game_count=len(games), page_bytes=len(page_source))
+            
+            timed_sleep(2, **tags)  # 요청 간격
         
     except Exception as e:
         print(f"❌ 크롤링 중 오류 발생: {e}")
+        if report:
+            report.issue(f"크롤링 중 오류 발생: {e}")
         
     finally:
-        if driver:
-            driver.quit()
-    
-    if all_games:
-        # CSV 파일로 저장
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        filename = f"kbo_multi_dates_{start_date_str}_{timestamp}.csv"
+        session.close()
         
-        with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
-            fieldnames = ['date', 'homeTeam', 'awayTeam', 'homeScore', 'awayScore', 'result', 'status', 'time', 'stadium', 'source']
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-            writer.writeheader()
-            writer.writerows(all_games)
+        # 이번 실행 이전에 완료된 날짜 포함 전체 결과
+        all_games = read_games_csv(filename)
+        incomplete_dates = checkpoint.pending(dates)
         
+        if report:
+            report.close({
+                'total_games': len(all_games),
+                'finished_games': sum(1 for game in all_games if game['status'] == '종료'),
+                'incomplete_dates': incomplete_dates
+            })
+            print(f"📋 JSONL 리포트: {report_path}")
+    
+    if incomplete_dates:
+        print(f"\n⚠️ 완료되지 않은 날짜 {len(incomplete_dates)}일: {', '.join(incomplete_dates)}")
+        print("   같은 인자로 다시 실행하면 이어서 크롤링합니다.")
+    else:
+        # 전체 완료 시 체크포인트 삭제 (결과 CSV는 유지, 다시 실행하면 새 파일로 크롤링)
+        checkpoint.clear()
+    
+    if all_games:
         print(f"\n💾 CSV 저장 완료: {filename}")
         
         # 결과 요약
@@ -103,12 +159,14 @@ def crawl_naver_kbo_multi_dates(start_date_str, days_count=7):
         print("❌ 크롤링된 데이터가 없습니다.")
         return None
 
-def extract_games_from_soup(soup, date_str):
-    """BeautifulSoup 객체에서 경기 정보 추출"""
+def extract_games_from_soup(soup, date_str, stats=None):
+    """BeautifulSoup 객체에서 경기 정보 추출 (stats에 요소 수/추출 실패/대체 선택자 사용 기록)"""
     games = []
+    if stats is None:
+        stats = {}
     
     try:
-        print("🔍 경기 정보 검색 중...")
+        logger.info("🔍 경기 정보 검색 중...")
         
         # 경기 항목 찾기 (다양한 선택자 시도)
         selectors = [
@@ -123,31 +181,22 @@ def extract_games_from_soup(soup, date_str):
         for selector in selectors:
             items = soup.select(selector)
             if items:
-                print(f"  ✅ {selector}: {len(items)}개 요소 발견")
+                logger.info("  ✅ %s: %s개 요소 발견", selector, len(items))
                 match_items = items
+                stats.update(elements=len(items), selector=selector, fallback=selector != selectors[0], extract_failures=0)
                 break
         
         if not match_items:
-            print("  ❌ 경기 항목을 찾을 수 없습니다.")
+            logger.warning("  ❌ 경기 항목을 찾을 수 없습니다.")
             return games
         
         for item in match_items:
             try:
                 item_text = item.get_text(strip=True)
-                print(f"    📊 경기 후보: {item_text[:100]}...")
+                logger.debug("    📊 경기 후보: %s...", item_text[:100])
                 
-                # 팀명 추출 패턴들
-                team_patterns = [
-                    r'(KIA|KT|LG|두산|키움|한화|롯데|삼성|SSG|NC)',
-                    r'(기아|케이티|엘지|두산|키움|한화|롯데|삼성|에스에스지|엔씨)'
-                ]
-                
-                teams_found = []
-                for pattern in team_patterns:
-                    teams = re.findall(pattern, item_text)
-                    if len(teams) >= 2:
-                        teams_found = teams[:2]  # 처음 두 팀만
-                        break
+                # 팀명 추출 (한글/영문 별칭을 대표 이름으로, 처음 두 팀만, 텍스트 노드 사이는 공백으로 구분)
+                teams_found = get_team_index('kbo').scan(item.get_text(' ', strip=True))[:2]
                 
                 if len(teams_found) < 2:
                     continue
@@ -209,17 +258,19 @@ def extract_games_from_soup(soup, date_str):
                 }
                 
                 games.append(game)
-                print(f"    ✅ 경기 추출: {away_team} vs {home_team}")
+                logger.debug("    ✅ 경기 추출: %s vs %s", away_team, home_team)
                 
             except Exception as e:
-                print(f"    ❌ 경기 파싱 오류: {e}")
+                logger.warning("    ❌ 경기 파싱 오류: %s", e)
+                stats['extract_failures'] += 1
                 continue
     
     except Exception as e:
-        print(f"❌ 전체 파싱 오류: {e}")
+        logger.warning("❌ 전체 파싱 오류: %s", e)
     
     return games
 
+@profiled
 def main():
     """메인 실행 함수"""
     # 오늘부터 일주일간 크롤링
@@ -231,7 +282,8 @@ def main():
     print(f"   크롤링 일수: 7일")
     print()
     
-    filename = crawl_naver_kbo_multi_dates(start_date, 7)
+    report_path = f"kbo_multi_dates_{start_date}_{today.strftime('%Y%m%d_%H%M%S')}_report.jsonl"
+    filename = crawl_naver_kbo_multi_dates(start_date, 7, report_path=report_path)
     
     if filename:
         print(f"\n✅ 크롤링 완료! 파일: {filename}")
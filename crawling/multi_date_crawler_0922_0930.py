@@ -9,17 +9,22 @@ import subprocess
 # 기존 크롤러 import
 sys.path.append(os.path.dirname(__file__))
 from naver_2025_0916_crawler import crawl_naver_kbo_date
+from crawl_checkpoint import CrawlCheckpoint
 
-def crawl_date_range():
-    """2025년 9월 22일부터 30일까지 KBO 경기 크롤링"""
+def crawl_date_range(start_date_str="2025-09-22", end_date_str="2025-09-30"):
+    """2025년 9월 22일부터 30일까지 KBO 경기 크롤링 (중단 후 다시 실행하면 이어서 크롤링)"""
     
     print("🏟️ KBO 경기 다중 날짜 크롤링 시작")
-    print("📅 기간: 2025년 9월 22일 ~ 30일")
+    print(f"📅 기간: {start_date_str} ~ {end_date_str}")
     print("=" * 60)
     
     # 크롤링할 날짜 범위 설정
-    start_date = datetime(2025, 9, 22)
-    end_date = datetime(2025, 9, 30)
+    start_date = datetime.strptime(start_date_str, '%Y-%m-%d')
+    end_date = datetime.strptime(end_date_str, '%Y-%m-%d')
+    
+    # 날짜별 완료 기록 (경기 저장은 crawl_naver_kbo_date가 날짜마다 수행)
+    checkpoint = CrawlCheckpoint(f"kbo_date_range_{start_date_str}_{end_date_str}",
+                                 {'start_date': start_date_str, 'end_date': end_date_str})
     
     current_date = start_date
     total_games = 0
@@ -28,10 +33,23 @@ def crawl_date_range():
     
     while current_date <= end_date:
         date_str = current_date.strftime('%Y-%m-%d')
+        
+        if checkpoint.is_done(date_str):
+            games_count = checkpoint.completed[date_str]
+            print(f"\n⏭️ {date_str}: 이전 실행에서 완료 ({games_count}개 경기)")
+            successful_dates.append((date_str, games_count))
+            total_games += games_count
+            current_date += timedelta(days=1)
+            continue
+        
         print(f"\n📅 {date_str} 크롤링 시작...")
         
         try:
-            games_count = crawl_naver_kbo_date(date_str)
+            # 크롤러는 경기 목록을 반환 (실패 시 None → 완료 처리하지 않고 다음 실행에서 다시 크롤링)
+            games = crawl_naver_kbo_date(date_str)
+            if games is None:
+                raise RuntimeError('크롤링 실패')
+            games_count = len(games)
             
             if games_count > 0:
                 print(f"✅ {date_str}: {games_count}개 경기 크롤링 완료")
@@ -40,6 +58,8 @@ def crawl_date_range():
             else:
                 print(f"ℹ️  {date_str}: 경기 없음")
                 successful_dates.append((date_str, 0))
+            
+            checkpoint.mark_done(date_str, games_count)
                 
         except Exception as e:
             print(f"❌ {date_str} 크롤링 실패: {e}")
@@ -47,6 +67,10 @@ def crawl_date_range():
         
         current_date += timedelta(days=1)
     
+    # 전체 완료 시 체크포인트 삭제 (다시 실행하면 새로 크롤링)
+    if not failed_dates:
+        checkpoint.clear()
+    
     # 결과 요약
     print("\n" + "=" * 60)
     print("🎉 크롤링 완료!")
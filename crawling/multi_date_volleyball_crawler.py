@@ -13,9 +13,12 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from bs4 import BeautifulSoup
+from crawl_checkpoint import CrawlCheckpoint, append_games_jsonl, read_games_jsonl
+from jsonl_report import JsonlReportWriter
+from profiling import profiled
 
 def crawl_naver_volleyball_date(target_date):
-    """네이버 스포츠 특정 날짜 배구 일정 크롤링"""
+    """네이버 스포츠 특정 날짜 배구 일정 크롤링 (실패 시 None, 경기 없는 날은 빈 목록)"""
     
     print(f"🏐 네이버 스포츠 {target_date} 배구 크롤링 시작")
     print("-" * 50)
@@ -103,7 +106,7 @@ def crawl_naver_volleyball_date(target_date):
         
     except Exception as e:
         print(f"❌ {target_date} 크롤링 중 오류: {e}")
-        return []
+        return None
         
     finally:
         if driver:
@@ -182,6 +185,10 @@ def extract_volleyball_game_info(game_element, target_date, game_num):
         elif team_elements[1].get('class') and 'type_winner' in ' '.join(team_elements[1].get('class', [])):
             result = "away_win"
         
+        # 결과는 종료된 경기만 (진행 중 세트 스코어는 결과가 아님)
+        if not is_closed:
+            result = None
+        
         start_time = f"{target_date}T{game_time}:00+09:00"
         
         game_data = {
@@ -203,41 +210,87 @@ def extract_volleyball_game_info(game_element, target_date, game_num):
         print(f"  ❌ 경기 {game_num} 정보 추출 중 오류: {e}")
         return None
 
-def crawl_multiple_dates(start_date, end_date):
-    """여러 날짜의 배구 경기 크롤링"""
+def crawl_multiple_dates(start_date, end_date, report_path=None):
+    """
+    여러 날짜의 배구 경기 크롤링 (report_path 지정 시 진행 상황을 JSONL로 기록)
+    
+    날짜마다 경기를 JSONL 부분 파일에 바로 저장하고 체크포인트를 남기므로,
+    중단 후 같은 기간으로 다시 실행하면 완료되지 않은 날짜부터 이어서 크롤링한다.
+    """
     
     print(f"🏐 배구 다중 날짜 크롤링 시작: {start_date} ~ {end_date}")
     print("=" * 60)
     
-    all_games = []
+    report = None
+    if report_path:
+        report = JsonlReportWriter(report_path, 'crawl', sport='volleyball', start_date=start_date, end_date=end_date)
+    
+    name = f"volleyball_multi_dates_{start_date}_{end_date}"
+    checkpoint = CrawlCheckpoint(name, {'start_date': start_date, 'end_date': end_date},
+                                 output_file=f"{name}.partial.jsonl")
     
     # 날짜 범위 생성
     start = datetime.strptime(start_date, '%Y-%m-%d')
     end = datetime.strptime(end_date, '%Y-%m-%d')
+    dates = [(start + timedelta(days=offset)).strftime('%Y-%m-%d') for offset in range((end - start).days + 1)]
+    pending_dates = checkpoint.pending(dates)
     
-    current_date = start
-    while current_date <= end:
-        date_str = current_date.strftime('%Y-%m-%d')
-        
-        # 각 날짜별 크롤링
-        games = crawl_naver_volleyball_date(date_str)
-        
-        if games:
-            all_games.extend(games)
-            print(f"📅 {date_str}: {len(games)}개 경기 수집")
-        else:
-            print(f"📅 {date_str}: 경기 없음")
-        
-        # 다음 날짜로
-        current_date += timedelta(days=1)
-        
-        # 서버 부하 방지를 위한 대기
-        time.sleep(2)
+    if len(pending_dates) < len(dates):
+        print(f"⏭️ 이미 완료된 {len(dates) - len(pending_dates)}일은 건너뜀")
+    
+    try:
+        for date_str in pending_dates:
+            # 각 날짜별 크롤링 (한 날짜의 오류가 나머지 날짜를 막지 않도록, 실패한 날짜는 완료 처리하지 않음)
+            try:
+                games = crawl_naver_volleyball_date(date_str)
+                if games is None:
+                    raise RuntimeError('크롤링 실패')
+            except Exception as e:
+                print(f"❌ {date_str} 크롤링 중 오류: {e}")
+                if report:
+                    report.issue(f"{date_str} 크롤링 중 오류: {e}", date=date_str)
+                continue
+            
+            if games:
+                append_games_jsonl(checkpoint.output_file, games)
+                print(f"📅 {date_str}: {len(games)}개 경기 수집")
+            else:
+                print(f"📅 {date_str}: 경기 없음")
+            
+            # 날짜 경기 저장 후 완료 기록
+            checkpoint.mark_done(date_str, len(games))
+            
+            if report:
+                for game in games:
+                    report.game(game)
+                report.write('date', date=date_str, game_count=len(games))
+            
+            # 서버 부하 방지를 위한 대기
+            time.sleep(2)
+    finally:
+        # 이전 실행에서 완료된 날짜 포함 전체 결과 (값 타입 유지)
+        all_games = read_games_jsonl(checkpoint.output_file)
+        incomplete_dates = checkpoint.pending(dates)
+        
+        if report:
+            report.close({
+                'total_games': len(all_games),
+                'closed_games': sum(1 for game in all_games if game.get('is_closed')),
+                'incomplete_dates': incomplete_dates
+            })
+            print(f"📋 JSONL 리포트: {report_path}")
     
     print("\n" + "=" * 60)
     print(f"🎉 전체 크롤링 완료!")
     print(f"✅ 총 {len(all_games)}개 배구 경기 수집")
     
+    if incomplete_dates:
+        print(f"⚠️ 완료되지 않은 날짜 {len(incomplete_dates)}일: {', '.join(incomplete_dates)}")
+        print("   같은 기간으로 다시 실행하면 이어서 크롤링합니다.")
+    else:
+        # 전체 완료 시 체크포인트와 부분 파일 삭제 (다시 실행하면 새로 크롤링)
+        checkpoint.clear(remove_output=True)
+    
     return all_games
 
 def save_volleyball_games_to_csv(games, filename_prefix):
@@ -270,6 +323,7 @@ def save_volleyball_games_to_csv(games, filename_prefix):
         print(f"❌ CSV 저장 중 오류: {e}")
         return None
 
+@profiled
 def main():
     """메인 실행 함수"""
     
@@ -281,12 +335,13 @@ def main():
     print(f"📅 크롤링 기간: {start_date} ~ {end_date}")
     print("=" * 60)
     
+    filename_prefix = f"volleyball_games_{start_date.replace('-', '_')}_to_{end_date.replace('-', '_')}"
+    
     # 배구 경기 크롤링
-    all_games = crawl_multiple_dates(start_date, end_date)
+    all_games = crawl_multiple_dates(start_date, end_date, report_path=f"{filename_prefix}_report.jsonl")
     
     if all_games:
         # CSV 파일로 저장
-        filename_prefix = f"volleyball_games_{start_date.replace('-', '_')}_to_{end_date.replace('-', '_')}"
         csv_file = save_volleyball_games_to_csv(all_games, filename_prefix)
         
         # 결과 요약 출력
@@ -6,135 +6,71 @@ import json
 import csv
 import re
 from datetime import datetime
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from bs4 import BeautifulSoup
+from browser_session import create_chrome_driver, report_page_transfer
+from crawl_health import record_page
+from crawl_logging import LazyText, dump, element_text, get_logger
+from debug_artifacts import REASON_ERROR, capture_page
+from instrumentation import record, span, timed, timed_sleep
+from profiling import profiled
+from sport_registry import schedule_url
+from team_aliases import get_team_index, home_stadium
 
-def crawl_naver_kbo_date(target_date):
-    """네이버 스포츠 특정 날짜 KBO 일정 크롤링"""
+logger = get_logger(__name__)
+
+@profiled
+@timed('crawl_total', sport='kbo')
+def crawl_naver_kbo_date(target_date, driver=None):
+    """네이버 스포츠 특정 날짜 KBO 일정 크롤링 (driver 전달 시 재사용, 실패 시 None)"""
     
     print(f"🏟️ 네이버 스포츠 {target_date} 크롤링 시작")
     print("=" * 60)
     
-    # Chrome 설정
-    options = Options()
-    options.add_argument('--headless')
-    options.add_argument('--no-sandbox')
-    options.add_argument('--disable-dev-shm-usage')
-    options.add_argument('--user-agent=Mozilla/5.0 (iPhone; CPU iPhone OS 15_0 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/15.0 Mobile/15E148 Safari/604.1')
-    
-    driver = None
+    # 전달받은 드라이버는 재사용하고 종료하지 않음
+    own_driver = driver is None
     games = []
+    tags = {'sport': 'kbo', 'date': target_date}
+    page_source = None
+    issues = []
+    stats = {}
+    started = time.perf_counter()
     
     try:
-        driver = webdriver.Chrome(options=options)
-        driver.set_page_load_timeout(30)
+        if own_driver:
+            driver = create_chrome_driver(transfer_log=True)
         
         # 네이버 스포츠 접속
-        url = f'https://m.sports.naver.com/kbaseball/schedule/index?date={target_date}'
+        url = schedule_url('kbo', target_date)
         print(f"📡 접속: {url}")
         
-        driver.get(url)
-        time.sleep(5)
+        with span('page_load', **tags):
+            driver.get(url)
+        timed_sleep(5, **tags)
         
         # 페이지 로딩 대기
         try:
-            WebDriverWait(driver, 15).until(
-                lambda driver: driver.execute_script("return document.readyState") == "complete"
-            )
+            with span('page_wait', **tags):
+                WebDriverWait(driver, 15).until(
+                    lambda driver: driver.execute_script("return document.readyState") == "complete"
+                )
         except:
             print("⚠️ 페이지 로딩 타임아웃")
         
         # 추가 대기 (동적 콘텐츠 로딩)
-        time.sleep(3)
+        timed_sleep(3, **tags)
         
         # 페이지 소스 가져오기
-        page_source = driver.page_source
+        with span('page_source', **tags):
+            page_source = driver.page_source
         print(f"📄 페이지 크기: {len(page_source)} bytes")
+        report_page_transfer(driver, f"kbo {target_date}")
         
-        # BeautifulSoup으로 파싱
-        soup = BeautifulSoup(page_source, 'html.parser')
-        
-        # KBO 팀 매핑
-        team_mapping = {
-            'KIA': 'KIA', 'KT': 'KT', 'LG': 'LG', 'NC': 'NC', 'SSG': 'SSG',
-            '두산': '두산', '롯데': '롯데', '삼성': '삼성', '한화': '한화', '키움': '키움',
-            '기아': 'KIA', 'kt': 'KT', 'lg': 'LG', 'nc': 'NC', 'ssg': 'SSG'
-        }
-        
-        # 경기 없음 메시지 확인
-        no_game_messages = [
-            '경기가 없습니다', '일정이 없습니다', '예정된 경기가 없습니다', 
-            '경기 일정이 없습니다', '휴식일', '경기 없음'
-        ]
-        
-        page_text = soup.get_text()
-        for message in no_game_messages:
-            if message in page_text:
-                print(f"⚠️ 발견: {message}")
-                print("✅ 2025-09-16은 KBO 경기가 없는 날입니다.")
-                return []
-        
-        # 다양한 선택자로 경기 정보 찾기
-        selectors = [
-            # 네이버 스포츠 모바일 일반적인 선택자들
-            '[class*="ScheduleAllType_match_item"]',
-            '[class*="match_item"]',
-            '[class*="game_item"]',
-            '[class*="schedule_item"]',
-            '.match_item',
-            '.game_item',
-            '.schedule_item',
-            'li[class*="match"]',
-            'li[class*="game"]',
-            'div[class*="match"]',
-            'div[class*="game"]',
-            'div[class*="vs"]',
-            # 테이블 형태
-            'tr[class*="match"]',
-            'tr[class*="game"]',
-            'table tr',
-            # 기타
-            '[data-game-id]',
-            '[data-match-id]'
-        ]
-        
-        print("🔍 경기 정보 검색 중...")
-        
-        for selector in selectors:
-            elements = soup.select(selector)
-            if elements:
-                print(f"  ✅ {selector}: {len(elements)}개 요소 발견")
-                
-                for element in elements:
-                    text = element.get_text(strip=True)
-                    
-                    # KBO 팀명이 포함된 요소만 처리
-                    teams_found = []
-                    for team_name in team_mapping.keys():
-                        if team_name in text:
-                            teams_found.append(team_mapping[team_name])
-                    
-                    # 중복 제거
-                    teams_found = list(dict.fromkeys(teams_found))
-                    
-                    if len(teams_found) >= 2:
-                        print(f"    📊 경기 후보: {text[:100]}...")
-                        
-                        # 경기 정보 파싱
-                        game = parse_game_info(element, teams_found, target_date)
-                        if game:
-                            games.append(game)
-                            print(f"    ✅ 경기 추출: {game['awayTeam']} vs {game['homeTeam']}")
-                
-                if games:
-                    break
-        
-        # 중복 제거
-        unique_games = remove_duplicates(games)
+        unique_games = parse_kbo_page(page_source, target_date, issues, stats)
+        capture_page('kbo', target_date, page_source, unique_games, issues)
+        record_page('kbo', time.perf_counter() - started, unique_games, success=bool(unique_games) or not issues, stats=stats)
         
         print(f"\n📊 최종 결과:")
         print(f"총 경기 수: {len(unique_games)}개")
@@ -144,7 +80,7 @@ def crawl_naver_kbo_date(target_date):
             timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
             csv_filename = f"naver_{target_date}_{timestamp}.csv"
             
-            with open(csv_filename, 'w', newline='', encoding='utf-8') as csvfile:
+            with span('csv_write', **tags), open(csv_filename, 'w', newline='', encoding='utf-8') as csvfile:
                 fieldnames = ['date', 'homeTeam', 'awayTeam', 'homeScore', 'awayScore', 'result', 'status', 'time', 'stadium', 'source']
                 writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
                 
@@ -168,24 +104,117 @@ def crawl_naver_kbo_date(target_date):
                 print(f"   구장: {game['stadium']}")
         else:
             print("❌ 추출된 경기가 없습니다.")
-            
-            # 페이지 내용 샘플 출력 (디버깅용)
-            print("\n📄 페이지 내용 샘플:")
-            lines = page_text.split('\n')[:20]
-            for line in lines:
-                if line.strip():
-                    print(f"  {line.strip()[:80]}...")
         
         return unique_games
         
     except Exception as e:
         print(f"❌ 크롤링 오류: {e}")
-        return []
+        capture_page('kbo', target_date, page_source, reason=REASON_ERROR)
+        record_page('kbo', time.perf_counter() - started, success=False, stats=stats)
+        return None
         
     finally:
-        if driver:
+        if driver and own_driver:
             driver.quit()
 
+def parse_kbo_page(page_source, target_date, issues=None, stats=None):
+    """저장된/받아온 KBO 일정 페이지 HTML에서 경기 목록 추출 (드라이버 없이 재현 가능, issues/stats에 파싱 문제와 지표 기록)"""
+    
+    games = []
+    if issues is None:
+        issues = []
+    if stats is None:
+        stats = {}
+    tags = {'sport': 'kbo', 'date': target_date}
+    
+    # BeautifulSoup으로 파싱
+    with span('parse_html', **tags):
+        soup = BeautifulSoup(page_source, 'html.parser')
+    
+    # KBO 팀 별칭 색인 (기아, kt, SK, 넥센 등)
+    team_index = get_team_index('kbo')
+    
+    # 경기 없음 메시지 확인
+    no_game_messages = [
+        '경기가 없습니다', '일정이 없습니다', '예정된 경기가 없습니다', 
+        '경기 일정이 없습니다', '휴식일', '경기 없음'
+    ]
+    
+    page_text = soup.get_text()
+    for message in no_game_messages:
+        if message in page_text:
+            logger.info("⚠️ 발견: %s", message)
+            logger.info("✅ %s은 KBO 경기가 없는 날입니다.", target_date)
+            return []
+    
+    # 다양한 선택자로 경기 정보 찾기
+    selectors = [
+        # 현재 네이버 스포츠 경기 항목 (배구/EPL 크롤러와 같은 MatchBox 레이아웃)
+        'li.MatchBox_match_item__WiPhj',
+        # 네이버 스포츠 모바일 일반적인 선택자들 (레이아웃 변경 시 대체)
+        '[class*="ScheduleAllType_match_item"]',
+        '[class*="match_item"]',
+        '[class*="game_item"]',
+        '[class*="schedule_item"]',
+        '.match_item',
+        '.game_item',
+        '.schedule_item',
+        'li[class*="match"]',
+        'li[class*="game"]',
+        'div[class*="match"]',
+        'div[class*="game"]',
+        'div[class*="vs"]',
+        # 테이블 형태
+        'tr[class*="match"]',
+        'tr[class*="game"]',
+        'table tr',
+        # 기타
+        '[data-game-id]',
+        '[data-match-id]'
+    ]
+    
+    logger.info("🔍 경기 정보 검색 중...")
+    extract_started = time.perf_counter()
+    
+    for selector in selectors:
+        elements = soup.select(selector)
+        if elements:
+            logger.info("  ✅ %s: %d개 요소 발견", selector, len(elements))
+            # 첫 번째 선택자가 아니면 대체 선택자 사용 (레이아웃 변경 신호)
+            stats.update(elements=len(elements), selector=selector, fallback=selector != selectors[0], extract_failures=0)
+            
+            for element in elements:
+                # KBO 팀명이 포함된 요소만 처리 (페이지에 나온 순서대로 중복 없이 대표 이름으로, 텍스트 노드 사이는 공백으로 구분)
+                text = element.get_text(' ', strip=True)
+                teams_found = list(dict.fromkeys(team_index.scan(text)))
+                
+                if len(teams_found) >= 2:
+                    logger.debug("    📊 경기 후보: %s", element_text(text, 100))
+                    
+                    # 경기 정보 파싱
+                    game = parse_game_info(element, teams_found, target_date)
+                    if game:
+                        games.append(game)
+                        logger.debug("    ✅ 경기 추출: %s vs %s", game['awayTeam'], game['homeTeam'])
+                    else:
+                        stats['extract_failures'] += 1
+            
+            if games:
+                break
+    
+    # 중복 제거
+    unique_games = remove_duplicates(games)
+    record('extract', time.perf_counter() - extract_started, **tags)
+    
+    if not unique_games:
+        issues.append('경기 정보를 찾지 못함')
+        
+        # 페이지 내용 샘플 출력 (디버깅용, 샘플링된 덤프)
+        dump(logger, "\n📄 페이지 내용 샘플:\n%s", LazyText(lambda: '\n'.join(
+            f"  {line.strip()[:80]}..." for line in page_text.split('\n')[:20] if line.strip())))
+    
+    return unique_games
+
 def parse_game_info(element, teams_found, date_str):
     """경기 정보 파싱"""
     try:
@@ -201,6 +230,10 @@ def parse_game_info(element, teams_found, date_str):
         status = '예정'
         result = None
         
+        # 경기 시간 (점수 패턴이 18:30 같은 시간을 점수로 읽지 않도록 점수 검색 텍스트에서 제외)
+        time_match = re.search(r'(\d{1,2}):(\d{2})', text)
+        score_text = text.replace(time_match.group(0), ' ', 1) if time_match else text
+        
         # 네이버 스포츠 점수 패턴 매칭 (스코어11KIA홈패김태형스코어1 형태)
         score_patterns = [
             # 네이버 스포츠 특별 패턴: "스코어10KT홈패헤이수스스코어6" (non-greedy 매칭)
@@ -210,7 +243,7 @@ def parse_game_info(element, teams_found, date_str):
         ]
         
         for pattern in score_patterns:
-            score_match = re.search(pattern, text)
+            score_match = re.search(pattern, score_text)
             if score_match:
                 score1 = int(score_match.group(1))
                 score2 = int(score_match.group(2))
@@ -226,35 +259,23 @@ def parse_game_info(element, teams_found, date_str):
                         home_score = score1
                         away_score = score2
                     
-                    status = '종료'
-                    
-                    if home_score > away_score:
-                        result = '1'
-                    elif home_score < away_score:
-                        result = '2'
+                    # 점수가 있어도 종료 표시가 없으면 진행 중 (결과 없음)
+                    if '종료' in text:
+                        status = '종료'
+                        if home_score > away_score:
+                            result = '1'
+                        elif home_score < away_score:
+                            result = '2'
+                        else:
+                            result = '0'
                     else:
-                        result = '0'
+                        status = '진행중'
                     break
         
-        # 시간 찾기
-        time_match = re.search(r'(\d{1,2}):(\d{2})', text)
         game_time = time_match.group(0) if time_match else '14:00'
         
         # 구장 매핑
-        stadium_mapping = {
-            'KIA': '광주-기아 챔피언스 필드',
-            'KT': '수원 KT위즈파크',
-            'LG': '서울 잠실야구장',
-            'NC': '창원 NC파크',
-            'SSG': '인천 SSG랜더스필드',
-            '두산': '서울 잠실야구장',
-            '롯데': '부산 사직야구장',
-            '삼성': '대구 삼성라이온즈파크',
-            '한화': '대전 한화생명이글스파크',
-            '키움': '서울 고척스카이돔'
-        }
-        
-        stadium = stadium_mapping.get(home_team, f'{home_team} 홈구장')
+        stadium = home_stadium('kbo', home_team) or f'{home_team} 홈구장'
         
         return {
             'date': date_str,
@@ -270,7 +291,7 @@ def parse_game_info(element, teams_found, date_str):
         }
         
     except Exception as e:
-        print(f"    ⚠️ 파싱 오류: {e}")
+        logger.warning("    ⚠️ 파싱 오류: %s", e)
         return None
 
 def remove_duplicates(games):
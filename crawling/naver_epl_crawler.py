@@ -12,6 +12,9 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from bs4 import BeautifulSoup
+from crawl_logging import dump, element_text, get_logger
+
+logger = get_logger(__name__)
 
 def crawl_naver_epl_date(target_date):
     """네이버 스포츠 특정 날짜 EPL 일정 크롤링"""
@@ -90,8 +93,7 @@ def crawl_naver_epl_date(target_date):
         
         if not game_elements:
             print("❌ 경기 요소를 찾을 수 없습니다. 페이지 구조 분석 필요")
-            print("📄 페이지 내용 샘플:")
-            print(soup.get_text()[:500] + "...")
+            dump(logger, "📄 페이지 내용 샘플:\n%s", element_text(soup, 500))
             return []
         
         print(f"📊 총 {len(game_elements)}개 경기 발견")
@@ -220,8 +222,7 @@ def extract_epl_game_info(game_element, target_date, game_num):
         
         if not home_team or not away_team:
             # 대체 방법: 전체 텍스트에서 팀명 추출
-            game_text = game_element.get_text()
-            print(f"  📄 경기 텍스트: {game_text[:100]}...")
+            dump(logger, "  📄 경기 텍스트: %s", element_text(game_element, 100))
             return None
         
         # 점수 정보 추출
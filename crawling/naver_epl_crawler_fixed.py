@@ -6,86 +6,68 @@ import json
 import csv
 import re
 from datetime import datetime, timedelta
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from bs4 import BeautifulSoup
+from browser_session import create_chrome_driver, report_page_transfer
+from crawl_health import record_page
+from crawl_logging import get_logger
+from debug_artifacts import REASON_ERROR, capture_page
+from instrumentation import record, span, timed, timed_sleep
+from profiling import profiled
+from sport_registry import schedule_url
 
-def crawl_naver_epl_date_fixed(target_date):
-    """네이버 스포츠 특정 날짜 EPL 일정 크롤링 (수정된 버전)"""
+logger = get_logger(__name__)
+
+@profiled
+@timed('crawl_total', sport='epl')
+def crawl_naver_epl_date_fixed(target_date, driver=None):
+    """네이버 스포츠 특정 날짜 EPL 일정 크롤링 (수정된 버전) (driver 전달 시 재사용, 실패 시 None)"""
     
     print(f"⚽ 네이버 스포츠 {target_date} EPL 크롤링 시작 (Fixed)")
     print("=" * 60)
     
-    # Chrome 설정
-    options = Options()
-    options.add_argument('--headless')
-    options.add_argument('--no-sandbox')
-    options.add_argument('--disable-dev-shm-usage')
-    options.add_argument('--user-agent=Mozilla/5.0 (iPhone; CPU iPhone OS 15_0 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/15.0 Mobile/15E148 Safari/604.1')
-    
-    driver = None
+    # 전달받은 드라이버는 재사용하고 종료하지 않음
+    own_driver = driver is None
     games = []
+    tags = {'sport': 'epl', 'date': target_date}
+    page_source = None
+    issues = []
+    stats = {}
+    started = time.perf_counter()
     
     try:
-        driver = webdriver.Chrome(options=options)
-        driver.set_page_load_timeout(30)
+        if own_driver:
+            driver = create_chrome_driver(transfer_log=True)
         
         # 네이버 스포츠 EPL 접속
-        url = f'https://m.sports.naver.com/wfootball/schedule/index?category=epl&date={target_date}'
+        url = schedule_url('epl', target_date)
         print(f"📡 접속: {url}")
         
-        driver.get(url)
-        time.sleep(5)
+        with span('page_load', **tags):
+            driver.get(url)
+        timed_sleep(5, **tags)
         
         # 페이지 로딩 대기
         try:
-            WebDriverWait(driver, 15).until(
-                lambda driver: driver.execute_script("return document.readyState") == "complete"
-            )
+            with span('page_wait', **tags):
+                WebDriverWait(driver, 15).until(
+                    lambda driver: driver.execute_script("return document.readyState") == "complete"
+                )
         except:
             print("⚠️ 페이지 로딩 타임아웃")
         
         # 추가 로딩 대기
-        time.sleep(3)
+        timed_sleep(3, **tags)
         
         # 현재 페이지 소스 확인
-        page_source = driver.page_source
-        soup = BeautifulSoup(page_source, 'html.parser')
-        
-        # EPL 경기 리스트 찾기
-        game_elements = soup.select('li.MatchBox_match_item__WiPhj')
-        
-        if not game_elements:
-            print("❌ 경기 요소를 찾을 수 없습니다.")
-            return []
-        
-        print(f"📊 총 {len(game_elements)}개 요소 발견")
-        print()
-        
-        # 목표 날짜 파싱
-        target_date_obj = datetime.strptime(target_date, '%Y-%m-%d')
-        
-        # 각 경기 정보 추출 (실제 날짜 필터링 포함)
-        for idx, game_element in enumerate(game_elements):
-            try:
-                game_data = extract_epl_game_info_fixed(game_element, target_date, target_date_obj, idx + 1)
-                if game_data:
-                    games.append(game_data)
-                    status = "종료" if game_data['is_closed'] else "예정"
-                    score_info = ""
-                    if game_data['home_score'] is not None and game_data['away_score'] is not None:
-                        score_info = f" ({game_data['away_score']}:{game_data['home_score']})"
-                    
-                    # 실제 경기 날짜 표시
-                    game_date = game_data['start_time'][:10]
-                    print(f"✅ 경기 {len(games)}: {game_data['away_team']} vs {game_data['home_team']} | {game_date} | {status}{score_info}")
-                    
-            except Exception as e:
-                print(f"❌ 경기 {idx + 1} 처리 중 오류: {e}")
-                continue
+        with span('page_source', **tags):
+            page_source = driver.page_source
+        report_page_transfer(driver, f"epl {target_date}")
+        games = parse_epl_page(page_source, target_date, issues, stats)
+        capture_page('epl', target_date, page_source, games, issues)
+        record_page('epl', time.perf_counter() - started, games, success=bool(games) or not issues, stats=stats)
         
         print()
         print(f"🎉 크롤링 완료!")
@@ -96,12 +78,69 @@ def crawl_naver_epl_date_fixed(target_date):
         
     except Exception as e:
         print(f"❌ 크롤링 중 오류 발생: {e}")
-        return []
+        capture_page('epl', target_date, page_source, reason=REASON_ERROR)
+        record_page('epl', time.perf_counter() - started, success=False, stats=stats)
+        return None
         
     finally:
-        if driver:
+        if driver and own_driver:
             driver.quit()
 
+def parse_epl_page(page_source, target_date, issues=None, stats=None):
+    """저장된/받아온 EPL 일정 페이지 HTML에서 경기 목록 추출 (드라이버 없이 재현 가능, issues/stats에 파싱 문제와 지표 기록)"""
+    
+    games = []
+    if issues is None:
+        issues = []
+    if stats is None:
+        stats = {}
+    tags = {'sport': 'epl', 'date': target_date}
+    
+    with span('parse_html', **tags):
+        soup = BeautifulSoup(page_source, 'html.parser')
+    
+    # EPL 경기 리스트 찾기
+    game_elements = soup.select('li.MatchBox_match_item__WiPhj')
+    stats['elements'] = len(game_elements)
+    
+    if not game_elements:
+        logger.warning("❌ 경기 요소를 찾을 수 없습니다.")
+        issues.append('경기 요소 없음')
+        return []
+    
+    logger.info("📊 총 %s개 요소 발견", len(game_elements))
+    
+    # 목표 날짜 파싱
+    target_date_obj = datetime.strptime(target_date, '%Y-%m-%d')
+    
+    extract_started = time.perf_counter()
+    issues_before = len(issues)
+    
+    # 각 경기 정보 추출 (실제 날짜 필터링 포함)
+    for idx, game_element in enumerate(game_elements):
+        try:
+            game_data = extract_epl_game_info_fixed(game_element, target_date, target_date_obj, idx + 1)
+            if game_data:
+                games.append(game_data)
+                status = "종료" if game_data['is_closed'] else "예정"
+                score_info = ""
+                if game_data['home_score'] is not None and game_data['away_score'] is not None:
+                    score_info = f" ({game_data['away_score']}:{game_data['home_score']})"
+                
+                # 실제 경기 날짜 표시
+                game_date = game_data['start_time'][:10]
+                logger.info("✅ 경기 %s: %s vs %s | %s | %s%s", len(games), game_data['away_team'], game_data['home_team'], game_date, status, score_info)
+        
+        except Exception as e:
+            logger.warning("❌ 경기 %s 처리 중 오류: %s", idx + 1, e)
+            issues.append(f'경기 {idx + 1} 처리 중 오류: {e}')
+            continue
+    
+    record('extract', time.perf_counter() - extract_started, **tags)
+    stats['extract_failures'] = len(issues) - issues_before
+    
+    return games
+
 def extract_epl_game_info_fixed(game_element, target_date, target_date_obj, game_num):
     """EPL 경기 정보 추출 (수정된 버전 - 실제 날짜 확인)"""
     
@@ -114,11 +153,6 @@ def extract_epl_game_info_fixed(game_element, target_date, target_date_obj, game
             if any(word in status_text.lower() for word in ['종료', 'final', '완료', 'ft']):
                 is_closed = True
         
-        # 종료된 경기는 과거 경기일 가능성이 높으므로 스킵
-        if is_closed:
-            print(f"  ⏭️ 경기 {game_num}: 종료된 경기는 스킵 (과거 경기 가능성)")
-            return None
-        
         # 시간 정보 추출
         game_time = "20:00"  # 기본값
         time_element = game_element.select_one('.MatchBox_time__Zt5-d')
@@ -127,13 +161,13 @@ def extract_epl_game_info_fixed(game_element, target_date, target_date_obj, game
             time_match = re.search(r'(\d{1,2}):(\d{2})', time_text)
             if time_match:
                 game_time = f"{time_match.group(1).zfill(2)}:{time_match.group(2)}"
-                print(f"  ⏰ 경기 {game_num} 시간: {game_time}")
+                logger.debug("  ⏰ 경기 %s 시간: %s", game_num, game_time)
         
         # 팀 정보 추출
         team_elements = game_element.select('.MatchBoxHeadToHeadArea_team_item__9ZknX')
         
         if len(team_elements) < 2:
-            print(f"  ❌ 경기 {game_num}: 팀 정보 부족")
+            logger.debug("  ❌ 경기 %s: 팀 정보 부족", game_num)
             return None
         
         # 팀명 추출
@@ -141,18 +175,35 @@ def extract_epl_game_info_fixed(game_element, target_date, target_date_obj, game
         away_element = team_elements[1].select_one('.MatchBoxHeadToHeadArea_team__l2ZxP')
         
         if not home_element or not away_element:
-            print(f"  ❌ 경기 {game_num}: 팀명 추출 실패")
+            logger.debug("  ❌ 경기 %s: 팀명 추출 실패", game_num)
             return None
         
         home_team = home_element.get_text().strip()
         away_team = away_element.get_text().strip()
         
-        print(f"  🏠 경기 {game_num}: {away_team} vs {home_team} (예정)")
+        logger.debug("  🏠 경기 %s: %s vs %s (%s)", game_num, away_team, home_team, '종료' if is_closed else '예정')
         
-        # 예정된 경기만 처리하므로 점수는 None
+        # 점수 (예정 경기에는 표시되지 않음)
         home_score = None
         away_score = None
         result = None
+        home_score_element = team_elements[0].select_one('.MatchBoxHeadToHeadArea_score__TChmp')
+        away_score_element = team_elements[1].select_one('.MatchBoxHeadToHeadArea_score__TChmp')
+        if home_score_element and away_score_element:
+            home_text = home_score_element.get_text().strip()
+            away_text = away_score_element.get_text().strip()
+            if home_text.isdigit() and away_text.isdigit():
+                home_score = int(home_text)
+                away_score = int(away_text)
+        
+        # 결과는 종료된 경기만
+        if is_closed and home_score is not None and away_score is not None:
+            if home_score > away_score:
+                result = 'home_win'
+            elif home_score < away_score:
+                result = 'away_win'
+            else:
+                result = 'draw'
         
         start_time = f"{target_date}T{game_time}:00+09:00"
         
@@ -174,7 +225,7 @@ def extract_epl_game_info_fixed(game_element, target_date, target_date_obj, game
         return game_data
         
     except Exception as e:
-        print(f"  ❌ 경기 {game_num} 정보 추출 중 오류: {e}")
+        logger.warning("  ❌ 경기 %s 정보 추출 중 오류: %s", game_num, e)
         return None
 
 def save_epl_games_to_csv(games, target_date):
@@ -215,7 +266,6 @@ def main():
     
     print("⚽ 네이버 스포츠 EPL 크롤러 Fixed 시작")
     print(f"📅 대상 날짜: {target_date}")
-    print("🎯 예정된 경기만 수집 (과거 경기 제외)")
     print("=" * 60)
     
     # EPL 경기 크롤링
@@ -237,11 +287,11 @@ def main():
             
             print(f"{i}. {game['away_team']} vs {game['home_team']} | {game['start_time'][11:16]} | {status}{score_info}")
         
-        print(f"\n✅ 총 {len(games)}개 EPL 예정 경기 크롤링 완료!")
+        print(f"\n✅ 총 {len(games)}개 EPL 경기 크롤링 완료!")
         if csv_file:
             print(f"📁 저장된 파일: {csv_file}")
     else:
-        print(f"❌ {target_date}에는 예정된 EPL 경기가 없거나 크롤링에 실패했습니다.")
+        print(f"❌ {target_date}에는 EPL 경기가 없거나 크롤링에 실패했습니다.")
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+네이버 스포츠 일정 API (브라우저 없이 JSON으로 조회)
+- 월별 캘린더: 한 번의 요청으로 한 달 중 경기가 있는 날짜 확인
+- 일괄 조회: 한 달치 경기를 한 번에 받아 날짜별 크롤러와 같은 형식의 레코드로 분할 (날짜마다 페이지를 열지 않음)
+- 일정 페이지(schedule/index)가 내부적으로 호출하는 api-gw 엔드포인트 사용
+"""
+
+from datetime import datetime, timedelta
+from typing import List, Dict, Any, Optional, Tuple
+
+from sport_registry import get_sport
+
+API_BASE_URL = 'https://api-gw.sports.naver.com'
+
+REQUEST_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (iPhone; CPU iPhone OS 15_0 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/15.0 Mobile/15E148 Safari/604.1',
+    'Referer': 'https://m.sports.naver.com/',
+    'Accept': 'application/json'
+}
+
+REQUEST_TIMEOUT = 10
+
+_session = None
+
+def get_http_session():
+    """요청 간에 연결을 재사용하는 requests 세션"""
+    global _session
+    if _session is None:
+        import requests
+        _session = requests.Session()
+        _session.headers.update(REQUEST_HEADERS)
+    return _session
+
+def get_json(path: str, params: Dict[str, Any]) -> Dict[str, Any]:
+    """API GET 요청 (HTTP 오류나 success=false면 예외)"""
+    response = get_http_session().get(f"{API_BASE_URL}{path}", params=params, timeout=REQUEST_TIMEOUT)
+    response.raise_for_status()
+    payload = response.json()
+    if payload.get('success') is False:
+        raise RuntimeError(f"네이버 스포츠 API 오류: {payload.get('message') or payload.get('code')}")
+    return payload.get('result') or {}
+
+def category_params(sport: str) -> Dict[str, str]:
+    """스포츠별 API 카테고리 파라미터"""
+    upper_category, categories = get_sport(sport)['api_category']
+    return {'upperCategoryId': upper_category, 'categoryIds': ','.join(categories)}
+
+def normalize_api_date(value: Any) -> str:
+    """API 날짜 값(20250923, 2025-09-23, 2025-09-23T18:30:00) → YYYY-MM-DD"""
+    value = str(value).strip()
+    if len(value) == 8 and value.isdigit():
+        return datetime.strptime(value, '%Y%m%d').strftime('%Y-%m-%d')
+    return value[:10]
+
+def parse_calendar_dates(result: Dict[str, Any]) -> List[str]:
+    """캘린더 응답에서 경기가 있는 날짜만 추출"""
+    game_dates = set()
+    for day in result.get('dates') or []:
+        date = day.get('ymd') or day.get('date')
+        if not date:
+            continue
+        
+        game_count = day.get('gameCount')
+        if game_count is None:
+            game_count = len(day.get('gameInfos') or [])
+        if game_count:
+            game_dates.add(normalize_api_date(date))
+    return sorted(game_dates)
+
+def fetch_month_game_dates(sport: str, year: int, month: int) -> List[str]:
+    """한 달 중 경기가 있는 날짜 (요청 1회)"""
+    params = category_params(sport)
+    params['date'] = f"{year:04d}-{month:02d}-01"
+    return parse_calendar_dates(get_json('/schedule/calendar', params))
+
+# 월 단위 일괄 조회 시 한 번에 받을 최대 경기 수 (한 달 경기 수보다 충분히 크게)
+GAMES_PAGE_SIZE = 500
+
+# API 경기 상태 코드 → KBO 크롤러 상태
+KBO_STATUS_CODES = {'BEFORE': '예정', 'READY': '예정', 'STARTED': '진행중', 'RESULT': '종료', 'CANCEL': '취소'}
+
+# 점수가 의미 있는 상태 (진행 중, 종료)
+SCORED_STATUS_CODES = ('STARTED', 'RESULT')
+
+def fetch_games(sport: str, from_date: str, to_date: str) -> List[Dict[str, Any]]:
+    """기간 내 경기 원시 데이터 (요청 1회)"""
+    params = category_params(sport)
+    params.update({'fromDate': from_date, 'toDate': to_date, 'size': GAMES_PAGE_SIZE, 'fields': 'basic'})
+    games = get_json('/schedule/games', params).get('games') or []
+    if len(games) >= GAMES_PAGE_SIZE:
+        raise RuntimeError(f"{from_date} ~ {to_date} 경기 수가 {GAMES_PAGE_SIZE}개 이상이라 잘렸을 수 있습니다")
+    return games
+
+def parse_api_score(value: Any) -> Optional[int]:
+    """점수 값 → 정수 (없거나 숫자가 아니면 None)"""
+    value = str(value).strip() if value is not None else ''
+    return int(value) if value.isdigit() else None
+
+def api_game_to_record(sport: str, game: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    API 경기 → 날짜별 크롤러와 같은 형식의 레코드
+
+    KBO는 naver_2025_0916_crawler (date, homeTeam, ...),
+    배구/EPL은 각 크롤러 (start_time, home_team, ...) 형식.
+    """
+    date = normalize_api_date(game.get('gameDate') or game['gameDateTime'])
+    game_time = str(game.get('gameDateTime') or '')[11:16] or None
+    status_code = str(game.get('statusCode') or '').upper()
+    cancelled = bool(game.get('cancel')) or status_code == 'CANCEL'
+    is_closed = status_code == 'RESULT' and not cancelled
+    
+    # 시작 전 경기는 점수 필드가 0으로 와도 점수 없음으로 처리
+    home_score = away_score = None
+    if status_code in SCORED_STATUS_CODES and not cancelled:
+        home_score = parse_api_score(game.get('homeTeamScore'))
+        away_score = parse_api_score(game.get('awayTeamScore'))
+    
+    if sport == 'kbo':
+        labels = {'home': '1', 'away': '2', 'draw': '0'}
+    else:
+        labels = {'home': 'home_win', 'away': 'away_win', 'draw': 'draw'}
+    
+    result = None
+    if is_closed and home_score is not None and away_score is not None:
+        if home_score > away_score:
+            result = labels['home']
+        elif home_score < away_score:
+            result = labels['away']
+        else:
+            result = labels['draw']
+    
+    if sport == 'kbo':
+        return {
+            'date': date,
+            'homeTeam': game.get('homeTeamName'),
+            'awayTeam': game.get('awayTeamName'),
+            'homeScore': home_score,
+            'awayScore': away_score,
+            'result': result,
+            'status': '취소' if cancelled else KBO_STATUS_CODES.get(status_code, '예정'),
+            'time': game_time,
+            'stadium': game.get('stadium'),
+            'source': 'naver_sports_api'
+        }
+    
+    record = {
+        'home_team': game.get('homeTeamName'),
+        'away_team': game.get('awayTeamName'),
+        'start_time': f"{date}T{game_time or '00:00'}:00+09:00",
+        'home_score': home_score,
+        'away_score': away_score,
+        'result': result,
+        'is_closed': is_closed,
+        'sport_id': get_sport(sport)['sport_id'],
+        'sport_name': 'soccer' if sport == 'epl' else sport,
+        'stadium': game.get('stadium') or None
+    }
+    if sport == 'epl':
+        record.update({'league_name': 'EPL', 'league_type': 'epl'})
+    return record
+
+def month_windows(start_date: str, end_date: str) -> List[Tuple[str, str]]:
+    """기간을 달력 월 단위 (시작, 끝) 구간으로 분할"""
+    start = datetime.strptime(start_date, '%Y-%m-%d')
+    end = datetime.strptime(end_date, '%Y-%m-%d')
+    windows = []
+    while start <= end:
+        next_month = (start.replace(day=1) + timedelta(days=32)).replace(day=1)
+        window_end = min(end, next_month - timedelta(days=1))
+        windows.append((start.strftime('%Y-%m-%d'), window_end.strftime('%Y-%m-%d')))
+        start = next_month
+    return windows
+
+def fetch_games_by_date(sport: str, start_date: str, end_date: str) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    기간 내 경기를 월 단위 요청으로 가져와 날짜별 레코드로 분할
+
+    레코드는 스포츠 규칙 세트로 검증/정제하고, 검증에 실패한 경기는 제외한다.
+    경기가 없는 날짜도 빈 목록으로 포함 (이 날짜들은 조회가 끝났다는 의미).
+    """
+    from validation_rules import validate_record
+    
+    games_by_date: Dict[str, List[Dict[str, Any]]] = {}
+    day = datetime.strptime(start_date, '%Y-%m-%d')
+    while day <= datetime.strptime(end_date, '%Y-%m-%d'):
+        games_by_date[day.strftime('%Y-%m-%d')] = []
+        day += timedelta(days=1)
+    
+    for window_start, window_end in month_windows(start_date, end_date):
+        games = fetch_games(sport, window_start, window_end)
+        print(f"📡 {get_sport(sport)['name']} {window_start} ~ {window_end}: 경기 {len(games)}개 (요청 1회)")
+        
+        for game in games:
+            record = api_game_to_record(sport, game)
+            validation = validate_record(sport, record)
+            if not validation['valid']:
+                print(f"⚠️ 검증 실패로 제외: {record} {validation['issues']}")
+                continue
+            
+            date = validation['game'].get('date') or validation['game']['start_time'][:10]
+            if date in games_by_date:
+                games_by_date[date].append(validation['game'])
+    
+    return games_by_date
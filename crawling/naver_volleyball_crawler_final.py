@@ -6,97 +6,68 @@ import json
 import csv
 import re
 from datetime import datetime
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from bs4 import BeautifulSoup
+from browser_session import create_chrome_driver, report_page_transfer
+from crawl_health import record_page
+from crawl_logging import get_logger
+from debug_artifacts import REASON_ERROR, capture_page
+from instrumentation import record, span, timed, timed_sleep
+from profiling import profiled
+from sport_registry import schedule_url
 
-def crawl_naver_volleyball_date(target_date):
-    """네이버 스포츠 특정 날짜 배구 일정 크롤링 (최종 버전)"""
+logger = get_logger(__name__)
+
+@profiled
+@timed('crawl_total', sport='volleyball')
+def crawl_naver_volleyball_date(target_date, driver=None):
+    """네이버 스포츠 특정 날짜 배구 일정 크롤링 (최종 버전) (driver 전달 시 재사용, 실패 시 None)"""
     
     print(f"🏐 네이버 스포츠 {target_date} 배구 크롤링 시작 (Final)")
     print("=" * 60)
     
-    # Chrome 설정
-    options = Options()
-    options.add_argument('--headless')
-    options.add_argument('--no-sandbox')
-    options.add_argument('--disable-dev-shm-usage')
-    options.add_argument('--user-agent=Mozilla/5.0 (iPhone; CPU iPhone OS 15_0 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/15.0 Mobile/15E148 Safari/604.1')
-    
-    driver = None
+    # 전달받은 드라이버는 재사용하고 종료하지 않음
+    own_driver = driver is None
     games = []
+    tags = {'sport': 'volleyball', 'date': target_date}
+    page_source = None
+    issues = []
+    stats = {}
+    started = time.perf_counter()
     
     try:
-        driver = webdriver.Chrome(options=options)
-        driver.set_page_load_timeout(30)
+        if own_driver:
+            driver = create_chrome_driver(transfer_log=True)
         
         # 네이버 스포츠 배구 접속
-        url = f'https://m.sports.naver.com/volleyball/schedule/index?date={target_date}'
+        url = schedule_url('volleyball', target_date)
         print(f"📡 접속: {url}")
         
-        driver.get(url)
-        time.sleep(5)
+        with span('page_load', **tags):
+            driver.get(url)
+        timed_sleep(5, **tags)
         
         # 페이지 로딩 대기
         try:
-            WebDriverWait(driver, 15).until(
-                lambda driver: driver.execute_script("return document.readyState") == "complete"
-            )
+            with span('page_wait', **tags):
+                WebDriverWait(driver, 15).until(
+                    lambda driver: driver.execute_script("return document.readyState") == "complete"
+                )
         except:
             print("⚠️ 페이지 로딩 타임아웃")
         
         # 추가 로딩 대기
-        time.sleep(3)
+        timed_sleep(3, **tags)
         
         # 현재 페이지 소스 확인
-        page_source = driver.page_source
-        soup = BeautifulSoup(page_source, 'html.parser')
-        
-        # 경기 없음 메시지 확인
-        no_game_messages = [
-            "경기가 없습니다",
-            "일정이 없습니다", 
-            "예정된 경기가 없습니다",
-            "No games scheduled",
-            "해당 날짜에 경기가 없습니다"
-        ]
-        
-        page_text = soup.get_text()
-        for msg in no_game_messages:
-            if msg in page_text:
-                print(f"📋 {target_date}에는 배구 경기가 없습니다: {msg}")
-                return []
-        
-        # 배구 경기 리스트 찾기 - MatchBox_match_item 클래스 사용
-        game_elements = soup.select('li.MatchBox_match_item__WiPhj')
-        
-        if not game_elements:
-            print("❌ 경기 요소를 찾을 수 없습니다.")
-            return []
-        
-        print(f"📊 총 {len(game_elements)}개 경기 발견")
-        print()
-        
-        # 각 경기 정보 추출
-        for idx, game_element in enumerate(game_elements):
-            try:
-                game_data = extract_volleyball_game_info_final(game_element, target_date, idx + 1)
-                if game_data:
-                    games.append(game_data)
-                    status = "종료" if game_data['is_closed'] else "예정"
-                    score_info = ""
-                    if game_data['home_score'] is not None and game_data['away_score'] is not None:
-                        score_info = f" ({game_data['away_score']}:{game_data['home_score']})"
-                    print(f"✅ 경기 {idx + 1}: {game_data['away_team']} vs {game_data['home_team']} | {status}{score_info}")
-                else:
-                    print(f"❌ 경기 {idx + 1}: 정보 추출 실패")
-                    
-            except Exception as e:
-                print(f"❌ 경기 {idx + 1} 처리 중 오류: {e}")
-                continue
+        with span('page_source', **tags):
+            page_source = driver.page_source
+        report_page_transfer(driver, f"volleyball {target_date}")
+        games = parse_volleyball_page(page_source, target_date, issues, stats)
+        capture_page('volleyball', target_date, page_source, games, issues)
+        record_page('volleyball', time.perf_counter() - started, games, success=bool(games) or not issues, stats=stats)
         
         print()
         print(f"🎉 크롤링 완료!")
@@ -107,12 +78,81 @@ def crawl_naver_volleyball_date(target_date):
         
     except Exception as e:
         print(f"❌ 크롤링 중 오류 발생: {e}")
-        return []
+        capture_page('volleyball', target_date, page_source, reason=REASON_ERROR)
+        record_page('volleyball', time.perf_counter() - started, success=False, stats=stats)
+        return None
         
     finally:
-        if driver:
+        if driver and own_driver:
             driver.quit()
 
+def parse_volleyball_page(page_source, target_date, issues=None, stats=None):
+    """저장된/받아온 배구 일정 페이지 HTML에서 경기 목록 추출 (드라이버 없이 재현 가능, issues/stats에 파싱 문제와 지표 기록)"""
+    
+    games = []
+    if issues is None:
+        issues = []
+    if stats is None:
+        stats = {}
+    tags = {'sport': 'volleyball', 'date': target_date}
+    
+    with span('parse_html', **tags):
+        soup = BeautifulSoup(page_source, 'html.parser')
+    
+    # 경기 없음 메시지 확인
+    no_game_messages = [
+        "경기가 없습니다",
+        "일정이 없습니다", 
+        "예정된 경기가 없습니다",
+        "No games scheduled",
+        "해당 날짜에 경기가 없습니다"
+    ]
+    
+    page_text = soup.get_text()
+    for msg in no_game_messages:
+        if msg in page_text:
+            logger.info("📋 %s에는 배구 경기가 없습니다: %s", target_date, msg)
+            return []
+    
+    # 배구 경기 리스트 찾기 - MatchBox_match_item 클래스 사용
+    game_elements = soup.select('li.MatchBox_match_item__WiPhj')
+    stats['elements'] = len(game_elements)
+    
+    if not game_elements:
+        logger.warning("❌ 경기 요소를 찾을 수 없습니다.")
+        issues.append('경기 요소 없음')
+        return []
+    
+    logger.info("📊 총 %s개 경기 발견", len(game_elements))
+    
+    extract_started = time.perf_counter()
+    issues_before = len(issues)
+    
+    # 각 경기 정보 추출
+    for idx, game_element in enumerate(game_elements):
+        try:
+            game_data = extract_volleyball_game_info_final(game_element, target_date, idx + 1)
+            if game_data:
+                games.append(game_data)
+                status = "종료" if game_data['is_closed'] else "예정"
+                score_info = ""
+                if game_data['home_score'] is not None and game_data['away_score'] is not None:
+                    score_info = f" ({game_data['away_score']}:{game_data['home_score']})"
+                logger.info("✅ 경기 %s: %s vs %s | %s%s", idx + 1, game_data['away_team'], game_data['home_team'], status, score_info)
+            else:
+                logger.warning("❌ 경기 %s: 정보 추출 실패", idx + 1)
+                issues.append(f'경기 {idx + 1} 정보 추출 실패')
+        
+        except Exception as e:
+            logger.warning("❌ 경기 %s 처리 중 오류: %s", idx + 1, e)
+            issues.append(f'경기 {idx + 1} 처리 중 오류: {e}')
+            continue
+    
+    record('extract', time.perf_counter() - extract_started, **tags)
+    stats['extract_failures'] = len(issues) - issues_before
+    
+    return games
+
 def extract_volleyball_game_info_final(game_element, target_date, game_num):
     """배구 경기 정보 추출 (최종 버전)"""
     
@@ -144,7 +184,7 @@ def extract_volleyball_game_info_final(game_element, target_date, game_num):
         team_elements = game_element.select('.MatchBoxHeadToHeadArea_team_item__9ZknX')
         
         if len(team_elements) < 2:
-            print(f"  ❌ 경기 {game_num}: 팀 정보가 부족합니다.")
+            logger.debug("  ❌ 경기 %s: 팀 정보가 부족합니다.", game_num)
             return None
         
         # 첫 번째 팀 (홈팀)
@@ -156,7 +196,7 @@ def extract_volleyball_game_info_final(game_element, target_date, game_num):
         away_score_element = team_elements[1].select_one('.MatchBoxHeadToHeadArea_score__TChmp')
         
         if not home_team_element or not away_team_element:
-            print(f"  ❌ 경기 {game_num}: 팀명을 찾을 수 없습니다.")
+            logger.debug("  ❌ 경기 %s: 팀명을 찾을 수 없습니다.", game_num)
             return None
         
         home_team = home_team_element.get_text().strip()
@@ -190,6 +230,10 @@ def extract_volleyball_game_info_final(game_element, target_date, game_num):
         elif team_elements[1].get('class') and 'type_winner' in ' '.join(team_elements[1].get('class', [])):
             result = "away_win"
         
+        # 결과는 종료된 경기만 (진행 중 세트 스코어는 결과가 아님)
+        if not is_closed:
+            result = None
+        
         start_time = f"{target_date}T{game_time}:00+09:00"
         
         game_data = {
@@ -205,14 +249,14 @@ def extract_volleyball_game_info_final(game_element, target_date, game_num):
             'stadium': None
         }
         
-        print(f"  📋 경기 {game_num}: {away_team} vs {home_team} | {game_time} | {'종료' if is_closed else '예정'}")
+        logger.debug("  📋 경기 %s: %s vs %s | %s | %s", game_num, away_team, home_team, game_time, '종료' if is_closed else '예정')
         if home_score is not None and away_score is not None:
-            print(f"      점수: {away_score}:{home_score}")
+            logger.debug("      점수: %s:%s", away_score, home_score)
         
         return game_data
         
     except Exception as e:
-        print(f"  ❌ 경기 {game_num} 정보 추출 중 오류: {e}")
+        logger.warning("  ❌ 경기 %s 정보 추출 중 오류: %s", game_num, e)
         return None
 
 def save_volleyball_games_to_csv(games, target_date):
@@ -12,6 +12,10 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from bs4 import BeautifulSoup
+from crawl_logging import dump, element_html, element_text, get_logger
+from debug_artifacts import capture_page
+
+logger = get_logger(__name__)
 
 def crawl_naver_volleyball_date(target_date):
     """네이버 스포츠 특정 날짜 배구 일정 크롤링 (개선 버전)"""
@@ -58,11 +62,6 @@ def crawl_naver_volleyball_date(target_date):
         print("🔍 페이지 구조 상세 분석:")
         print("=" * 40)
         
-        # HTML 구조 상세 분석
-        with open(f"volleyball_page_source_{target_date}.html", "w", encoding="utf-8") as f:
-            f.write(page_source)
-        print(f"📄 페이지 소스 저장: volleyball_page_source_{target_date}.html")
-        
         # 경기 없음 메시지 확인
         no_game_messages = [
             "경기가 없습니다",
@@ -122,6 +121,8 @@ def crawl_naver_volleyball_date(target_date):
         
         if not game_elements:
             print("❌ 경기 요소를 찾을 수 없습니다.")
+            # 파싱 실패한 페이지만 디버그 보관소에 압축 저장 (재현용)
+            capture_page('volleyball', target_date, page_source, issues=['경기 요소 없음'])
             
             # 텍스트 기반 경기 정보 찾기 시도
             print("\n🔍 텍스트 기반 경기 정보 찾기:")
@@ -143,21 +144,23 @@ def crawl_naver_volleyball_date(target_date):
         # 각 경기 정보 추출
         for idx, game_element in enumerate(game_elements):
             try:
-                print(f"\n🔍 경기 {idx + 1} 분석:")
-                print(f"HTML: {str(game_element)[:200]}...")
-                print(f"텍스트: {game_element.get_text().strip()}")
+                logger.debug("\n🔍 경기 %s 분석:", idx + 1)
+                dump(logger, "HTML: %s", element_html(game_element, 200))
+                dump(logger, "텍스트: %s", element_text(game_element))
                 
                 game_data = extract_volleyball_game_info_v2(game_element, target_date, idx + 1)
                 if game_data:
                     games.append(game_data)
-                    print(f"✅ 경기 {idx + 1}: {game_data['away_team']} vs {game_data['home_team']}")
+                    logger.info("✅ 경기 %s: %s vs %s", idx + 1, game_data['away_team'], game_data['home_team'])
                 else:
-                    print(f"❌ 경기 {idx + 1}: 정보 추출 실패")
+                    logger.warning("❌ 경기 %s: 정보 추출 실패", idx + 1)
                     
             except Exception as e:
-                print(f"❌ 경기 {idx + 1} 처리 중 오류: {e}")
+                logger.warning("❌ 경기 %s 처리 중 오류: %s", idx + 1, e)
                 continue
         
+        capture_page('volleyball', target_date, page_source, games)
+        
         print()
         print(f"🎉 크롤링 완료!")
         print(f"✅ 총 {len(games)}개 경기 수집")
@@ -233,22 +236,22 @@ def extract_volleyball_game_info_v2(game_element, target_date, game_num):
     
     try:
         game_text = game_element.get_text().strip()
-        print(f"  원본 텍스트: {game_text}")
+        logger.debug("  원본 텍스트: %s", game_text)
         
         # vs 패턴으로 팀명 추출
         vs_match = re.search(r'([가-힣A-Za-z0-9\s]+)\s*vs\s*([가-힣A-Za-z0-9\s]+)', game_text)
         if not vs_match:
-            print(f"  ❌ vs 패턴을 찾을 수 없습니다.")
+            logger.debug("  ❌ vs 패턴을 찾을 수 없습니다.")
             return None
         
         away_team = clean_team_name(vs_match.group(1))
         home_team = clean_team_name(vs_match.group(2))
         
         if not away_team or not home_team or away_team == home_team:
-            print(f"  ❌ 유효하지 않은 팀명: '{away_team}' vs '{home_team}'")
+            logger.debug("  ❌ 유효하지 않은 팀명: '%s' vs '%s'", away_team, home_team)
             return None
         
-        print(f"  팀명: {away_team} vs {home_team}")
+        logger.debug("  팀명: %s vs %s", away_team, home_team)
         
         # 시간 추출
         time_match = re.search(r'(\d{1,2}):(\d{2})', game_text)
@@ -257,7 +260,7 @@ def extract_volleyball_game_info_v2(game_element, target_date, game_num):
         else:
             game_time = "19:00"  # 기본값
         
-        print(f"  경기 시간: {game_time}")
+        logger.debug("  경기 시간: %s", game_time)
         
         # 점수 및 상태 추출
         home_score = None
@@ -281,7 +284,7 @@ def extract_volleyball_game_info_v2(game_element, target_date, game_num):
             else:
                 result = "draw"
             
-            print(f"  점수: {away_score}:{home_score} ({'종료' if is_closed else '진행중'})")
+            logger.debug("  점수: %s:%s (%s)", away_score, home_score, '종료' if is_closed else '진행중')
         
         # 경기 상태 키워드 확인
         if any(keyword in game_text for keyword in ['종료', 'final', '완료']):
@@ -307,7 +310,7 @@ def extract_volleyball_game_info_v2(game_element, target_date, game_num):
         return game_data
         
     except Exception as e:
-        print(f"  ❌ 경기 정보 추출 중 오류: {e}")
+        logger.warning("  ❌ 경기 정보 추출 중 오류: %s", e)
         return None
 
 def save_volleyball_games_to_csv(games, target_date):
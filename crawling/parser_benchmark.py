@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+일정 페이지 파서 마이크로 벤치마크 / 회귀 검사
+- 저장된 일정 페이지({sport}_page_source_{date}.html)마다 기대 결과({...}.expected.json)를 함께 보관
+- 종목별 파서(parse_kbo_page 등)를 페이지마다 반복 실행해 중앙값/최솟값 측정
+- 결과가 기대 결과와 다르거나, 중앙값이 기준값(parser_baseline.json)보다 허용 비율 이상 느려지면 실패 (종료 코드 1)
+- 파서 수정으로 결과가 의도대로 바뀐 경우에만 --update-expected로 기대 결과 갱신
+
+사용법:
+    python parser_benchmark.py [--corpus .] [--sports volleyball] [--repeat 20] [--tolerance 0.25]
+    python parser_benchmark.py --update-baseline
+    python parser_benchmark.py --update-expected
+"""
+
+import io
+import json
+import os
+import statistics
+import sys
+import time
+from contextlib import redirect_stdout
+from typing import List, Dict, Any, Optional
+
+from crawl_benchmark import FIXTURE_NAME, find_fixtures
+from sport_registry import SPORTS, load_page_parser
+
+DEFAULT_BASELINE = 'parser_baseline.json'
+
+# 기준값 대비 허용 지연 비율
+DEFAULT_TOLERANCE = 0.25
+
+# 이보다 작은 차이(초)는 측정 잡음으로 보고 무시
+MIN_REGRESSION_SECONDS = 0.002
+
+def expected_path(corpus_dir: str, sport: str, date: str) -> str:
+    page_path = os.path.join(corpus_dir, FIXTURE_NAME.format(sport=sport, date=date))
+    return page_path[:-len('.html')] + '.expected.json'
+
+def normalize_games(games: Optional[List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+    """JSON 저장/비교용으로 정규화 (None → 빈 목록, 튜플 등은 JSON 값으로)"""
+    return json.loads(json.dumps(games or [], ensure_ascii=False, default=str))
+
+def describe_difference(expected: List[Dict[str, Any]], actual: List[Dict[str, Any]]) -> str:
+    """기대 결과와 실제 결과의 첫 번째 차이 설명"""
+    if len(expected) != len(actual):
+        return f"경기 수 {len(expected)} → {len(actual)}"
+    for index, (old, new) in enumerate(zip(expected, actual), 1):
+        fields = sorted(key for key in set(old) | set(new) if old.get(key) != new.get(key))
+        if fields:
+            changes = ', '.join(f"{field}: {old.get(field)!r} → {new.get(field)!r}" for field in fields)
+            return f"경기 {index}: {changes}"
+    return ''
+
+def time_parser(parser, page_source: str, date: str, repeat: int) -> Dict[str, Any]:
+    """파서를 repeat번 실행 (출력은 버림) → 첫 번째 결과와 소요 시간"""
+    timings = []
+    games = None
+    for _ in range(repeat):
+        with redirect_stdout(io.StringIO()):
+            started = time.perf_counter()
+            result = parser(page_source, date)
+            timings.append(time.perf_counter() - started)
+        if games is None:
+            games = result
+    return {
+        'games': normalize_games(games),
+        'median': statistics.median(timings),
+        'min': min(timings)
+    }
+
+def run_parser_benchmark(corpus_dir: str = '.', sports: Optional[List[str]] = None, repeat: int = 20,
+                         tolerance: float = DEFAULT_TOLERANCE, baseline_path: str = DEFAULT_BASELINE,
+                         update_baseline: bool = False, update_expected: bool = False) -> Dict[str, Any]:
+    """
+    코퍼스 전체 파서 벤치마크
+
+    Returns:
+        페이지별 결과와 실패 목록 (failures가 비어 있으면 통과)
+    """
+    fixtures = find_fixtures(corpus_dir)
+    baseline: Dict[str, Dict[str, float]] = {}
+    if os.path.exists(baseline_path):
+        with open(baseline_path, 'r', encoding='utf-8') as file:
+            baseline = json.load(file)
+    
+    pages = []
+    failures = []
+    
+    print(f"🧪 파서 벤치마크: {corpus_dir} (반복 {repeat}회, 허용 +{tolerance:.0%})")
+    print("=" * 60)
+    
+    for sport in sports or list(SPORTS):
+        if sport not in fixtures:
+            continue
+        parser = load_page_parser(sport)
+        
+        for date in fixtures[sport]:
+            key = f"{sport}/{date}"
+            with open(os.path.join(corpus_dir, FIXTURE_NAME.format(sport=sport, date=date)), 'r', encoding='utf-8') as file:
+                page_source = file.read()
+            
+            result = time_parser(parser, page_source, date, repeat)
+            page = {'page': key, 'games': len(result['games']), 'median': result['median'], 'min': result['min']}
+            problems = []
+            
+            path = expected_path(corpus_dir, sport, date)
+            if update_expected or not os.path.exists(path):
+                with open(path, 'w', encoding='utf-8') as file:
+                    json.dump(result['games'], file, ensure_ascii=False, indent=2)
+                    file.write('\n')
+                print(f"📝 {key}: 기대 결과 저장 ({len(result['games'])}경기) → {path}")
+            else:
+                with open(path, 'r', encoding='utf-8') as file:
+                    difference = describe_difference(json.load(file), result['games'])
+                if difference:
+                    problems.append(f"결과 불일치 - {difference}")
+            
+            reference = baseline.get(key, {}).get('median')
+            if reference is not None:
+                page['baseline'] = reference
+                page['change'] = (result['median'] - reference) / reference if reference else 0
+                if (result['median'] > reference * (1 + tolerance)
+                        and result['median'] - reference > MIN_REGRESSION_SECONDS):
+                    problems.append(f"느려짐 {reference * 1000:.2f}ms → {result['median'] * 1000:.2f}ms "
+                                    f"({page['change']:+.0%})")
+            
+            change_text = f" ({page['change']:+.1%})" if 'change' in page else ''
+            print(f"{'❌' if problems else '✅'} {key}: {page['games']}경기, 중앙값 {result['median'] * 1000:.2f}ms, "
+                  f"최소 {result['min'] * 1000:.2f}ms{change_text}")
+            for problem in problems:
+                print(f"   ⚠️ {problem}")
+                failures.append({'page': key, 'problem': problem})
+            pages.append(page)
+    
+    if not pages:
+        print(f"⚠️ {corpus_dir}에 저장된 일정 페이지가 없습니다 ({FIXTURE_NAME})")
+    
+    if update_baseline and pages:
+        baseline.update({page['page']: {'median': page['median'], 'min': page['min']} for page in pages})
+        with open(baseline_path, 'w', encoding='utf-8') as file:
+            json.dump(baseline, file, ensure_ascii=False, indent=2, sort_keys=True)
+        print(f"💾 기준값 저장: {baseline_path} ({len(pages)}페이지)")
+    
+    print(f"\n📊 {len(pages)}페이지 중 {len({failure['page'] for failure in failures})}페이지 실패")
+    return {'pages': pages, 'failures': failures}
+
+def main():
+    """메인 실행 함수"""
+    import argparse
+    
+    parser = argparse.ArgumentParser(description='일정 페이지 파서 벤치마크 / 회귀 검사')
+    parser.add_argument('--corpus', default='.', help='저장된 페이지 + 기대 결과 디렉터리')
+    parser.add_argument('--sports', nargs='+', choices=list(SPORTS))
+    parser.add_argument('--repeat', type=int, default=20, help='페이지별 반복 횟수')
+    parser.add_argument('--tolerance', type=float, default=DEFAULT_TOLERANCE, help='기준값 대비 허용 지연 비율')
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE, help='기준 소요 시간 JSON')
+    parser.add_argument('--update-baseline', action='store_true', help='현재 측정값을 기준값으로 저장')
+    parser.add_argument('--update-expected', action='store_true', help='현재 파서 결과를 기대 결과로 저장')
+    parser.add_argument('--output', help='결과 JSON 저장 경로')
+    args = parser.parse_args()
+    
+    result = run_parser_benchmark(args.corpus, args.sports, args.repeat, args.tolerance, args.baseline,
+                                  args.update_baseline, args.update_expected)
+    
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as file:
+            json.dump(result, file, ensure_ascii=False, indent=2)
+    
+    sys.exit(1 if result['failures'] else 0)
+
+if __name__ == "__main__":
+    main()
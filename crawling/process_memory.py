@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+프로세스 트리 메모리 측정
+- 크롬 드라이버 재시작 기준(browser_session)과 벤치마크 최대 RSS(crawl_benchmark)가 같이 사용
+- psutil 없이 /proc만 읽음 (리눅스 전용, 다른 OS에서는 0)
+
+사용법:
+    from process_memory import process_tree_rss
+
+    process_tree_rss(driver.service.process.pid) / 1024 / 1024  # chromedriver + 크롬 RSS (MB)
+"""
+
+import glob
+import os
+from typing import List, Dict
+
+def process_tree_rss(root_pid: int) -> int:
+    """프로세스와 모든 하위 프로세스의 RSS 합 (바이트, /proc 기반 - 리눅스 전용)"""
+    children: Dict[int, List[int]] = {}
+    for stat_path in glob.glob('/proc/[0-9]*/stat'):
+        try:
+            with open(stat_path, 'r') as file:
+                fields = file.read().rsplit(')', 1)[1].split()
+            children.setdefault(int(fields[1]), []).append(int(stat_path.split('/')[2]))
+        except (OSError, IndexError, ValueError):
+            continue
+    
+    total = 0
+    pending = [root_pid]
+    while pending:
+        pid = pending.pop()
+        pending.extend(children.get(pid, []))
+        try:
+            with open(f'/proc/{pid}/statm', 'r') as file:
+                total += int(file.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+        except (OSError, IndexError, ValueError):
+            continue
+    return total
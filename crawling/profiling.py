@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+크롤러/임포터 진입점 공통 프로파일링 스위치
+- 스크립트를 고치지 않고 환경 변수로 켜고 끔 (기본은 꺼짐, 호출 비용 거의 없음)
+- cprofile: cProfile 통계(.prof, snakeviz/pstats로 확인)
+- sample: 표준 라이브러리만 쓰는 샘플링 프로파일러, folded stack(.folded, flamegraph.pl/speedscope로 확인)
+- CRAWL_PROFILE_EVERY=N 이면 함수별로 N번째 호출(날짜)마다 한 번만 프로파일링
+- CRAWL_PROFILE_TARGET=이름1,이름2 로 특정 진입점만 (기본은 가장 바깥 진입점)
+- 이미 프로파일링 중인 호출 안쪽의 진입점은 따로 프로파일링하지 않음
+
+사용법:
+    CRAWL_PROFILE=cprofile python supabase_import.py
+    CRAWL_PROFILE=sample CRAWL_PROFILE_TARGET=crawl_naver_kbo_date CRAWL_PROFILE_EVERY=10 \
+        python league_calendar.py backfill kbo 2025-03-01 2025-10-31
+    python profiling.py top profiles/crawl_naver_kbo_date_2025-09-23_*.prof
+"""
+
+import functools
+import os
+import re
+import sys
+import threading
+import time
+from collections import Counter
+from datetime import datetime
+from typing import Optional
+
+PROFILE_MODES = ('cprofile', 'sample')
+
+DEFAULT_PROFILE_DIR = 'profiles'
+
+# 샘플링 간격 (초)
+SAMPLE_INTERVAL = 0.005
+
+_local = threading.local()
+_call_counts: Counter = Counter()
+_counts_lock = threading.Lock()
+
+def profile_mode() -> Optional[str]:
+    """환경 변수로 지정된 프로파일링 모드 (없으면 None)"""
+    mode = os.getenv('CRAWL_PROFILE', '').strip().lower()
+    if not mode or mode in ('0', 'off', 'false'):
+        return None
+    if mode not in PROFILE_MODES:
+        print(f"⚠️ 알 수 없는 CRAWL_PROFILE={mode} (가능: {', '.join(PROFILE_MODES)}), 프로파일링하지 않음")
+        return None
+    return mode
+
+def should_profile(name: str) -> bool:
+    """대상 진입점인지, N번째 호출인지 (CRAWL_PROFILE_TARGET, CRAWL_PROFILE_EVERY)"""
+    targets = [target.strip() for target in os.getenv('CRAWL_PROFILE_TARGET', '').split(',') if target.strip()]
+    if targets and not any(target in name for target in targets):
+        return False
+    
+    every = max(1, int(os.getenv('CRAWL_PROFILE_EVERY', '1') or 1))
+    with _counts_lock:
+        count = _call_counts[name]
+        _call_counts[name] += 1
+    return count % every == 0
+
+def output_path(name: str, label: Optional[str], extension: str) -> str:
+    """실행별 출력 파일 경로 (함수명_라벨_시각_pid)"""
+    directory = os.getenv('CRAWL_PROFILE_DIR', DEFAULT_PROFILE_DIR)
+    os.makedirs(directory, exist_ok=True)
+    parts = [name]
+    if label:
+        parts.append(re.sub(r'[^0-9A-Za-z가-힣_.-]+', '_', os.path.basename(label))[:60])
+    parts += [datetime.now().strftime('%Y%m%d_%H%M%S'), str(os.getpid())]
+    return os.path.join(directory, f"{'_'.join(parts)}.{extension}")
+
+class StackSampler:
+    """대상 스레드의 호출 스택을 주기적으로 모아 folded stack 형식으로 저장"""
+    
+    def __init__(self, thread_id: int, interval: float = SAMPLE_INTERVAL):
+        self.thread_id = thread_id
+        self.interval = interval
+        self.stacks: Counter = Counter()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+    
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})")
+                frame = frame.f_back
+            if stack:
+                self.stacks[';'.join(reversed(stack))] += 1
+    
+    def start(self):
+        self._thread.start()
+    
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+    
+    def save(self, path: str):
+        with open(path, 'w', encoding='utf-8') as file:
+            for stack, count in self.stacks.most_common():
+                file.write(f"{stack} {count}\n")
+
+def profiled(func=None, *, name: Optional[str] = None):
+    """
+    진입점 프로파일링 데코레이터
+
+    CRAWL_PROFILE이 설정되지 않으면 원래 함수를 그대로 호출한다.
+    문자열 인자 중 첫 번째(날짜나 CSV 경로)를 출력 파일 이름에 붙인다.
+    """
+    def decorator(func):
+        profile_name = name or func.__qualname__.replace('.', '_')
+        
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            mode = profile_mode()
+            if mode is None or getattr(_local, 'active', False) or not should_profile(profile_name):
+                return func(*args, **kwargs)
+            
+            label = next((arg for arg in args if isinstance(arg, str)), None)
+            _local.active = True
+            started = time.perf_counter()
+            path = None
+            try:
+                if mode == 'cprofile':
+                    import cProfile
+                    
+                    profiler = cProfile.Profile()
+                    try:
+                        return profiler.runcall(func, *args, **kwargs)
+                    finally:
+                        path = output_path(profile_name, label, 'prof')
+                        profiler.dump_stats(path)
+                else:
+                    sampler = StackSampler(threading.get_ident())
+                    sampler.start()
+                    try:
+                        return func(*args, **kwargs)
+                    finally:
+                        sampler.stop()
+                        path = output_path(profile_name, label, 'folded')
+                        sampler.save(path)
+            finally:
+                _local.active = False
+                print(f"🔬 프로파일 저장 ({mode}, {time.perf_counter() - started:.1f}초): {path}")
+        
+        return wrapper
+    
+    return decorator(func) if func is not None else decorator
+
+def print_top(paths, limit: int = 25, sort: str = 'cumulative'):
+    """cProfile 통계 파일 합쳐서 상위 함수 출력"""
+    import pstats
+    
+    stats = pstats.Stats(*paths)
+    stats.strip_dirs().sort_stats(sort).print_stats(limit)
+
+def main():
+    """메인 실행 함수"""
+    import argparse
+    
+    parser = argparse.ArgumentParser(description='프로파일 결과 확인')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    top_parser = subparsers.add_parser('top', help='.prof 파일 상위 함수 출력 (여러 파일은 합산)')
+    top_parser.add_argument('files', nargs='+')
+    top_parser.add_argument('--limit', type=int, default=25)
+    top_parser.add_argument('--sort', default='cumulative', choices=['cumulative', 'tottime', 'calls'])
+    args = parser.parse_args()
+    
+    print_top(args.files, args.limit, args.sort)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,427 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+크롤링 결과 ↔ DB 대조 (sorted-merge diff)
+- 크롤링 CSV와 DB 행을 시작 시간 순으로 스트리밍하며 경기 날짜(KST) 단위로 병합 비교
+- 같은 날짜 + 홈/원정 팀이면 같은 경기 (시작 시간이 바뀌면 삭제/추가가 아니라 수정)
+- 결과는 insert/update/delete/conflict 작업으로 JSONL에 기록
+- apply 명령으로 작업 파일을 배치 단위로 DB에 반영
+
+사용법:
+    python reconcile.py diff kbo --csv naver_kbo_*.csv --start 2025-09-22 --end 2025-09-30 --output kbo_ops.jsonl.gz
+    python reconcile.py apply kbo kbo_ops.jsonl.gz [--allow-delete]
+"""
+
+import csv
+import heapq
+from datetime import datetime, timedelta, timezone
+from itertools import groupby
+from typing import List, Dict, Any, Optional, Iterable, Iterator, Tuple
+
+from instrumentation import span
+from jsonl_report import JsonlReportWriter, read_jsonl
+from profiling import profiled
+from sport_registry import COMPARE_FIELDS, NATURAL_KEY, get_sport
+from validation_rules import get_rule_set
+
+KST = timezone(timedelta(hours=9))
+
+# 종료된 경기에서 바뀌면 자동 반영하지 않고 충돌로 처리할 컬럼
+SETTLED_FIELDS = ('home_score', 'away_score', 'result', 'is_closed')
+
+_BOOL_VALUES = {'true': True, 'false': False, '1': True, '0': False}
+
+def normalize_start_time(value: Any) -> Optional[str]:
+    """시작 시간을 UTC ISO 문자열로 통일 (문자열 비교 = 시간 비교)"""
+    if not value:
+        return None
+    
+    start = datetime.fromisoformat(str(value).replace('Z', '+00:00'))
+    if start.tzinfo is None:
+        start = start.replace(tzinfo=KST)
+    return start.astimezone(timezone.utc).strftime('%Y-%m-%dT%H:%M:%S+00:00')
+
+def normalize_row(row: Dict[str, Any]) -> Dict[str, Any]:
+    """비교용 행 정규화 (점수는 정수, 종료 여부는 bool, 빈 문자열은 None)"""
+    normalized = dict(row)
+    normalized['start_time'] = normalize_start_time(row.get('start_time'))
+    
+    for field in ('home_score', 'away_score'):
+        value = row.get(field)
+        normalized[field] = int(value) if value is not None and str(value).strip() != '' else None
+    
+    for field in ('result', 'stadium'):
+        value = row.get(field)
+        normalized[field] = str(value).strip() if value is not None and str(value).strip() != '' else None
+    
+    is_closed = row.get('is_closed')
+    if not isinstance(is_closed, bool):
+        is_closed = _BOOL_VALUES.get(str(is_closed).strip().lower(), False)
+    normalized['is_closed'] = is_closed
+    
+    return normalized
+
+def crawl_row_to_db(sport: str, game: Dict[str, Any]) -> Dict[str, Any]:
+    """검증된 크롤링 레코드를 DB 컬럼 형식으로 변환"""
+    if sport == 'kbo':
+        return {
+            'home_team': game['homeTeam'],
+            'away_team': game['awayTeam'],
+            'start_time': f"{game['date']}T{game['time']}:00+09:00",
+            'home_score': game.get('homeScore'),
+            'away_score': game.get('awayScore'),
+            'result': game.get('result'),
+            'is_closed': game.get('status') == '종료',
+            'stadium': game.get('stadium')
+        }
+    
+    return {field: game.get(field) for field in NATURAL_KEY + COMPARE_FIELDS}
+
+def prepare_crawl_rows(sport: str, records: Iterable[Dict[str, Any]], start_date: str,
+                       end_date: str) -> Tuple[List[Dict[str, Any]], int]:
+    """크롤링 레코드를 검증/정규화 후 기간 안의 행만 자연 키 순으로 정렬"""
+    rules = get_rule_set(sport)
+    window_start, window_end = window_bounds(start_date, end_date)
+    rows = []
+    rejected = 0
+    
+    for record in records:
+        validation = rules.validate({key: value if value != '' else None for key, value in record.items()})
+        if not validation['valid']:
+            rejected += 1
+            continue
+        
+        game = normalize_row(crawl_row_to_db(sport, validation['game']))
+        if game['start_time'] and window_start <= game['start_time'] < window_end:
+            rows.append(game)
+    
+    rows.sort(key=natural_key)
+    return rows, rejected
+
+def load_crawl_file(sport: str, csv_file: str, start_date: str, end_date: str) -> Tuple[List[Dict[str, Any]], int]:
+    """크롤링 CSV 한 개를 검증/정규화 후 자연 키 순으로 정렬"""
+    with open(csv_file, 'r', encoding='utf-8') as file:
+        rows, rejected = prepare_crawl_rows(sport, csv.DictReader(file), start_date, end_date)
+    
+    for row in rows:
+        row['source_file'] = csv_file
+    return rows, rejected
+
+def iter_crawl_rows(sport: str, csv_files: List[str], start_date: str, end_date: str,
+                    stats: Dict[str, int]) -> Iterator[Dict[str, Any]]:
+    """여러 크롤링 CSV를 파일별로 정렬한 뒤 heapq.merge로 병합해 스트리밍"""
+    sorted_files = []
+    for csv_file in csv_files:
+        rows, rejected = load_crawl_file(sport, csv_file, start_date, end_date)
+        stats['crawl_rejected'] = stats.get('crawl_rejected', 0) + rejected
+        sorted_files.append(rows)
+    
+    for row in heapq.merge(*sorted_files, key=natural_key):
+        stats['crawl_rows'] = stats.get('crawl_rows', 0) + 1
+        yield row
+
+def iter_db_rows(client, sport: str, start_date: str, end_date: str, stats: Dict[str, int],
+                 page_size: int = 1000) -> Iterator[Dict[str, Any]]:
+    """DB 행을 시작 시간 순으로 페이지 단위 스트리밍"""
+    spec = get_sport(sport)
+    window_start, window_end = window_bounds(start_date, end_date)
+    columns = ','.join(('id',) + NATURAL_KEY + COMPARE_FIELDS)
+    offset = 0
+    
+    while True:
+        query = client.table(spec['table']).select(columns)
+        for column, value in spec['db_filters'].items():
+            query = query.eq(column, value)
+        with span('supabase_select', sport=sport, table=spec['table']):
+            response = (query.gte('start_time', window_start).lt('start_time', window_end)
+                        .order('start_time').order('id')
+                        .range(offset, offset + page_size - 1).execute())
+        
+        page = response.data or []
+        for row in page:
+            stats['db_rows'] = stats.get('db_rows', 0) + 1
+            yield normalize_row(row)
+        
+        if len(page) < page_size:
+            break
+        offset += page_size
+
+def window_bounds(start_date: str, end_date: str) -> Tuple[str, str]:
+    """KST 날짜 구간 [start_date, end_date]를 UTC 시작/끝(미포함) 문자열로 변환"""
+    start = datetime.strptime(start_date, '%Y-%m-%d').replace(tzinfo=KST)
+    end = datetime.strptime(end_date, '%Y-%m-%d').replace(tzinfo=KST) + timedelta(days=1)
+    return normalize_start_time(start.isoformat()), normalize_start_time(end.isoformat())
+
+def game_date(row: Dict[str, Any]) -> str:
+    """경기 날짜 (UTC로 정규화된 start_time의 KST 날짜)"""
+    start_time = row.get('start_time')
+    if not start_time:
+        return ''
+    return datetime.fromisoformat(start_time).astimezone(KST).strftime('%Y-%m-%d')
+
+def natural_key(row: Dict[str, Any]) -> Tuple[str, ...]:
+    """자연 키 (경기 날짜, 홈팀, 원정팀)"""
+    return (game_date(row),) + tuple(row.get(field) or '' for field in NATURAL_KEY)
+
+def diff_rows(crawl_rows: Iterator[Dict[str, Any]], db_rows: Iterator[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+    """
+    시작 시간(또는 자연 키) 순으로 정렬된 두 스트림을 병합 비교
+
+    DB의 팀명 정렬 순서(collation)는 파이썬 문자열 순서와 다를 수 있으므로
+    경기 날짜 단위로 병합하고, 같은 날짜 안에서는 팀 매치업으로 대조한다.
+    메모리에는 하루치 행만 유지된다.
+    """
+    crawl_groups = groupby(crawl_rows, key=game_date)
+    db_groups = groupby(db_rows, key=game_date)
+    crawl_group = next(crawl_groups, None)
+    db_group = next(db_groups, None)
+    
+    while crawl_group or db_group:
+        if db_group is None or (crawl_group and crawl_group[0] < db_group[0]):
+            yield from diff_slot(list(crawl_group[1]), [])
+            crawl_group = next(crawl_groups, None)
+        elif crawl_group is None or db_group[0] < crawl_group[0]:
+            yield from diff_slot([], list(db_group[1]))
+            db_group = next(db_groups, None)
+        else:
+            yield from diff_slot(list(crawl_group[1]), list(db_group[1]))
+            crawl_group = next(crawl_groups, None)
+            db_group = next(db_groups, None)
+
+def diff_slot(crawl_rows: List[Dict[str, Any]], db_rows: List[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+    """같은 날짜의 경기들 대조"""
+    crawl_by_match: Dict[Tuple[str, str], Dict[str, Any]] = {}
+    db_by_match: Dict[Tuple[str, str], Dict[str, Any]] = {}
+    
+    for row in crawl_rows:
+        match = (row['home_team'], row['away_team'])
+        if match in crawl_by_match:
+            yield conflict('duplicate_crawl', row, None)
+            continue
+        crawl_by_match[match] = row
+    
+    for row in db_rows:
+        match = (row['home_team'], row['away_team'])
+        if match in db_by_match:
+            yield conflict('duplicate_db', None, row)
+            continue
+        db_by_match[match] = row
+    
+    for match, crawl_row in crawl_by_match.items():
+        db_row = db_by_match.pop(match, None)
+        
+        if db_row is None:
+            swapped = db_by_match.pop((match[1], match[0]), None)
+            if swapped is not None:
+                yield conflict('home_away_swapped', crawl_row, swapped)
+            else:
+                yield {'op': 'insert', 'key': list(natural_key(crawl_row)), 'row': crawl_row}
+            continue
+        
+        changes = {}
+        for field in COMPARE_FIELDS:
+            # 크롤링에 구장 정보가 없으면 DB 값을 유지
+            if field == 'stadium' and crawl_row[field] is None:
+                continue
+            if crawl_row[field] != db_row[field]:
+                changes[field] = crawl_row[field]
+        
+        if not changes:
+            continue
+        
+        if db_row['is_closed'] and any(field in changes for field in SETTLED_FIELDS):
+            yield conflict('closed_game_changed', crawl_row, db_row)
+            continue
+        
+        yield {
+            'op': 'update',
+            'id': db_row['id'],
+            'key': list(natural_key(db_row)),
+            'changes': changes,
+            'before': {field: db_row[field] for field in changes}
+        }
+    
+    for db_row in db_by_match.values():
+        yield {'op': 'delete', 'id': db_row['id'], 'key': list(natural_key(db_row)), 'row': db_row}
+
+def conflict(reason: str, crawl_row: Optional[Dict[str, Any]], db_row: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """자동 반영하지 않을 충돌 작업"""
+    row = crawl_row or db_row
+    return {'op': 'conflict', 'reason': reason, 'key': list(natural_key(row)), 'crawl': crawl_row, 'db': db_row}
+
+def reconcile(client, sport: str, csv_files: List[str], start_date: str, end_date: str,
+              output_path: str, page_size: int = 1000) -> Dict[str, Any]:
+    """크롤링 CSV와 DB를 대조해 작업 목록을 JSONL로 기록"""
+    spec = get_sport(sport)
+    stats: Dict[str, int] = {}
+    op_counts = {'insert': 0, 'update': 0, 'delete': 0, 'conflict': 0}
+    
+    print(f"🔍 {spec['name']} 대조 시작: {start_date} ~ {end_date} ({spec['table']})")
+    print("-" * 50)
+    
+    crawl_rows = iter_crawl_rows(sport, csv_files, start_date, end_date, stats)
+    db_rows = iter_db_rows(client, sport, start_date, end_date, stats, page_size)
+    
+    with JsonlReportWriter(output_path, 'reconcile', flush_every=100, sport=sport, table=spec['table'],
+                           start_date=start_date, end_date=end_date, files=csv_files) as report:
+        for operation in diff_rows(crawl_rows, db_rows):
+            op = operation.pop('op')
+            op_counts[op] += 1
+            report.write(op, **operation)
+        
+        summary = dict(op_counts, **stats)
+        report.close(summary)
+    
+    print(f"📊 대조 결과:")
+    print(f"   크롤링 행: {stats.get('crawl_rows', 0)}개 (검증 제외 {stats.get('crawl_rejected', 0)}개)")
+    print(f"   DB 행: {stats.get('db_rows', 0)}개")
+    print(f"   ➕ 추가: {op_counts['insert']}개")
+    print(f"   ✏️  수정: {op_counts['update']}개")
+    print(f"   🗑️  삭제: {op_counts['delete']}개")
+    print(f"   ⚠️  충돌: {op_counts['conflict']}개")
+    print(f"📋 작업 파일: {output_path}")
+    
+    return summary
+
+def apply_operations(client, sport: str, ops_path: str, batch_size: int = 100,
+                     allow_delete: bool = False, dry_run: bool = False, settle: bool = False) -> Dict[str, int]:
+    """대조 결과 작업 파일을 배치 단위로 DB에 반영 (충돌은 건너뜀, settle 시 종료된 경기 마켓 정산)"""
+    spec = get_sport(sport)
+    table = spec['table']
+    counts = {'insert': 0, 'update': 0, 'delete': 0, 'skipped': 0, 'failed': 0}
+    inserts: List[Dict[str, Any]] = []
+    deletes: List[Any] = []
+    closed_game_ids: List[Any] = []
+    
+    def flush_inserts():
+        if inserts and not dry_run:
+            try:
+                with span('supabase_insert', sport=sport, table=table):
+                    client.table(table).insert(list(inserts)).execute()
+                counts['insert'] += len(inserts)
+            except Exception as e:
+                print(f"❌ 추가 배치 실패 ({len(inserts)}개): {e}")
+                counts['failed'] += len(inserts)
+        elif inserts:
+            counts['insert'] += len(inserts)
+        inserts.clear()
+    
+    def flush_deletes():
+        if deletes and not dry_run:
+            try:
+                with span('supabase_delete', sport=sport, table=table):
+                    client.table(table).delete().in_('id', list(deletes)).execute()
+                counts['delete'] += len(deletes)
+            except Exception as e:
+                print(f"❌ 삭제 배치 실패 ({len(deletes)}개): {e}")
+                counts['failed'] += len(deletes)
+        elif deletes:
+            counts['delete'] += len(deletes)
+        deletes.clear()
+    
+    print(f"🚀 작업 반영 시작: {ops_path} → {table}{' (dry-run)' if dry_run else ''}")
+    
+    for record in read_jsonl(ops_path):
+        record_type = record['type']
+        
+        if record_type == 'header' and record.get('sport') != sport:
+            raise ValueError(f"작업 파일의 스포츠({record.get('sport')})가 {sport}와 다릅니다")
+        
+        if record_type == 'insert':
+            row = {field: record['row'][field] for field in NATURAL_KEY + COMPARE_FIELDS}
+            row.update(spec['insert_defaults'])
+            inserts.append(row)
+            if len(inserts) >= batch_size:
+                flush_inserts()
+        
+        elif record_type == 'update':
+            if dry_run:
+                counts['update'] += 1
+                continue
+            try:
+                with span('supabase_update', sport=sport, table=table):
+                    client.table(table).update(record['changes']).eq('id', record['id']).execute()
+                counts['update'] += 1
+                if record['changes'].get('is_closed') is True:
+                    closed_game_ids.append(record['id'])
+            except Exception as e:
+                print(f"❌ 수정 실패 (id={record['id']}): {e}")
+                counts['failed'] += 1
+        
+        elif record_type == 'delete':
+            if not allow_delete:
+                counts['skipped'] += 1
+                continue
+            deletes.append(record['id'])
+            if len(deletes) >= batch_size:
+                flush_deletes()
+        
+        elif record_type == 'conflict':
+            counts['skipped'] += 1
+    
+    flush_inserts()
+    flush_deletes()
+    
+    print(f"📊 반영 결과:")
+    print(f"   ➕ 추가: {counts['insert']}개")
+    print(f"   ✏️  수정: {counts['update']}개")
+    print(f"   🗑️  삭제: {counts['delete']}개")
+    print(f"   ⏭️  건너뜀: {counts['skipped']}개 (충돌{'' if allow_delete else '/삭제'})")
+    print(f"   ❌ 실패: {counts['failed']}개")
+    
+    # 이번에 종료 처리된 경기의 마켓 정산
+    if settle and closed_game_ids:
+        from auto_settlement import settle_closed_games
+        settlement = settle_closed_games(client, sport, closed_game_ids)
+        counts['settled'] = settlement['settled']
+    
+    return counts
+
+def create_supabase_client():
+    """공용 Supabase 클라이언트 (CLI용 - 설정 문제면 안내 후 종료)"""
+    from supabase_client import require_supabase
+    
+    return require_supabase()
+
+@profiled
+def main():
+    """메인 실행 함수"""
+    import argparse
+    import glob
+    
+    parser = argparse.ArgumentParser(description='크롤링 결과 ↔ DB 대조')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    
+    diff_parser = subparsers.add_parser('diff', help='크롤링 CSV와 DB를 대조해 작업 파일 생성')
+    diff_parser.add_argument('sport', choices=['kbo', 'volleyball', 'epl'])
+    diff_parser.add_argument('--csv', nargs='+', required=True, help='크롤링 CSV 파일 (글롭 패턴 가능)')
+    diff_parser.add_argument('--start', required=True, help='시작 날짜 (YYYY-MM-DD, KST)')
+    diff_parser.add_argument('--end', required=True, help='종료 날짜 (YYYY-MM-DD, KST, 포함)')
+    diff_parser.add_argument('--output', help='작업 파일 경로 (.gz면 압축)')
+    diff_parser.add_argument('--page-size', type=int, default=1000, help='DB 조회 페이지 크기')
+    
+    apply_parser = subparsers.add_parser('apply', help='작업 파일을 DB에 배치 반영')
+    apply_parser.add_argument('sport', choices=['kbo', 'volleyball', 'epl'])
+    apply_parser.add_argument('ops', help='diff로 생성한 작업 파일')
+    apply_parser.add_argument('--batch-size', type=int, default=100, help='추가/삭제 배치 크기')
+    apply_parser.add_argument('--allow-delete', action='store_true', help='delete 작업도 반영')
+    apply_parser.add_argument('--dry-run', action='store_true', help='DB에 쓰지 않고 건수만 확인')
+    apply_parser.add_argument('--settle', action='store_true', help='종료 처리된 경기의 스포츠 마켓 자동 정산')
+    
+    args = parser.parse_args()
+    
+    print("🏟️ 크롤링 ↔ DB 대조 도구")
+    print("=" * 60)
+    
+    client = create_supabase_client()
+    
+    if args.command == 'diff':
+        csv_files = sorted({csv_file for pattern in args.csv for csv_file in (glob.glob(pattern) or [pattern])})
+        output_path = args.output or f"{args.sport}_reconcile_{args.start}_{args.end}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.jsonl.gz"
+        reconcile(client, args.sport, csv_files, args.start, args.end, output_path, args.page_size)
+    else:
+        apply_operations(client, args.sport, args.ops, args.batch_size, args.allow_delete, args.dry_run, args.settle)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+스포츠별 크롤링/저장 설정 모음
+- 네이버 스포츠 일정 URL
+- Supabase 테이블 및 sport_id
+- 날짜별 크롤링 함수 / 일정 페이지 HTML 파서
+- 네이버 스포츠 일정 API 카테고리 (월별 경기 캘린더)
+- 스포츠 마켓(markets.sport_type) 연결
+- DB 대조 시 비교할 컬럼
+"""
+
+import importlib
+import os
+from typing import Dict, Any, Callable
+
+SPORTS: Dict[str, Dict[str, Any]] = {
+    'kbo': {
+        'name': '야구',
+        'table': 'games',
+        'sport_id': 1,
+        'schedule_url': 'https://m.sports.naver.com/kbaseball/schedule/index?date={date}',
+        'db_filters': {'sport_id': 1},
+        'insert_defaults': {'sport_id': 1},
+        'crawler': ('naver_2025_0916_crawler', 'crawl_naver_kbo_date'),
+        'page_parser': ('naver_2025_0916_crawler', 'parse_kbo_page'),
+        'api_category': ('kbaseball', ['kbo']),
+        'market_sport_type': 'baseball'
+    },
+    'volleyball': {
+        'name': '배구',
+        'table': 'volleyball_games',
+        'sport_id': 4,
+        'schedule_url': 'https://m.sports.naver.com/volleyball/schedule/index?date={date}',
+        'db_filters': {},
+        'insert_defaults': {'sport_id': 4, 'sport_name': 'volleyball', 'crawled_from': 'naver_sports'},
+        'crawler': ('naver_volleyball_crawler_final', 'crawl_naver_volleyball_date'),
+        'page_parser': ('naver_volleyball_crawler_final', 'parse_volleyball_page'),
+        'api_category': ('kvolleyball', ['kovo', 'wkovo']),  # V-리그 남자부/여자부
+        'market_sport_type': 'volleyball'
+    },
+    'epl': {
+        'name': 'EPL',
+        'table': 'soccer_games',
+        'sport_id': 2,
+        'schedule_url': 'https://m.sports.naver.com/wfootball/schedule/index?category=epl&date={date}',
+        'db_filters': {'league_type': 'epl'},
+        'insert_defaults': {
+            'sport_id': 2, 'sport_name': 'soccer', 'league_name': 'EPL',
+            'league_type': 'epl', 'crawled_from': 'naver_sports'
+        },
+        'crawler': ('naver_epl_crawler_fixed', 'crawl_naver_epl_date_fixed'),
+        'page_parser': ('naver_epl_crawler_fixed', 'parse_epl_page'),
+        'api_category': ('wfootball', ['epl']),
+        'market_sport_type': 'soccer'
+    }
+}
+
+NAVER_SPORTS_BASE_URL = 'https://m.sports.naver.com'
+
+# DB 행 자연 키 컬럼 (start_time의 KST 날짜 + 홈/원정 팀이 같으면 같은 경기)
+NATURAL_KEY = ('home_team', 'away_team')
+
+# 크롤링 결과와 DB 행을 비교할 컬럼 (시작 시간이 바뀌면 일정 변경으로 보고 수정)
+COMPARE_FIELDS = ('start_time', 'home_score', 'away_score', 'result', 'is_closed', 'stadium')
+
+def get_sport(sport: str) -> Dict[str, Any]:
+    """스포츠 설정 반환"""
+    if sport not in SPORTS:
+        raise ValueError(f"지원하지 않는 스포츠: {sport} (가능: {', '.join(SPORTS)})")
+    return SPORTS[sport]
+
+def load_crawler(sport: str) -> Callable:
+    """날짜별 크롤링 함수 반환 (selenium 의존 모듈은 필요할 때만 import)"""
+    module_name, function_name = get_sport(sport)['crawler']
+    return getattr(importlib.import_module(module_name), function_name)
+
+def load_page_parser(sport: str) -> Callable:
+    """일정 페이지 HTML → 경기 목록 파서 반환 (page_source, date)"""
+    module_name, function_name = get_sport(sport)['page_parser']
+    return getattr(importlib.import_module(module_name), function_name)
+
+def schedule_url(sport: str, date: str) -> str:
+    """날짜별 네이버 스포츠 일정 URL (SCHEDULE_BASE_URL 지정 시 해당 서버로, 예: 벤치마크 로컬 서버)"""
+    url = get_sport(sport)['schedule_url'].format(date=date)
+    base_url = os.getenv('SCHEDULE_BASE_URL')
+    if base_url:
+        url = base_url.rstrip('/') + url[len(NAVER_SPORTS_BASE_URL):]
+    return url
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+프로세스 공용 Supabase 클라이언트
+- 모듈 import 시에는 아무것도 하지 않고, 처음 get_supabase()를 부를 때 .env.local 로드 + 클라이언트 생성
+- 이후 같은 프로세스의 모든 임포터/크롤러가 같은 클라이언트(같은 HTTP 연결)를 재사용
+- 패키지나 환경 변수가 없으면 import 시 sys.exit 대신 SupabaseConfigError (CLI는 require_supabase()로 시작 시 확인 후 종료)
+- traced_supabase()는 같은 클라이언트의 execute()를 instrumentation span(supabase_select, supabase_insert 등)으로 기록
+
+사용법:
+    from supabase_client import get_supabase, traced_supabase
+
+    get_supabase().table('games').select('id').limit(1).execute()
+    traced_supabase('kbo').table('games').update({'is_closed': True}).eq('id', 1).execute()  # span: supabase_update
+"""
+
+import os
+import sys
+import threading
+from typing import Optional
+
+from instrumentation import span
+
+# 기존 스크립트와 같은 위치 (crawling/ 에서 실행 기준), SUPABASE_ENV_FILE로 변경 가능
+DEFAULT_ENV_FILE = '../.env.local'
+
+URL_ENV = 'NEXT_PUBLIC_SUPABASE_URL'
+KEY_ENV = 'NEXT_PUBLIC_SUPABASE_ANON_KEY'
+SERVICE_KEY_ENV = 'SUPABASE_SERVICE_ROLE_KEY'
+
+_lock = threading.Lock()
+_clients = {}
+
+class SupabaseConfigError(RuntimeError):
+    """Supabase 패키지/환경 변수 문제로 클라이언트를 만들 수 없음"""
+
+def load_env():
+    """.env.local 로드 (python-dotenv가 없으면 이미 설정된 환경 변수만 사용)"""
+    try:
+        from dotenv import load_dotenv
+    except ImportError:
+        if not (os.getenv(URL_ENV) and os.getenv(KEY_ENV)):
+            raise SupabaseConfigError("python-dotenv 패키지가 설치되지 않았습니다. 설치: pip install python-dotenv")
+        return
+    load_dotenv(os.getenv('SUPABASE_ENV_FILE', DEFAULT_ENV_FILE))
+
+def get_supabase(service_role: bool = False):
+    """
+    공용 Supabase 클라이언트 (처음 호출할 때 한 번만 생성)
+
+    service_role=True면 서비스 키 클라이언트 (SUPABASE_SERVICE_ROLE_KEY가 없으면 anon 키 사용)
+    """
+    client = _clients.get(service_role)
+    if client is not None:
+        return client
+    
+    with _lock:
+        if service_role not in _clients:
+            try:
+                from supabase import create_client
+            except ImportError:
+                raise SupabaseConfigError("supabase 패키지가 설치되지 않았습니다. 설치: pip install supabase")
+            
+            load_env()
+            url = os.getenv(URL_ENV)
+            service_key = os.getenv(SERVICE_KEY_ENV) if service_role else None
+            key = service_key or os.getenv(KEY_ENV)
+            if not url or not key:
+                raise SupabaseConfigError(f"Supabase 환경 변수가 설정되지 않았습니다. {URL_ENV}과 {KEY_ENV}를 확인해주세요.")
+            
+            _clients[service_role] = create_client(url, key)
+            print(f"🔐 Supabase 연결: {'서비스 키' if service_key else 'Anon 키'} 사용")
+    return _clients[service_role]
+
+def require_supabase(service_role: bool = False):
+    """CLI 시작 시 확인용 - 클라이언트를 만들 수 없으면 안내 후 종료"""
+    try:
+        return get_supabase(service_role)
+    except SupabaseConfigError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+
+# span 이름을 정하는 쿼리 빌더 메서드 (supabase_<메서드>)
+TRACED_OPERATIONS = ('select', 'insert', 'update', 'upsert', 'delete')
+
+class TracedQuery:
+    """쿼리 빌더 래퍼 - 체인 호출은 그대로 넘기고 execute()만 span으로 기록"""
+    
+    def __init__(self, query, stage: str, tags: dict):
+        self._query = query
+        self._stage = stage
+        self._tags = tags
+    
+    def __getattr__(self, name):
+        attr = getattr(self._query, name)
+        if not callable(attr):
+            return attr
+        stage = f"supabase_{name}" if name in TRACED_OPERATIONS else self._stage
+        
+        def call(*args, **kwargs):
+            return TracedQuery(attr(*args, **kwargs), stage, self._tags)
+        return call
+    
+    def execute(self):
+        with span(self._stage, **self._tags):
+            return self._query.execute()
+
+class TracedClient:
+    """table()/rpc() 요청을 span으로 기록하는 클라이언트 래퍼 (나머지 속성은 원래 클라이언트)"""
+    
+    def __init__(self, client, sport: Optional[str] = None):
+        self._client = client
+        self._tags = {'sport': sport} if sport else {}
+    
+    def table(self, name: str) -> TracedQuery:
+        return TracedQuery(self._client.table(name), 'supabase_query', dict(self._tags, table=name))
+    
+    def rpc(self, function: str, params: Optional[dict] = None) -> TracedQuery:
+        return TracedQuery(self._client.rpc(function, params or {}), 'supabase_rpc', dict(self._tags, rpc=function))
+    
+    def __getattr__(self, name):
+        return getattr(self._client, name)
+
+def traced_supabase(sport: Optional[str] = None, service_role: bool = False) -> TracedClient:
+    """공용 클라이언트를 span 기록 래퍼로 반환 (sport는 span 태그)"""
+    return TracedClient(get_supabase(service_role), sport)
+
+def reset_supabase():
+    """공용 클라이언트 폐기 (키 변경 후 다시 만들 때)"""
+    with _lock:
+        _clients.clear()
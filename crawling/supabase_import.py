@@ -2,121 +2,100 @@
 # -*- coding: utf-8 -*-
 
 import os
-import csv
-import sys
 from datetime import datetime
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Tuple
 
-# Supabase 클라이언트 import
-try:
-    from supabase import create_client, Client
-except ImportError:
-    print("❌ supabase 패키지가 설치되지 않았습니다.")
-    print("다음 명령어로 설치해주세요: pip install supabase")
-    sys.exit(1)
+from csv_ingest import ingest_csv
+from instrumentation import span
+from profiling import profiled
+from supabase_client import get_supabase, require_supabase
+from validation_rules import get_rule_set
 
-# 환경 변수 로드
-try:
-    from dotenv import load_dotenv
-    load_dotenv('../.env.local')
-except ImportError:
-    print("❌ python-dotenv 패키지가 설치되지 않았습니다.")
-    print("다음 명령어로 설치해주세요: pip install python-dotenv")
-    sys.exit(1)
-
-# Supabase 설정
-SUPABASE_URL = os.getenv('NEXT_PUBLIC_SUPABASE_URL')
-SUPABASE_KEY = os.getenv('NEXT_PUBLIC_SUPABASE_ANON_KEY')
-
-if not SUPABASE_URL or not SUPABASE_KEY:
-    print("❌ Supabase 환경 변수가 설정되지 않았습니다.")
-    print("NEXT_PUBLIC_SUPABASE_URL과 NEXT_PUBLIC_SUPABASE_ANON_KEY를 확인해주세요.")
-    sys.exit(1)
-
-# Supabase 클라이언트 생성
-supabase: Client = create_client(SUPABASE_URL, SUPABASE_KEY)
+def prepare_game_data(row_num: int, row: Dict[str, str], rules, timestamp: str) -> Optional[Dict[str, Any]]:
+    """CSV 행 검증 후 games 테이블 레코드로 변환 (검증 실패 시 None)"""
+    # 데이터 검증 (빈 값은 None으로 변환 후 KBO 규칙 적용)
+    validation = rules.validate({key: value if value != '' else None for key, value in row.items()})
+    if not validation['valid']:
+        print(f"⚠️  검증 실패로 제외: {row.get('awayTeam')} vs {row.get('homeTeam')} - {', '.join(validation['issues'])}")
+        return None
+    row = validation['game']
+    
+    return {
+        'sport_id': 1,  # 야구 = 1
+        'home_team': row['homeTeam'],
+        'away_team': row['awayTeam'],
+        'start_time': f"{row['date']}T{row['time']}:00+09:00",  # ISO 8601 형식
+        'home_score': row['homeScore'],
+        'away_score': row['awayScore'],
+        'result': row['result'],
+        'is_closed': row['status'] == '종료',
+        'stadium': row['stadium'],
+        'created_at': timestamp,
+        'updated_at': timestamp
+    }
 
-def load_csv_data(file_path: str) -> List[Dict[str, Any]]:
-    """CSV 파일에서 데이터를 로드합니다."""
-    games = []
+def insert_game_chunk(chunk: List[Tuple[int, Dict[str, Any]]]) -> Dict[str, int]:
+    """묶음 하나를 중복 확인 후 삽입 (csv_ingest 쓰기 쓰레드에서 호출)"""
+    counts = {'success': 0, 'duplicate': 0, 'error': 0}
     
-    try:
-        with open(file_path, 'r', encoding='utf-8') as file:
-            reader = csv.DictReader(file)
+    for _, game in chunk:
+        try:
+            # 중복 확인 (같은 날짜, 같은 팀 매치업)
+            with span('supabase_select', sport='kbo', table='games'):
+                existing = get_supabase().table('games').select('id').eq('home_team', game['home_team']).eq('away_team', game['away_team']).eq('start_time', game['start_time']).execute()
             
-            for row in reader:
-                # 데이터 변환
-                game_data = {
-                    'sport_id': 1,  # 야구 = 1
-                    'home_team': row['homeTeam'],
-                    'away_team': row['awayTeam'],
-                    'start_time': f"{row['date']}T{row['time']}:00+09:00",  # ISO 8601 형식
-                    'home_score': int(row['homeScore']) if row['homeScore'] else None,
-                    'away_score': int(row['awayScore']) if row['awayScore'] else None,
-                    'result': row['result'] if row['result'] else None,
-                    'is_closed': row['status'] == '종료',
-                    'stadium': row['stadium'],
-                    'created_at': datetime.now().isoformat(),
-                    'updated_at': datetime.now().isoformat()
-                }
-                
-                games.append(game_data)
+            if existing.data:
+                print(f"⚠️  중복 데이터: {game['away_team']} vs {game['home_team']} ({game['start_time'][:10]})")
+                counts['duplicate'] += 1
+                continue
+            
+            # 데이터 삽입
+            with span('supabase_insert', sport='kbo', table='games'):
+                result = get_supabase().table('games').insert(game).execute()
+            
+            if result.data:
+                print(f"✅ 삽입 성공: {game['away_team']} vs {game['home_team']} ({game['start_time'][:10]})")
+                counts['success'] += 1
+            else:
+                print(f"❌ 삽입 실패: {game['away_team']} vs {game['home_team']}")
+                counts['error'] += 1
                 
-        print(f"✅ {len(games)}개의 경기 데이터를 로드했습니다.")
-        return games
-        
-    except FileNotFoundError:
-        print(f"❌ 파일을 찾을 수 없습니다: {file_path}")
-        return []
-    except Exception as e:
-        print(f"❌ CSV 로드 중 오류 발생: {e}")
-        return []
+        except Exception as e:
+            print(f"❌ 개별 삽입 오류: {game['away_team']} vs {game['home_team']} - {e}")
+            counts['error'] += 1
+    
+    return counts
 
-def insert_games_to_supabase(games: List[Dict[str, Any]]) -> bool:
-    """게임 데이터를 Supabase에 삽입합니다."""
+def import_csv_to_supabase(file_path: str) -> bool:
+    """CSV를 묶음 단위로 읽으면서 바로 Supabase에 삽입 (파일 전체를 메모리에 올리지 않음)"""
+    rules = get_rule_set('kbo')
+    # 같은 실행에서 올린 레코드는 같은 생성 시각
+    timestamp = datetime.now().isoformat()
+    
     try:
-        # 기존 데이터 중복 확인 및 삽입
-        success_count = 0
-        duplicate_count = 0
-        error_count = 0
-        
-        for game in games:
-            try:
-                # 중복 확인 (같은 날짜, 같은 팀 매치업)
-                existing = supabase.table('games').select('id').eq('home_team', game['home_team']).eq('away_team', game['away_team']).eq('start_time', game['start_time']).execute()
-                
-                if existing.data:
-                    print(f"⚠️  중복 데이터: {game['away_team']} vs {game['home_team']} ({game['start_time'][:10]})")
-                    duplicate_count += 1
-                    continue
-                
-                # 데이터 삽입
-                result = supabase.table('games').insert(game).execute()
-                
-                if result.data:
-                    print(f"✅ 삽입 성공: {game['away_team']} vs {game['home_team']} ({game['start_time'][:10]})")
-                    success_count += 1
-                else:
-                    print(f"❌ 삽입 실패: {game['away_team']} vs {game['home_team']}")
-                    error_count += 1
-                    
-            except Exception as e:
-                print(f"❌ 개별 삽입 오류: {game['away_team']} vs {game['home_team']} - {e}")
-                error_count += 1
-        
-        print("\n" + "="*60)
-        print(f"📊 삽입 결과:")
-        print(f"   ✅ 성공: {success_count}개")
-        print(f"   ⚠️  중복: {duplicate_count}개")
-        print(f"   ❌ 실패: {error_count}개")
-        print("="*60)
-        
-        return success_count > 0
-        
+        result = ingest_csv(file_path, lambda row_num, row: prepare_game_data(row_num, row, rules, timestamp),
+                            insert_game_chunk)
+    except FileNotFoundError:
+        print(f"❌ 파일을 찾을 수 없습니다: {file_path}")
+        return False
     except Exception as e:
-        print(f"❌ Supabase 삽입 중 오류 발생: {e}")
+        print(f"❌ CSV 적재 중 오류 발생: {e}")
         return False
+    
+    written = result['written']
+    print("\n" + "="*60)
+    print(f"📊 삽입 결과 ({result['rows']}행, {result['chunks']}묶음, {result['seconds']:.1f}초):")
+    print(f"   ✅ 성공: {written.get('success', 0)}개")
+    print(f"   ⚠️  중복: {written.get('duplicate', 0)}개")
+    print(f"   ❌ 실패: {written.get('error', 0)}개")
+    print(f"   🚫 검증 제외: {result['rejected']}개")
+    print("="*60)
+    
+    if not result['rows'] - result['rejected']:
+        print("❌ 로드할 데이터가 없습니다.")
+    return written.get('success', 0) > 0
 
+@profiled
 def main():
     """메인 실행 함수"""
     print("🏟️ 야구 데이터 Supabase 업로드 시작")
@@ -133,15 +112,8 @@ def main():
     csv_file = sorted(csv_files)[-1]
     print(f"📁 사용할 파일: {csv_file}")
     
-    # 데이터 로드
-    games = load_csv_data(csv_file)
-    
-    if not games:
-        print("❌ 로드할 데이터가 없습니다.")
-        return
-    
-    # Supabase에 삽입
-    success = insert_games_to_supabase(games)
+    # 읽으면서 바로 Supabase에 삽입
+    success = import_csv_to_supabase(csv_file)
     
     if success:
         print("\n🎉 데이터 업로드가 완료되었습니다!")
@@ -150,4 +122,5 @@ def main():
         print("\n❌ 데이터 업로드에 실패했습니다.")
 
 if __name__ == "__main__":
+    require_supabase()
     main()
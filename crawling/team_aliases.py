@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+종목별 팀/구장 별칭 색인
+- 팀명, 구장명, 리그 구분(배구 남녀부)을 이 모듈 한 곳에서 관리 (검증 규칙, 크롤러, 임포터가 같은 데이터 사용)
+- 종목마다 색인을 한 번만 만들어 대소문자/공백 무시, 한글/영문 표기, 옛 이름(SK, 넥센, KGC인삼공사 등)을 dict 조회 한 번으로 정규화
+- 처음 보는 표기는 difflib 유사도로 한 번만 찾아 결과를 기억 (같은 표기는 다시 계산하지 않음)
+- 페이지 텍스트에서 팀 찾기는 별칭 전체를 묶은 정규식 한 번으로 처리
+
+사용법:
+    from team_aliases import get_team_index, home_stadium
+
+    get_team_index('kbo').normalize('Nexen')        # → '키움'
+    get_team_index('kbo').scan('스코어3SK와이번스...')  # → ['SSG', ...]
+    home_stadium('kbo', 'LG')                       # → '서울 잠실야구장'
+"""
+
+import difflib
+import re
+from functools import lru_cache
+from typing import List, Dict, Optional
+
+# 종목별 팀 (대표 이름 → 별칭), 대표 이름 순서가 teams_in 결과 순서
+TEAM_ALIASES: Dict[str, Dict[str, List[str]]] = {
+    'kbo': {
+        'KIA': ['기아', 'KIA 타이거즈', '기아 타이거즈', 'Kia Tigers', '해태'],
+        'KT': ['케이티', 'KT 위즈', 'kt wiz'],
+        'LG': ['엘지', 'LG 트윈스', 'LG Twins'],
+        'NC': ['엔씨', 'NC 다이노스', 'NC Dinos'],
+        'SSG': ['에스에스지', 'SSG 랜더스', 'SSG Landers', 'SK', 'SK 와이번스', 'SK Wyverns'],
+        '두산': ['두산 베어스', 'Doosan', 'Doosan Bears'],
+        '롯데': ['롯데 자이언츠', 'Lotte', 'Lotte Giants'],
+        '삼성': ['삼성 라이온즈', 'Samsung', 'Samsung Lions'],
+        '한화': ['한화 이글스', 'Hanwha', 'Hanwha Eagles', '빙그레'],
+        '키움': ['키움 히어로즈', 'Kiwoom', 'Kiwoom Heroes', '넥센', '넥센 히어로즈', 'Nexen', 'Nexen Heroes', '히어로즈']
+    },
+    'volleyball': {
+        # V-리그 남자부
+        '대한항공': ['대한항공 점보스', 'Korean Air'],
+        '현대캐피탈': ['현대캐피탈 스카이워커스', 'Hyundai Capital'],
+        'OK저축은행': ['OK금융그룹', 'OK 읏맨', 'OK Savings Bank'],
+        '우리카드': ['우리카드 우리WON', 'Woori Card'],
+        'KB손해보험': ['KB손보', 'KB손해보험 스타즈', 'KB Insurance'],
+        '삼성화재': ['삼성화재 블루팡스', 'Samsung Fire'],
+        '한국전력': ['한전', '한국전력 빅스톰', 'KEPCO'],
+        # V-리그 여자부
+        '현대건설': ['현대건설 힐스테이트', 'Hyundai E&C'],
+        '흥국생명': ['흥국생명 핑크스파이더스', 'Heungkuk Life'],
+        'GS칼텍스': ['GS칼텍스 서울 Kixx', 'GS Caltex'],
+        '페퍼저축은행': ['페퍼', 'AI페퍼스', 'AI Peppers'],
+        '한국도로공사': ['도로공사', '한국도로공사 하이패스', 'Korea Expressway'],
+        '정관장': ['정관장 레드스파크스', 'KGC인삼공사', 'KGC', 'Red Sparks'],
+        'IBK기업은행': ['IBK', 'IBK기업은행 알토스', 'IBK Altos']
+    },
+    'epl': {
+        '리버풀': ['Liverpool'],
+        '아스널': ['아스날', 'Arsenal'],
+        '맨시티': ['맨체스터 시티', 'Man City', 'Manchester City'],
+        '맨유': ['맨체스터 유나이티드', 'Man Utd', 'Man United', 'Manchester United'],
+        '첼시': ['Chelsea'],
+        '토트넘': ['토트넘 홋스퍼', 'Tottenham', 'Tottenham Hotspur', 'Spurs'],
+        '뉴캐슬': ['뉴캐슬 유나이티드', 'Newcastle', 'Newcastle United'],
+        '애스턴 빌라': ['아스톤 빌라', 'Aston Villa'],
+        '팰리스': ['크리스탈 팰리스', 'Crystal Palace'],
+        '노팅엄': ['노팅엄 포레스트', 'Nottingham Forest', "Nott'm Forest"],
+        '선덜랜드': ['Sunderland'],
+        '본머스': ['Bournemouth', 'AFC Bournemouth'],
+        '브라이턴': ['브라이튼', 'Brighton', 'Brighton & Hove Albion'],
+        '풀럼': ['Fulham'],
+        '리즈': ['리즈 유나이티드', 'Leeds', 'Leeds United'],
+        '에버턴': ['에버튼', 'Everton'],
+        '울버햄튼': ['울버햄프턴', '울브스', 'Wolves', 'Wolverhampton'],
+        '웨스트햄': ['웨스트햄 유나이티드', 'West Ham', 'West Ham United'],
+        '브렌트퍼드': ['브렌트포드', 'Brentford'],
+        '번리': ['Burnley']
+    }
+}
+
+# 종목별 팀 구분 (배구 남녀부)
+TEAM_GROUPS: Dict[str, Dict[str, List[str]]] = {
+    'volleyball': {
+        'men': ['대한항공', '현대캐피탈', 'OK저축은행', '우리카드', 'KB손해보험', '삼성화재', '한국전력'],
+        'women': ['현대건설', '흥국생명', 'GS칼텍스', '페퍼저축은행', '한국도로공사', '정관장', 'IBK기업은행']
+    }
+}
+
+# 홈 구장 (팀 대표 이름 → 구장 대표 이름)
+HOME_STADIUMS: Dict[str, Dict[str, str]] = {
+    'kbo': {
+        'KIA': '광주-기아 챔피언스 필드',
+        'KT': '수원 KT위즈파크',
+        'LG': '서울 잠실야구장',
+        'NC': '창원 NC파크',
+        'SSG': '인천 SSG랜더스필드',
+        '두산': '서울 잠실야구장',
+        '롯데': '부산 사직야구장',
+        '삼성': '대구 삼성라이온즈파크',
+        '한화': '대전 한화생명이글스파크',
+        '키움': '서울 고척스카이돔'
+    }
+}
+
+# 구장 (대표 이름 → 별칭)
+STADIUM_ALIASES: Dict[str, Dict[str, List[str]]] = {
+    'kbo': {
+        '광주-기아 챔피언스 필드': ['광주', '챔피언스필드', '기아챔피언스필드'],
+        '수원 KT위즈파크': ['수원', 'KT위즈파크', '위즈파크'],
+        '서울 잠실야구장': ['잠실', '잠실야구장'],
+        '창원 NC파크': ['창원', 'NC파크'],
+        '인천 SSG랜더스필드': ['문학', '인천', 'SSG랜더스필드', '문학야구장', 'SK행복드림구장', '인천SK행복드림구장'],
+        '부산 사직야구장': ['사직', '사직야구장'],
+        '대구 삼성라이온즈파크': ['대구', '라이온즈파크', '삼성라이온즈파크'],
+        '대전 한화생명이글스파크': ['대전', '이글스파크', '한화생명이글스파크'],
+        '서울 고척스카이돔': ['고척', '고척돔', '고척스카이돔']
+    }
+}
+
+# 처음 보는 표기를 별칭으로 인정할 최소 유사도 (difflib ratio)
+FUZZY_CUTOFF = 0.8
+
+# 이 길이 이하의 영문 약칭(KT, LG, SSG 등)은 대문자로 쓰였으면 붙어 있는 텍스트(KTvsLG, NCSSG)에서도 찾음
+SHORT_CODE_LENGTH = 3
+
+_WHITESPACE = re.compile(r'\s+')
+
+def fold(name: str) -> str:
+    """비교용 키 (대소문자 무시, 공백 제거)"""
+    return _WHITESPACE.sub('', name).casefold()
+
+class AliasIndex:
+    """대표 이름/별칭 → 대표 이름 색인 (종목마다 한 번 생성)"""
+    
+    def __init__(self, aliases: Dict[str, List[str]], fuzzy_cutoff: float = FUZZY_CUTOFF):
+        self.names = list(aliases)
+        self.fuzzy_cutoff = fuzzy_cutoff
+        self._order = {name: position for position, name in enumerate(self.names)}
+        self._exact: Dict[str, str] = {}
+        for name, names in aliases.items():
+            for alias in [name, *names]:
+                self._exact.setdefault(fold(alias), name)
+        self._fuzzy_cache: Dict[str, Optional[str]] = {}
+        self._pattern = self._compile_pattern()
+    
+    def _compile_pattern(self) -> Optional[re.Pattern]:
+        """페이지 텍스트용 정규식 (긴 별칭 우선, 영문 별칭은 대문자 약칭이 아니면 영문자 사이에서는 찾지 않음)"""
+        parts = []
+        for key in sorted(self._exact, key=len, reverse=True):
+            body = r'\s*'.join(re.escape(char) for char in key)
+            if key.isascii():
+                body = rf'(?<![a-z]){body}(?![a-z])'
+                if len(key) <= SHORT_CODE_LENGTH:
+                    body = rf'(?-i:{re.escape(key.upper())})|{body}'
+            parts.append(body)
+        return re.compile('|'.join(parts), re.IGNORECASE) if parts else None
+    
+    def resolve(self, name: Optional[str]) -> Optional[str]:
+        """대표 이름 (별칭에 없고 비슷한 이름도 없으면 None)"""
+        if not name:
+            return None
+        key = fold(name)
+        found = self._exact.get(key)
+        if found is not None:
+            return found
+        
+        if key not in self._fuzzy_cache:
+            matches = difflib.get_close_matches(key, self._exact, n=1, cutoff=self.fuzzy_cutoff)
+            self._fuzzy_cache[key] = self._exact[matches[0]] if matches else None
+        return self._fuzzy_cache[key]
+    
+    def normalize(self, name: Optional[str]) -> Optional[str]:
+        """대표 이름으로 정규화 (찾지 못하면 공백만 정리해서 반환)"""
+        if not name:
+            return name
+        return self.resolve(name) or name.strip()
+    
+    def scan(self, text: str) -> List[str]:
+        """텍스트에 나오는 대표 이름 (나온 순서대로, 중복 포함)"""
+        if self._pattern is None:
+            return []
+        return [self._exact[fold(match.group(0))] for match in self._pattern.finditer(text)]
+    
+    def teams_in(self, text: str) -> List[str]:
+        """텍스트에 나오는 대표 이름 (중복 없이 색인 정의 순서대로)"""
+        return sorted(set(self.scan(text)), key=self._order.__getitem__)
+
+@lru_cache(maxsize=None)
+def get_team_index(sport: str) -> AliasIndex:
+    if sport not in TEAM_ALIASES:
+        raise ValueError(f"지원하지 않는 스포츠: {sport}")
+    return AliasIndex(TEAM_ALIASES[sport])
+
+@lru_cache(maxsize=None)
+def get_stadium_index(sport: str) -> AliasIndex:
+    return AliasIndex(STADIUM_ALIASES.get(sport, {}))
+
+@lru_cache(maxsize=None)
+def _group_lookup(sport: str) -> Dict[str, str]:
+    return {team: group for group, teams in TEAM_GROUPS.get(sport, {}).items() for team in teams}
+
+def home_stadium(sport: str, team: Optional[str]) -> Optional[str]:
+    """팀 홈 구장 (별칭으로 불러도 됨)"""
+    return HOME_STADIUMS.get(sport, {}).get(get_team_index(sport).normalize(team))
+
+def team_group(sport: str, team: Optional[str]) -> Optional[str]:
+    """팀 구분 (배구: men / women, 등록되지 않은 팀은 None)"""
+    return _group_lookup(sport).get(get_team_index(sport).normalize(team))
@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+data_validator 행 단위/DataFrame 일괄 검증 동등성 테스트
+- kbo_games_validation_fixture.csv: KBO 크롤러 CSV 형식(date, homeTeam, ...)으로 별칭, 잘못된 점수/상태/시간,
+  시간이 점수로 저장된 경기, 실제 결과 교체 날짜(2024-08-31), 중복 경기를 모은 고정 데이터
+
+사용법:
+    python -m unittest test_data_validator
+"""
+
+import contextlib
+import io
+import os
+import unittest
+
+from data_validator import KBODataValidator
+
+FIXTURE_CSV = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'kbo_games_validation_fixture.csv')
+
+class ValidationModeTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        validator = KBODataValidator()
+        with contextlib.redirect_stdout(io.StringIO()):
+            cls.reference = validator.load_and_validate_csv(FIXTURE_CSV)
+            cls.batch = validator.load_and_validate_csv_batch(FIXTURE_CSV)
+    
+    def test_batch_matches_row_validation(self):
+        self.assertNotIn('error', self.reference)
+        self.assertEqual(self.batch, self.reference)
+    
+    def test_fixture_covers_rules(self):
+        # 모든 행이 필수 필드 누락에서 멈추지 않고 각 규칙까지 검증되는지 확인
+        issues = '\n'.join(self.reference['issues'])
+        for expected in ('시간이 점수로 잘못 저장됨', '비정상적인 홈팀 점수', '잘못된 점수 형식',
+                         '유효하지 않은 상태', '유효하지 않은 홈팀', '잘못된 날짜 형식', '중복 경기'):
+            self.assertIn(expected, issues)
+        self.assertEqual(self.reference['original_count'], 17)
+        self.assertEqual(self.reference['duplicate_count'], 1)
+    
+    def test_aliases_and_reference_results(self):
+        games = {(game['date'], game['homeTeam'], game['awayTeam']): game for game in self.reference['validated_games']}
+        # kt wiz / SK 와이번스 → KT / SSG, 2024-08-31 실제 결과로 교체
+        replaced = games[('2024-08-31', 'KT', 'SSG')]
+        self.assertEqual((replaced['homeScore'], replaced['awayScore'], replaced['result']), (7, 4, '1'))
+        # 진행 중인 경기는 결과 없음
+        self.assertIsNone(games[('2025-09-23', '삼성', 'LG')]['result'])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+team_aliases 별칭 색인 테스트
+
+사용법:
+    python -m unittest test_team_aliases
+"""
+
+import unittest
+
+from bs4 import BeautifulSoup
+from team_aliases import get_stadium_index, get_team_index
+
+class TeamScanTest(unittest.TestCase):
+    def setUp(self):
+        self.kbo = get_team_index('kbo')
+    
+    def test_adjacent_short_codes(self):
+        # get_text(strip=True)는 텍스트 노드를 구분자 없이 이어 붙임
+        self.assertEqual(self.kbo.scan('KTvsLG'), ['KT', 'LG'])
+        self.assertEqual(self.kbo.scan('NCSSG'), ['NC', 'SSG'])
+        self.assertEqual(self.kbo.scan('KIA타이거즈LG'), ['KIA', 'LG'])
+    
+    def test_joined_match_box_text(self):
+        html = '<li><span>KT</span><em>vs</em><span>LG</span></li>'
+        item = BeautifulSoup(html, 'html.parser').li
+        self.assertEqual(self.kbo.scan(item.get_text(strip=True)), ['KT', 'LG'])
+        self.assertEqual(self.kbo.scan(item.get_text(' ', strip=True)), ['KT', 'LG'])
+    
+    def test_aliases_and_old_names(self):
+        self.assertEqual(self.kbo.scan('스코어3SK와이번스'), ['SSG'])
+        self.assertEqual(self.kbo.scan('kt wiz 3 : 2 lg'), ['KT', 'LG'])
+        self.assertEqual(self.kbo.teams_in('넥센 히어로즈 vs 두산 베어스'), ['두산', '키움'])
+    
+    def test_no_match_inside_words(self):
+        # 대문자 약칭이 아니면 영문 단어 안에서는 찾지 않음 (vs Kiwoom의 "s K" ≠ SK)
+        self.assertEqual(self.kbo.scan('Kia Tigers vs Kiwoom'), ['KIA', '키움'])
+        self.assertEqual(self.kbo.scan('desk kiosk'), [])
+
+class NormalizeTest(unittest.TestCase):
+    def test_team_normalize(self):
+        self.assertEqual(get_team_index('kbo').normalize('Nexen'), '키움')
+        self.assertEqual(get_team_index('volleyball').normalize('KGC인삼공사'), '정관장')
+        self.assertEqual(get_team_index('kbo').normalize('미등록 팀 '), '미등록 팀')
+    
+    def test_stadium_normalize(self):
+        self.assertEqual(get_stadium_index('kbo').normalize('잠실'), '서울 잠실야구장')
+        self.assertEqual(get_stadium_index('epl').scan('Anfield'), [])
+
+if __name__ == '__main__':
+    unittest.main()
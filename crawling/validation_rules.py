@@ -0,0 +1,389 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import re
+from datetime import datetime
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, Callable
+
+from team_aliases import HOME_STADIUMS, TEAM_ALIASES, get_stadium_index, get_team_index
+
+# 레코드 스키마별 필드 이름
+# camel: 네이버 KBO 크롤러 CSV (date, homeTeam, ...)
+# snake: 배구/EPL 크롤러 CSV 및 DB 행 (start_time, home_team, ...)
+FIELD_SCHEMAS = {
+    'camel': {
+        'date': 'date', 'time': 'time',
+        'home_team': 'homeTeam', 'away_team': 'awayTeam',
+        'home_score': 'homeScore', 'away_score': 'awayScore',
+        'result': 'result', 'status': 'status', 'stadium': 'stadium'
+    },
+    'snake': {
+        'start_time': 'start_time',
+        'home_team': 'home_team', 'away_team': 'away_team',
+        'home_score': 'home_score', 'away_score': 'away_score',
+        'result': 'result', 'is_closed': 'is_closed', 'stadium': 'stadium'
+    }
+}
+
+# 실제 데이터 교체 이슈 (검증 실패로 보지 않음)
+REFERENCE_ISSUE_PREFIX = "실제 데이터로"
+
+# 스포츠별 선언적 규칙 세트
+RULE_SETS: Dict[str, Dict[str, Any]] = {
+    'kbo': {
+        'schema': 'camel',
+        'teams': set(TEAM_ALIASES['kbo']),  # 별칭(kt, SK, 넥센 등)은 team_aliases 색인으로 정규화
+        'score_range': (0, 30),
+        'result_labels': {'home': '1', 'away': '2', 'draw': '0'},
+        'final_status': '종료',  # 이 상태인 경기만 결과 계산 (진행 중 점수는 결과로 보지 않음)
+        'statuses': {'예정', '진행중', '종료', '취소', '연기'},
+        'default_status': '예정',
+        'time_pattern': r'^\d{1,2}:\d{2}$',
+        'default_time': '14:00',
+        'reject_time_as_score': True,  # 18:30 -> 18:30 점수 오파싱 방지
+        'stadiums': HOME_STADIUMS['kbo'],
+        # 실제 경기 결과 (날짜별, 검증용)
+        'reference_results': {
+            '2024-08-31': {
+                ('LG', '삼성'): {'homeScore': 5, 'awayScore': 3, 'result': '1'},
+                ('KT', 'SSG'): {'homeScore': 7, 'awayScore': 4, 'result': '1'},
+                ('두산', 'KIA'): {'homeScore': 3, 'awayScore': 6, 'result': '2'},
+                ('NC', '롯데'): {'homeScore': 8, 'awayScore': 2, 'result': '1'},
+                ('한화', '키움'): {'homeScore': 4, 'awayScore': 7, 'result': '2'}
+            }
+        }
+    },
+    'volleyball': {
+        'schema': 'snake',
+        'blank_as_none': True,
+        'teams': set(TEAM_ALIASES['volleyball']),  # V-리그 남녀부
+        'team_patterns': [r'[가-힣]+대(학교)?'],  # 대학 배구팀 (홍익대, 인하대 등)
+        'score_range': (0, 3),  # 세트 스코어
+        'final_sets': 3,  # 종료 경기는 승리팀이 3세트
+        'result_labels': {'home': 'home_win', 'away': 'away_win', 'draw': 'draw'}
+    },
+    'epl': {
+        'schema': 'snake',
+        'blank_as_none': True,
+        'teams': set(TEAM_ALIASES['epl']),
+        'score_range': (0, 20),
+        'result_labels': {'home': 'home_win', 'away': 'away_win', 'draw': 'draw'}
+    }
+}
+
+_TIME_PARTS = re.compile(r'^(\d{1,2}):(\d{2})')
+_BOOL_VALUES = {True: True, False: False, 'True': True, 'False': False,
+                'true': True, 'false': False, '1': True, '0': False, 1: True, 0: False}
+
+class CompiledRuleSet:
+    """스포츠별 규칙 세트를 한 번 컴파일해 레코드당 한 번의 순회로 검증"""
+    
+    def __init__(self, sport: str, schema: Optional[str] = None):
+        if sport not in RULE_SETS:
+            raise ValueError(f"지원하지 않는 스포츠: {sport}")
+        
+        spec = RULE_SETS[sport]
+        self.sport = sport
+        self.spec = spec
+        self.schema = schema or spec['schema']
+        self.fields = FIELD_SCHEMAS[self.schema]
+        
+        self.teams = frozenset(spec['teams'])
+        self.team_index = get_team_index(sport)
+        self.team_patterns = [re.compile(pattern) for pattern in spec.get('team_patterns', [])]
+        self._team_cache: Dict[Any, Any] = {}
+        
+        self.steps = self._compile()
+    
+    def validate(self, record: Dict[str, Any]) -> Dict[str, Any]:
+        """단일 레코드 검증 및 정제 (validate_game과 같은 형식으로 반환)"""
+        game = record.copy()
+        issues: List[str] = []
+        context: Dict[str, Any] = {}
+        
+        for step in self.steps:
+            if step(game, issues, context) is False:
+                return {'game': game, 'issues': issues, 'valid': False}
+        
+        is_valid = all(issue.startswith(REFERENCE_ISSUE_PREFIX) for issue in issues)
+        
+        return {
+            'game': game,
+            'issues': issues,
+            'valid': is_valid
+        }
+    
+    def normalize_team(self, team_name: str) -> str:
+        """팀명 정규화 (종목 별칭 색인, 처음 보는 표기는 유사도 검색 결과를 기억)"""
+        return self.team_index.normalize(team_name)
+    
+    def is_known_team(self, team_name: str) -> bool:
+        """규칙 세트에 등록된 팀인지 확인 (결과 캐시)"""
+        known = self._team_cache.get(team_name)
+        if known is None:
+            known = team_name in self.teams or any(
+                isinstance(team_name, str) and pattern.fullmatch(team_name)
+                for pattern in self.team_patterns
+            )
+            self._team_cache[team_name] = known
+        return known
+    
+    def _compile(self) -> List[Callable]:
+        """규칙 세트를 검증 단계(클로저) 목록으로 변환"""
+        spec = self.spec
+        fields = self.fields
+        steps = []
+        
+        if spec.get('blank_as_none'):
+            steps.append(self._blank_step())
+        
+        if self.schema == 'camel':
+            required = [fields['date'], fields['home_team'], fields['away_team']]
+        else:
+            required = [fields['start_time'], fields['home_team'], fields['away_team']]
+        steps.append(self._required_step(required))
+        steps.append(self._team_step())
+        steps.append(self._date_step())
+        steps.append(self._score_step())
+        steps.append(self._result_step())
+        
+        if 'statuses' in spec:
+            steps.append(self._status_step())
+        if 'is_closed' in fields:
+            steps.append(self._closed_step())
+        if 'time_pattern' in spec:
+            steps.append(self._time_step())
+        if 'stadiums' in spec:
+            steps.append(self._stadium_step())
+        if 'reference_results' in spec:
+            steps.append(self._reference_step())
+        
+        return steps
+    
+    def _blank_step(self):
+        def step(game, issues, context):
+            for key, value in game.items():
+                if value == '':
+                    game[key] = None
+        return step
+    
+    def _required_step(self, keys):
+        def step(game, issues, context):
+            for key in keys:
+                if key not in game or not game[key]:
+                    issues.append(f"필수 필드 누락: {key}")
+                    return False
+        return step
+    
+    def _team_step(self):
+        home_key, away_key = self.fields['home_team'], self.fields['away_team']
+        normalize = self.normalize_team
+        is_known = self.is_known_team
+        
+        def step(game, issues, context):
+            home_team = normalize(game[home_key])
+            away_team = normalize(game[away_key])
+            context['home_team'], context['away_team'] = home_team, away_team
+            
+            if not is_known(home_team):
+                issues.append(f"유효하지 않은 홈팀: {game[home_key]}")
+            else:
+                game[home_key] = home_team
+            
+            if not is_known(away_team):
+                issues.append(f"유효하지 않은 원정팀: {game[away_key]}")
+            else:
+                game[away_key] = away_team
+            
+            if home_team == away_team:
+                issues.append(f"같은 팀끼리 경기 불가: {home_team}")
+        return step
+    
+    def _date_step(self):
+        if self.schema == 'camel':
+            date_key, time_key = self.fields['date'], self.fields['time']
+            
+            def step(game, issues, context):
+                try:
+                    datetime.strptime(game[date_key], '%Y-%m-%d')
+                except ValueError:
+                    issues.append(f"잘못된 날짜 형식: {game[date_key]}")
+                context['time'] = game.get(time_key)
+            return step
+        
+        start_key = self.fields['start_time']
+        
+        def step(game, issues, context):
+            try:
+                datetime.fromisoformat(game[start_key])
+            except (ValueError, TypeError):
+                issues.append(f"잘못된 시작 시간 형식: {game[start_key]}")
+            context['time'] = str(game[start_key])[11:16]
+        return step
+    
+    def _score_step(self):
+        home_key, away_key = self.fields['home_score'], self.fields['away_score']
+        result_key = self.fields['result']
+        status_key = self.fields.get('status')
+        closed_key = self.fields.get('is_closed')
+        low, high = self.spec['score_range']
+        labels = self.spec['result_labels']
+        final_status = self.spec.get('final_status')
+        final_sets = self.spec.get('final_sets')
+        reject_time_as_score = self.spec.get('reject_time_as_score', False)
+        
+        def step(game, issues, context):
+            home_score = game.get(home_key)
+            away_score = game.get(away_key)
+            
+            if home_score is None or away_score is None:
+                return
+            
+            try:
+                home_score = int(home_score)
+                away_score = int(away_score)
+            except (ValueError, TypeError):
+                issues.append(f"잘못된 점수 형식: home={home_score}, away={away_score}")
+                game[home_key] = None
+                game[away_key] = None
+                return
+            
+            if home_score < low or home_score > high:
+                issues.append(f"비정상적인 홈팀 점수: {home_score}")
+                home_score = None
+            
+            if away_score < low or away_score > high:
+                issues.append(f"비정상적인 원정팀 점수: {away_score}")
+                away_score = None
+            
+            # 경기 시간이 점수로 잘못 파싱된 경우 (18:30 -> 18:30)
+            if reject_time_as_score and home_score is not None and away_score is not None:
+                time_match = _TIME_PARTS.match(context['time']) if isinstance(context.get('time'), str) else None
+                if time_match and (home_score, away_score) == (int(time_match.group(1)), int(time_match.group(2))):
+                    issues.append(f"시간이 점수로 잘못 저장됨: {context['time']}")
+                    home_score = None
+                    away_score = None
+            
+            game[home_key] = home_score
+            game[away_key] = away_score
+            
+            if home_score is None or away_score is None:
+                return
+            
+            is_closed = ((status_key and game.get(status_key) == final_status) or
+                         (closed_key and _BOOL_VALUES.get(game.get(closed_key))))
+            if not is_closed:
+                # 진행 중/예정 경기의 점수는 결과가 아님
+                game[result_key] = None
+                return
+            
+            # 결과 재계산 (종료된 경기만)
+            if home_score > away_score:
+                game[result_key] = labels['home']
+            elif home_score < away_score:
+                game[result_key] = labels['away']
+            else:
+                game[result_key] = labels['draw']
+            
+            # 종료된 경기는 승리팀 세트 수가 정해져 있음 (배구)
+            if final_sets and max(home_score, away_score) != final_sets:
+                issues.append(f"종료 경기 세트 스코어 이상: {home_score}:{away_score}")
+        return step
+    
+    def _result_step(self):
+        result_key = self.fields['result']
+        valid_results = set(self.spec['result_labels'].values()) | {None}
+        
+        def step(game, issues, context):
+            result = game.get(result_key)
+            if result not in valid_results:
+                issues.append(f"유효하지 않은 결과: {result}")
+                game[result_key] = None
+        return step
+    
+    def _status_step(self):
+        status_key = self.fields['status']
+        valid_statuses = frozenset(self.spec['statuses'])
+        default_status = self.spec['default_status']
+        
+        def step(game, issues, context):
+            status = game.get(status_key, default_status)
+            if status not in valid_statuses:
+                issues.append(f"유효하지 않은 상태: {status}")
+                game[status_key] = default_status
+        return step
+    
+    def _closed_step(self):
+        closed_key = self.fields['is_closed']
+        
+        def step(game, issues, context):
+            is_closed = game.get(closed_key, False)
+            if is_closed not in _BOOL_VALUES:
+                issues.append(f"유효하지 않은 종료 여부: {is_closed}")
+                game[closed_key] = False
+        return step
+    
+    def _time_step(self):
+        time_key = self.fields['time']
+        time_pattern = re.compile(self.spec['time_pattern'])
+        default_time = self.spec['default_time']
+        
+        def step(game, issues, context):
+            time_str = game.get(time_key, default_time)
+            if not isinstance(time_str, str) or not time_pattern.match(time_str):
+                issues.append(f"잘못된 시간 형식: {time_str}")
+                game[time_key] = default_time
+        return step
+    
+    def _stadium_step(self):
+        stadium_key = self.fields['stadium']
+        stadiums = dict(self.spec['stadiums'])
+        stadium_index = get_stadium_index(self.sport)
+        
+        def step(game, issues, context):
+            home_team = context['home_team']
+            if home_team in stadiums:
+                game[stadium_key] = stadiums[home_team]
+            elif isinstance(game.get(stadium_key), str):
+                # 홈 구장을 모르는 팀이면 입력된 구장명만 대표 이름으로 (잠실 → 서울 잠실야구장)
+                game[stadium_key] = stadium_index.normalize(game[stadium_key])
+        return step
+    
+    def _reference_step(self):
+        date_key = self.fields['date']
+        home_key, away_key = self.fields['home_score'], self.fields['away_score']
+        result_key = self.fields['result']
+        labels = self.spec['result_labels']
+        flipped = {labels['home']: labels['away'], labels['away']: labels['home']}
+        reference_results = self.spec['reference_results']
+        
+        def step(game, issues, context):
+            references = reference_results.get(game[date_key])
+            if not references:
+                return
+            
+            match_key = (context['home_team'], context['away_team'])
+            reverse_key = (context['away_team'], context['home_team'])
+            
+            if match_key in references:
+                game.update(references[match_key])
+                issues.append(f"{REFERENCE_ISSUE_PREFIX} 교체됨")
+            elif reverse_key in references:
+                ref = references[reverse_key]
+                game.update({
+                    home_key: ref[away_key],
+                    away_key: ref[home_key],
+                    result_key: flipped.get(ref[result_key], labels['draw'])
+                })
+                issues.append(f"{REFERENCE_ISSUE_PREFIX} 교체됨 (홈/원정 뒤바뀜)")
+        return step
+
+@lru_cache(maxsize=None)
+def get_rule_set(sport: str, schema: Optional[str] = None) -> CompiledRuleSet:
+    """컴파일된 규칙 세트 반환 (프로세스당 한 번만 컴파일)"""
+    return CompiledRuleSet(sport, schema)
+
+def validate_record(sport: str, record: Dict[str, Any], schema: Optional[str] = None) -> Dict[str, Any]:
+    """스포츠 규칙 세트로 단일 레코드 검증"""
+    return get_rule_set(sport, schema).validate(record)
@@ -2,25 +2,14 @@
 # -*- coding: utf-8 -*-
 
 import os
-import csv
 import json
 from datetime import datetime
-from supabase import create_client, Client
-from dotenv import load_dotenv
 
-# 환경 변수 로드
-load_dotenv('../.env.local')
-
-# Supabase 클라이언트 초기화 (서비스 키 사용)
-url: str = os.environ.get("NEXT_PUBLIC_SUPABASE_URL")
-service_key: str = os.environ.get("SUPABASE_SERVICE_ROLE_KEY")
-anon_key: str = os.environ.get("NEXT_PUBLIC_SUPABASE_ANON_KEY")
-
-# 서비스 키가 있으면 사용, 없으면 anon 키 사용
-key = service_key if service_key else anon_key
-supabase: Client = create_client(url, key)
-
-print(f"🔐 Supabase 연결: {'서비스 키' if service_key else 'Anon 키'} 사용")
+from csv_ingest import ingest_csv, insert_chunk
+from profiling import profiled
+from supabase_client import get_supabase, require_supabase, traced_supabase
+from team_aliases import team_group
+from validation_rules import get_rule_set
 
 def import_volleyball_games_from_csv(csv_file_path):
     """CSV 파일에서 배구 경기 데이터를 읽어서 Supabase에 삽입"""
@@ -33,32 +22,14 @@ def import_volleyball_games_from_csv(csv_file_path):
         print(f"❌ 파일을 찾을 수 없습니다: {csv_file_path}")
         return False
     
-    success_count = 0
-    error_count = 0
+    rules = get_rule_set('volleyball')
     
     try:
-        with open(csv_file_path, 'r', encoding='utf-8') as csvfile:
-            reader = csv.DictReader(csvfile)
-            
-            for row_num, row in enumerate(reader, 1):
-                try:
-                    # 데이터 전처리
-                    game_data = prepare_volleyball_game_data(row)
-                    
-                    # Supabase에 삽입
-                    result = supabase.table('volleyball_games').insert(game_data).execute()
-                    
-                    if result.data:
-                        print(f"✅ 경기 {row_num}: {row['away_team']} vs {row['home_team']} 업로드 완료")
-                        success_count += 1
-                    else:
-                        print(f"❌ 경기 {row_num}: 업로드 실패 - 응답 데이터 없음")
-                        error_count += 1
-                        
-                except Exception as e:
-                    print(f"❌ 경기 {row_num}: {row.get('away_team', 'Unknown')} vs {row.get('home_team', 'Unknown')} - {str(e)}")
-                    error_count += 1
-                    continue
+        # 읽는 동안 이전 묶음을 한 번의 insert로 업로드 (실패한 묶음만 행 단위로 재시도)
+        result = ingest_csv(csv_file_path, lambda row_num, row: validate_and_prepare(row_num, row, rules),
+                            lambda chunk: insert_chunk(get_supabase(service_role=True), 'volleyball_games', chunk, sport='volleyball'))
+        success_count = result['written'].get('success', 0)
+        error_count = result['written'].get('error', 0) + result['rejected']
         
         print("\n" + "=" * 60)
         print(f"🎉 배구 데이터 업로드 완료!")
@@ -71,6 +42,14 @@ def import_volleyball_games_from_csv(csv_file_path):
         print(f"❌ CSV 파일 읽기 오류: {e}")
         return False
 
+def validate_and_prepare(row_num, row, rules):
+    """CSV 행 검증 후 삽입용 데이터로 변환 (검증 실패 시 None)"""
+    validation = rules.validate(row)
+    if not validation['valid']:
+        print(f"⚠️ 경기 {row_num}: 검증 실패로 제외 - {', '.join(validation['issues'])}")
+        return None
+    return prepare_volleyball_game_data(validation['game'])
+
 def prepare_volleyball_game_data(row):
     """CSV 행 데이터를 Supabase 삽입용 데이터로 변환"""
     
@@ -78,13 +57,13 @@ def prepare_volleyball_game_data(row):
     home_score = None
     away_score = None
     
-    if row['home_score'] and row['home_score'].strip():
+    if row['home_score'] is not None and str(row['home_score']).strip():
         try:
             home_score = int(row['home_score'])
         except ValueError:
             pass
     
-    if row['away_score'] and row['away_score'].strip():
+    if row['away_score'] is not None and str(row['away_score']).strip():
         try:
             away_score = int(row['away_score'])
         except ValueError:
@@ -92,15 +71,12 @@ def prepare_volleyball_game_data(row):
     
     # is_closed 처리
     is_closed = False
-    if row['is_closed'].lower() in ['true', '1', 'yes']:
+    if str(row['is_closed']).lower() in ['true', '1', 'yes']:
         is_closed = True
     
     # 리그 정보 추출 (팀명으로 구분)
     team_names = [row['home_team'].strip(), row['away_team'].strip()]
     
-    # V-리그 여자부 팀들
-    womens_teams = ['현대건설', '흥국생명', 'GS칼텍스', '페퍼저축은행', '한국도로공사', '정관장']
-    
     # 대학팀 확인
     university_keywords = ['대학', '대']
     is_university = any(keyword in team for team in team_names for keyword in university_keywords)
@@ -109,7 +85,7 @@ def prepare_volleyball_game_data(row):
         league_name = "대학 배구"
         league_type = "university"
         round_info = "대학 리그"
-    elif any(team in womens_teams for team in team_names):
+    elif any(team_group('volleyball', team) == 'women' for team in team_names):
         league_name = "V-리그 여자부"
         league_type = "women"
         round_info = "V-리그 정규시즌"
@@ -151,11 +127,11 @@ def update_team_ids():
     
     try:
         # 홈팀 ID 업데이트
-        home_result = supabase.rpc('update_volleyball_home_team_ids').execute()
+        home_result = traced_supabase('volleyball', service_role=True).rpc('update_volleyball_home_team_ids').execute()
         print("✅ 홈팀 ID 업데이트 완료")
         
         # 원정팀 ID 업데이트
-        away_result = supabase.rpc('update_volleyball_away_team_ids').execute()
+        away_result = traced_supabase('volleyball', service_role=True).rpc('update_volleyball_away_team_ids').execute()
         print("✅ 원정팀 ID 업데이트 완료")
         
     except Exception as e:
@@ -168,14 +144,14 @@ def verify_upload():
     
     try:
         # 전체 배구 경기 수 확인
-        result = supabase.table('volleyball_games').select('*', count='exact').execute()
+        result = traced_supabase('volleyball', service_role=True).table('volleyball_games').select('*', count='exact').execute()
         total_games = len(result.data) if result.data else 0
         
         print(f"📈 총 배구 경기 수: {total_games}개")
         
         if total_games > 0:
             # 최근 경기 5개 표시
-            recent_games = supabase.table('volleyball_games').select('*').order('created_at', desc=True).limit(5).execute()
+            recent_games = traced_supabase('volleyball', service_role=True).table('volleyball_games').select('*').order('created_at', desc=True).limit(5).execute()
             
             print("\n📋 최근 업로드된 경기:")
             print("-" * 50)
@@ -196,6 +172,7 @@ def verify_upload():
         print(f"❌ 데이터 검증 중 오류: {e}")
         return False
 
+@profiled
 def main():
     """메인 실행 함수"""
     
@@ -223,4 +200,5 @@ def main():
     print("👀 Supabase 대시보드에서 volleyball_games 테이블을 확인해보세요!")
 
 if __name__ == "__main__":
+    require_supabase(service_role=True)
     main()